@@ -0,0 +1,96 @@
+# %% [markdown]
+# # Generating Long Time Series Fast
+
+# %% [markdown]
+# Steppers are iterators that compute one step per call.
+# This is convenient for small datasets but the overhead of each call adds up
+# if we need millions of steps.
+# In this tutorial we compare a few options to speed things up.
+
+
+# %%
+import timeit
+
+import numpy as np
+
+from eerily.generators.utils.noises import MultiGaussianNoise
+from eerily.generators.var import VAR1ModelParams, VAR1Stepper
+
+seed = 42
+length = 100_000
+
+
+def var_stepper(**kwargs):
+    return VAR1Stepper(
+        model_params=VAR1ModelParams(
+            delta_t=0.1,
+            phi0=np.array([0.1, 0.1]),
+            phi1=np.array([[0.5, -0.25], [-0.35, 0.65]]),
+            epsilon=MultiGaussianNoise(
+                mu=np.zeros(2), cov=np.array([[1, 0.5], [0.5, 1]]), seed=seed
+            ),
+            initial_state=np.array([1, 0]),
+            variable_names=["s1", "s2"],
+        ),
+        length=length,
+        **kwargs,
+    )
+
+
+# %% [markdown]
+# ## Copying the Output
+#
+# By default, each step returns a deep copy of the state of the stepper.
+# With `copy_output=False`, the stepper returns read-only views instead.
+
+# %%
+for copy_output in [True, False]:
+    stepper = var_stepper(copy_output=copy_output)
+    seconds = timeit.timeit(lambda: next(stepper), number=length)
+    print(f"copy_output={copy_output}: {seconds / length * 1e6:.2f} µs per step")
+
+# %% [markdown]
+# The values are the same but they can not be modified by the consumer.
+
+# %%
+stepper = var_stepper(copy_output=False)
+step = next(stepper)
+step.flags.writeable
+
+# %% [markdown]
+# ## Many Steps at Once
+#
+# `take` computes many steps in one call and draws the noises in batches.
+
+# %%
+stepper = var_stepper()
+seconds = timeit.timeit(lambda: stepper.take(length), number=1)
+print(f"take: {seconds / length * 1e6:.2f} µs per step")
+
+# %% [markdown]
+# Merged steppers can be collected into one array per variable,
+# or into a dataframe, without creating a dictionary for each step.
+
+# %%
+from eerily.generators.naive import SequenceStepper, SequenceStepperParams
+
+sequence_stepper = SequenceStepper(
+    model_params=SequenceStepperParams(
+        initial_state=[0], variable_names=["t"], step_sizes=[1]
+    ),
+    length=length,
+)
+
+(var_stepper() & sequence_stepper).to_frame().head()
+
+# %% [markdown]
+# ## No Burn-in
+#
+# Series that should not depend on the initial state are usually generated
+# with some burn-in steps that are discarded.
+# AR(1) and VAR(1) steppers can draw the initial state from the stationary
+# distribution of the model instead, so every step can be used.
+
+# %%
+stepper = var_stepper(stationary=True, seed=seed, n_paths=10_000)
+stepper.current_state.mean(axis=0)
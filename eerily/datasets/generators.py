@@ -1,9 +1,55 @@
+from typing import List, Optional, Sequence, Tuple, Union
+
 import torch
 from torch.utils.data import Dataset
 
+from eerily.generators.utils.cache import DiskCache
+
 
 class SinTimeSeriesDataset(Dataset):
-    def __init__(self, sequence_length, input_length, prediction_length, nodes) -> None:
+    """Sine time series of several nodes, served as sliding windows.
+
+    The series of all the nodes are built in one broadcasted operation and
+    the windows are strided views of the series, so no window is copied
+    until it is batched.
+    Indexing with a sequence of indices returns a whole batch at once,
+
+    ```python
+    dataset = SinTimeSeriesDataset(100, 5, 1, 3)
+    inputs, targets = dataset[[0, 1, 2]]
+    ```
+
+    which can be used with `DataLoader` without collating single samples,
+
+    ```python
+    DataLoader(
+        dataset,
+        sampler=BatchSampler(RandomSampler(dataset), batch_size=32, drop_last=False),
+        batch_size=None,
+    )
+    ```
+
+    With a regular `DataLoader`, `__getitems__` gathers the windows of a batch
+    with one indexing operation.
+
+    With a [`DiskCache`][eerily.generators.utils.cache.DiskCache],
+    the series are memory-mapped from the cache instead of being computed.
+
+    :param sequence_length: length of the series
+    :param input_length: length of the input windows
+    :param prediction_length: length of the target windows
+    :param nodes: number of series
+    :param cache: the cache of the series
+    """
+
+    def __init__(
+        self,
+        sequence_length,
+        input_length,
+        prediction_length,
+        nodes,
+        cache: Optional[DiskCache] = None,
+    ) -> None:
         super().__init__()
 
         self.sequence_length = sequence_length
@@ -12,39 +58,59 @@ class SinTimeSeriesDataset(Dataset):
 
         assert self.sequence_length > self.prediction_length
         self.nodes = nodes
+        self.cache = cache
 
         self._gen_data()
 
+    def _sin(self) -> torch.Tensor:
+        return torch.sin(
+            torch.arange(self.nodes, dtype=torch.float32)[:, None]
+            + torch.arange(self.sequence_length + 1, dtype=torch.float32)[None, :]
+        )
+
     def _gen_data(self):
-        series = []
-        for i in range(self.nodes):
-            series.append(
-                torch.sin(
-                    torch.linspace(
-                        i, self.sequence_length + i, self.sequence_length + 1
-                    )
+        if self.cache is None:
+            self.data = self._sin()
+        else:
+            self.data = torch.from_numpy(
+                self.cache.get_or_create(
+                    f"SinTimeSeriesDataset-{self.sequence_length}-{self.nodes}",
+                    lambda: self._sin().numpy(),
+                    mmap_mode="c",
                 )
             )
+        self._windows = self.data.unfold(
+            1, self.input_length + self.prediction_length, 1
+        )
 
-        self.data = torch.stack(series)
-
-    def _slice(self, index):
+    def _split(self, windows: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
         return (
-            self.data[:, index : index + self.input_length],
-            self.data[
-                :,
-                index
-                + self.input_length : index
-                + self.input_length
-                + self.prediction_length,
-            ],
+            windows[..., : self.input_length],
+            windows[..., self.input_length :],
         )
 
     def __len__(self):
-        return self.sequence_length - self.input_length
+        return min(self.sequence_length - self.input_length, self._windows.shape[1])
+
+    def __getitem__(
+        self, index: Union[int, Sequence[int], torch.Tensor]
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Returns the input and target windows.
+
+        :param index: the index of a window, or a sequence of indices
+            for a batch of windows of shape `(batch, nodes, length)`.
+        """
+        index = torch.as_tensor(index, dtype=torch.long)
+        if index.ndim == 0:
+            return self._split(self._windows[:, int(index)])
+
+        return self._split(self._windows[:, index].transpose(0, 1))
 
-    def __getitem__(self, index):
-        return self._slice(index)
+    def __getitems__(
+        self, indices: Sequence[int]
+    ) -> List[Tuple[torch.Tensor, torch.Tensor]]:
+        inputs, targets = self[indices]
+        return list(zip(inputs.unbind(0), targets.unbind(0)))
 
 
 if __name__ == "__main__":
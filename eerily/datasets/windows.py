@@ -0,0 +1,268 @@
+import itertools
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import torch
+from torch.utils.data import Dataset, IterableDataset, get_worker_info
+
+from eerily.generators.utils.factory import Factory
+from eerily.generators.utils.stepper import (
+    BaseStepper,
+    MergedStepper,
+    SequentialStepper,
+)
+
+
+class WindowDataset(Dataset):
+    """Sliding windows over the output of a stepper.
+
+    The steps are generated once into a contiguous tensor of shape
+    `(length, number of variables)`, and each sample is a pair of
+    input and target windows of shapes `(input_length, number of variables)`
+    and `(prediction_length, number of variables)`.
+    The windows are strided views of the tensor.
+
+    ```python
+    dataset = WindowDataset(
+        var_stepper & sequence_stepper,
+        input_length=24,
+        prediction_length=6,
+        length=10_000,
+    )
+    DataLoader(dataset, batch_size=32, shuffle=True)
+    ```
+
+    The data can also be the columns of
+    [`MergedStepper.to_columns`][eerily.generators.utils.stepper.MergedStepper.to_columns]
+    or an array of shape `(length, number of variables)`.
+    As in [`SinTimeSeriesDataset`][eerily.datasets.generators.SinTimeSeriesDataset],
+    indexing with a sequence of indices returns a batch of windows at once.
+
+    :param data: a stepper, a dictionary of columns, or an array
+    :param input_length: length of the input windows
+    :param prediction_length: length of the target windows
+    :param stride: number of steps between the starts of two windows
+    :param length: number of steps to generate from a stepper,
+        defaults to the length of the stepper
+    :param dtype: dtype of the tensor
+    """
+
+    def __init__(
+        self,
+        data: Union[BaseStepper, MergedStepper, Dict[Any, np.ndarray], np.ndarray],
+        input_length: int,
+        prediction_length: int,
+        stride: int = 1,
+        length: Optional[int] = None,
+        dtype: torch.dtype = torch.float32,
+    ) -> None:
+        super().__init__()
+        if input_length < 1 or prediction_length < 0 or stride < 1:
+            raise ValueError(
+                "input_length and stride should be positive and "
+                "prediction_length should not be negative, got "
+                f"{input_length}, {prediction_length}, {stride}"
+            )
+
+        self.input_length = input_length
+        self.prediction_length = prediction_length
+        self.stride = stride
+
+        if isinstance(data, (BaseStepper, SequentialStepper, MergedStepper)):
+            # the steps are written into one buffer of the dtype of the tensor
+            factory = Factory(
+                format="numpy", dtype=torch.empty((), dtype=dtype).numpy().dtype
+            )
+            n_steps, chunks = factory._chunks(data, length)
+            first = next(chunks, {})
+            self.variable_names: List[Any] = list(first)
+            data = factory._history(n_steps, itertools.chain([first], chunks))
+        elif isinstance(data, dict):
+            self.variable_names = list(data.keys())
+            data = np.column_stack([np.asarray(v) for v in data.values()])
+        else:
+            data = np.asarray(data)
+            if data.ndim == 1:
+                data = data[:, np.newaxis]
+            self.variable_names = list(range(data.shape[1]))
+
+        if data.ndim != 2 or data.shape[1] != len(self.variable_names):
+            raise ValueError(
+                f"The data of shape {data.shape} are not one series of the variables "
+                f"{self.variable_names}, use StreamingWindowDataset for ensembles"
+            )
+        self.data = torch.as_tensor(data, dtype=dtype).contiguous()
+
+        window_length = input_length + prediction_length
+        if len(self.data) < window_length:
+            raise ValueError(
+                f"The data has {len(self.data)} steps "
+                f"but a window needs {window_length}"
+            )
+        self._windows = self.data.unfold(0, window_length, stride).transpose(1, 2)
+
+    def _split(self, windows: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        return (
+            windows[..., : self.input_length, :],
+            windows[..., self.input_length :, :],
+        )
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def __getitem__(
+        self, index: Union[int, Sequence[int], torch.Tensor]
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Returns the input and target windows.
+
+        :param index: the index of a window, or a sequence of indices
+            for a batch of windows.
+        """
+        index = torch.as_tensor(index, dtype=torch.long)
+        if index.ndim == 0:
+            return self._split(self._windows[int(index)])
+
+        return self._split(self._windows[index])
+
+    def __getitems__(
+        self, indices: Sequence[int]
+    ) -> List[Tuple[torch.Tensor, torch.Tensor]]:
+        inputs, targets = self[indices]
+        return list(zip(inputs.unbind(0), targets.unbind(0)))
+
+
+class StreamingWindowDataset(IterableDataset):
+    """Windows of series that are generated on the fly.
+
+    The dataset generates series from a recipe, e.g., a
+    [`StepperSpec`][eerily.generators.spec.StepperSpec],
+    and yields the windows of each series as soon as the series is generated.
+    The series are numbered and the series `i` is generated with the seed
+    `SeedSequence(seed).spawn(...)[i]`, the same seeds as
+    [`ParallelFactory`][eerily.generators.utils.parallel.ParallelFactory].
+    Each `DataLoader` worker generates its own shard of the series,
+    `worker_id, worker_id + num_workers, ...`,
+    so the workers never yield the same windows and
+    the windows do not depend on the number of workers.
+
+    ```python
+    dataset = StreamingWindowDataset(
+        spec, input_length=24, prediction_length=6, series_length=1000, seed=42
+    )
+    DataLoader(dataset, batch_size=None, num_workers=8)
+    ```
+
+    Steppers with `n_paths` generate `n_paths` series in one batch,
+    each path being a series.
+    With `batch_size`, the windows are yielded as batches of shape
+    `(batch_size, length, number of variables)`, which should be used with
+    `DataLoader(dataset, batch_size=None)`.
+
+    :param recipe: a picklable function that takes a seed and returns
+        a stepper, e.g., a `StepperSpec`.
+    :param input_length: length of the input windows
+    :param prediction_length: length of the target windows
+    :param series_length: number of steps of each series
+    :param stride: number of steps between the starts of two windows
+    :param n_series: number of series to generate, i.e., the number of
+        calls of the recipe, `None` for an endless stream.
+    :param seed: the root seed that the seeds of the series are spawned from
+    :param batch_size: number of windows in each batch, `None` to yield
+        single windows.
+    :param dtype: dtype of the tensors
+    """
+
+    def __init__(
+        self,
+        recipe: Callable[[np.random.SeedSequence], Any],
+        input_length: int,
+        prediction_length: int,
+        series_length: int,
+        stride: int = 1,
+        n_series: Optional[int] = None,
+        seed: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        dtype: torch.dtype = torch.float32,
+    ) -> None:
+        super().__init__()
+        if series_length < input_length + prediction_length:
+            raise ValueError(
+                f"series_length {series_length} is shorter than a window, "
+                f"{input_length + prediction_length}"
+            )
+        self.recipe = recipe
+        self.input_length = input_length
+        self.prediction_length = prediction_length
+        self.series_length = series_length
+        self.stride = stride
+        self.n_series = n_series
+        self.batch_size = batch_size
+        self.dtype = dtype
+        # the entropy is fixed here so that all the workers share it
+        self.seed_sequence = np.random.SeedSequence(seed)
+
+    def _series_ids(self) -> Iterator[int]:
+        worker_info = get_worker_info()
+        worker_id, num_workers = (
+            (0, 1) if worker_info is None else (worker_info.id, worker_info.num_workers)
+        )
+        ids = itertools.count(worker_id, num_workers)
+        if self.n_series is None:
+            return ids
+
+        return itertools.takewhile(lambda i: i < self.n_series, ids)
+
+    def _generate(self, series_id: int) -> torch.Tensor:
+        """Generates the series with the given id as a tensor of shape
+        `(number of series, series_length, number of variables)`."""
+        seed = np.random.SeedSequence(
+            self.seed_sequence.entropy, spawn_key=(series_id,)
+        )
+        stepper = self.recipe(seed)
+
+        if getattr(stepper, "n_paths", None) is None:
+            series = Factory(format="numpy")(stepper, length=self.series_length)[
+                np.newaxis
+            ]
+        else:
+            steps = np.asarray(stepper.take(self.series_length))
+            series = steps.reshape(steps.shape[:2] + (-1,)).swapaxes(0, 1)
+
+        return torch.as_tensor(series, dtype=self.dtype)
+
+    def _windows(self) -> Iterator[torch.Tensor]:
+        window_length = self.input_length + self.prediction_length
+        for series_id in self._series_ids():
+            series = self._generate(series_id)
+            windows = series.unfold(1, window_length, self.stride).transpose(2, 3)
+            yield windows.reshape((-1,) + windows.shape[2:])
+
+    def _split(self, windows: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        return (
+            windows[..., : self.input_length, :],
+            windows[..., self.input_length :, :],
+        )
+
+    def __iter__(self) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+        if self.batch_size is None:
+            for windows in self._windows():
+                yield from zip(*self._split(windows))
+            return
+
+        pending: List[torch.Tensor] = []
+        n_pending = 0
+        for windows in self._windows():
+            pending.append(windows)
+            n_pending += len(windows)
+            if n_pending < self.batch_size:
+                continue
+
+            windows = torch.cat(pending)
+            n_full = len(windows) // self.batch_size * self.batch_size
+            for batch in windows[:n_full].split(self.batch_size):
+                yield self._split(batch)
+            pending = [windows[n_full:]]
+            n_pending = len(windows) - n_full
+
+        if n_pending:
+            yield self._split(torch.cat(pending))
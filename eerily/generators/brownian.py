@@ -1,7 +1,11 @@
-import copy
 from dataclasses import dataclass
-from typing import Dict, Iterator
+from typing import Dict, Iterator, Literal, Optional, Tuple
 
+import numpy as np
+
+from eerily.generators.utils.base import draw_batch
+from eerily.generators.utils.filters import ar_filter
+from eerily.generators.utils.noises import noise_moments
 from eerily.generators.utils.stepper import BaseStepper, StepperParams
 
 
@@ -14,13 +18,28 @@ class BrownianMotionParams(StepperParams):
     :param delta_t: the minimum time step $\Delta t$.
     :param force_densities: the stochastic force densities, e.g.
         [`GaussianNoise`][eerily.generators.utils.noise.GaussianNoise].
-    :param initial_state: the initial velocity $v(0)$.
+        Each component of the velocity gets its own scalar force density,
+        or a source of vectors, e.g.,
+        [`MultiGaussianNoise`][eerily.generators.utils.noises.MultiGaussianNoise],
+        gives all the components at once.
+    :param initial_state: the initial velocity $v(0)$,
+        e.g., `np.array([0, 0, 0])` for a velocity in three dimensions.
     :param variable_names: variable names of the given initial condition
+    :param method: `"euler"` for the Euler method or `"exact"` for
+        the exact discretization of the Ornstein-Uhlenbeck process.
     """
 
     gamma: float
     delta_t: float
     force_densities: Iterator
+    method: Literal["euler", "exact"] = "euler"
+
+    _sources = ("force_densities",)
+
+    def __post_init__(self):
+        super().__post_init__()
+        if self.method not in ("euler", "exact"):
+            raise ValueError(f"Unknown method: {self.method}")
 
 
 class BrownianMotionStepper(BaseStepper):
@@ -42,6 +61,30 @@ class BrownianMotionStepper(BaseStepper):
 
         $$\Delta v (t+1) = R(t) \Delta t - \gamma v(t) \Delta t$$
 
+        In the Euler method, `take` also computes all the steps at once as a
+        linear filter with the coefficient $1 - \gamma \Delta t$.
+
+    ??? note "Exact Discretization"
+
+        The Euler method is only accurate if $\gamma \Delta t \ll 1$.
+        For Gaussian force densities, the motion is an Ornstein-Uhlenbeck
+        process which can be integrated over a time step exactly,
+
+        $$v(t+1) = e^{-\gamma \Delta t} v(t) + a \mu + b (R(t) - \mu),$$
+
+        where $\mu$ is the mean of the force densities,
+        $a = (1 - e^{-\gamma\Delta t})/\gamma$, and
+        $b = \sqrt{\Delta t (1 - e^{-2\gamma\Delta t})/(2\gamma)}$.
+        The force density $R(t)$ is the force averaged over the time step,
+        as in the Euler method, and both methods agree for small $\gamma \Delta t$.
+        Use `method="exact"` in the parameters to take large time steps
+        without bias.
+        The mean of the force densities is read from the noise, see
+        [`noise_moments`][eerily.generators.utils.noises.noise_moments].
+
+        In the exact method, `take` computes all the steps at once as a
+        linear filter, see [`ar_filter`][eerily.generators.utils.filters.ar_filter].
+
 
     !!! example "Example Code"
 
@@ -63,15 +106,102 @@ class BrownianMotionStepper(BaseStepper):
         e.g., [`BrownianMotionParams`][eerily.generators.brownian.BrownianMotionParams]
     """
 
-    def compute_step(self) -> Dict[str, float]:
-        force_density = next(self.model_params.force_densities)  # type: ignore
+    _supports_n_paths = True
+    _force_item_size: Optional[int] = None
 
-        v_next = (
-            self.current_state
-            + force_density * self.model_params.delta_t  # type: ignore
-            - self.model_params.gamma * self.current_state * self.model_params.delta_t  # type: ignore
-        )
+    def compute_step(self) -> Dict[str, float]:
+        force_density = self._draw_forces()
+
+        if self.model_params.method == "exact":  # type: ignore
+            decay, mean, scale = self._exact_coefficients()
+            v_next = decay * self.current_state + mean + scale * force_density
+        else:
+            # the same order of operations as the filter in compute_steps
+            v_next = (
+                force_density * self.model_params.delta_t  # type: ignore
+                + self._euler_decay() * self.current_state
+            )
 
         self.current_state = v_next
 
-        return copy.deepcopy(self.current_state)
+        return self._output(self.current_state)
+
+    def compute_steps(self, n: int) -> np.ndarray:
+        force_densities = self._draw_forces(n)
+
+        if self.model_params.method == "exact":  # type: ignore
+            decay, mean, scale = self._exact_coefficients()
+            steps, history = ar_filter(
+                mean + scale * force_densities,
+                [decay],
+                np.asarray(self.current_state, dtype=float)[np.newaxis, ...],
+            )
+            self.current_state = history[0]
+            return steps
+
+        steps, history = ar_filter(
+            force_densities * self.model_params.delta_t,  # type: ignore
+            [self._euler_decay()],
+            np.asarray(self.current_state, dtype=float)[np.newaxis, ...],
+        )
+        self.current_state = history[0]
+
+        return steps
+
+    def _euler_decay(self) -> float:
+        r"""The factor $1 - \gamma \Delta t$ of the velocity in an Euler step."""
+        return 1 - self.model_params.gamma * self.model_params.delta_t  # type: ignore
+
+    def _draw_forces(self, n: Optional[int] = None) -> np.ndarray:
+        """Draws the force densities of all the components of the velocity,
+        for all the paths.
+
+        The items of the force densities may be scalars, one for each component,
+        or vectors, e.g., from a
+        [`MultiGaussianNoise`][eerily.generators.utils.noises.MultiGaussianNoise].
+        """
+        shape = np.shape(self.current_state)
+        size = int(np.prod(shape)) * (1 if n is None else n)
+        forces = self._draw_force_items(size)
+
+        return forces.reshape(shape if n is None else (n,) + shape)
+
+    def _draw_force_items(self, size: int) -> np.ndarray:
+        """Draws as many items of the force densities as needed for
+        `size` numbers, learning the size of one item from the first draw."""
+        force_densities = self.model_params.force_densities  # type: ignore
+        if size == 0:
+            return np.empty(0)
+        if self._force_item_size is not None:
+            return draw_batch(force_densities, self._items(size))
+
+        first = draw_batch(force_densities, 1)
+        self._force_item_size = int(np.prod(first.shape[1:]))
+        count = self._items(size)
+        if count == 1:
+            return first
+
+        return np.concatenate([first, draw_batch(force_densities, count - 1)])
+
+    def _items(self, size: int) -> int:
+        if size % self._force_item_size:  # type: ignore
+            raise ValueError(
+                f"Force density items of size {self._force_item_size} "
+                f"can not fill a state of size {size}"
+            )
+        return size // self._force_item_size  # type: ignore
+
+    def _exact_coefficients(self) -> Tuple[float, float, float]:
+        r"""Coefficients of the exact step,
+        $v(t+1) = \text{decay}\, v(t) + \text{mean} + \text{scale}\, R(t)$."""
+        gamma = self.model_params.gamma  # type: ignore
+        delta_t = self.model_params.delta_t  # type: ignore
+        mu, _ = noise_moments(self.model_params.force_densities)  # type: ignore
+
+        if gamma == 0:
+            a = b = delta_t
+        else:
+            a = -np.expm1(-gamma * delta_t) / gamma
+            b = np.sqrt(delta_t * -np.expm1(-2 * gamma * delta_t) / (2 * gamma))
+
+        return np.exp(-gamma * delta_t), (a - b) * mu, b
@@ -1,10 +1,11 @@
-import copy
 from dataclasses import dataclass
-from typing import Dict, Iterator, Optional, Sequence, Union
+from typing import Dict, Iterator, Optional, Sequence, Union, cast
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
+from eerily.generators.utils.base import ArrayIterator, as_source, draw_batch
 from eerily.generators.utils.stepper import BaseStepper, StepperParams
 
 
@@ -18,31 +19,47 @@ class LinearElasticityParams(StepperParams):
 
     lep = LinearElasticityParams(
         initial_state={"log_demand": 3, "log_price": 0.5, "elasticity": None},
-        log_prices=iter(range(length)),
-        elasticity=iter([-3] * length),
+        log_prices=np.arange(length),
+        elasticity=ConstantIterator(-3),
         variable_names=["log_demand", "log_price", "elasticity"],
     )
     ```
 
+    Arrays and [`ConstantIterator`][eerily.generators.utils.base.ConstantIterator]
+    are the fastest sources as `take` slices them instead of calling
+    the iterators in each step.
+
     !!! warning "Initial Condition"
         Initial condition is a dictionary with at least two keys `sale` and `price`.
 
         Note that the initial condition is NOT returned in the iterator.
 
 
-    :param elasticity: an iterator that generates the elasticity to be used for each step
-    :param log_prices: an iterator that generates the log prices in each step
+    :param elasticity: an iterator or an array that generates the elasticity
+        to be used for each step
+    :param log_prices: an iterator or an array that generates the log prices in each step
+    :param log_base_demand: an iterator or an array that generates the
+        log base demand in each step
     """
 
-    elasticity: Iterator
-    log_prices: Iterator
-    log_base_demand: Optional[Iterator] = None
+    elasticity: Union[Iterator, np.ndarray]
+    log_prices: Union[Iterator, np.ndarray]
+    log_base_demand: Optional[Union[Iterator, np.ndarray]] = None
+
+    _sources = ("elasticity", "log_prices", "log_base_demand")
 
     def __post_init__(self):
+        super().__post_init__()
         if self.initial_state is None:
-            self.initial_state = {"log_demand": 1, "log_price": 10, "elasticity": None}
+            object.__setattr__(
+                self,
+                "initial_state",
+                {"log_demand": 1, "log_price": 10, "elasticity": None},
+            )
         if self.variable_names is None:
-            self.variable_names = ["log_demand", "log_price", "elasticity"]
+            object.__setattr__(
+                self, "variable_names", ["log_demand", "log_price", "elasticity"]
+            )
 
 
 class ElasticityStepper(BaseStepper):
@@ -70,8 +87,8 @@ class ElasticityStepper(BaseStepper):
 
     ```python
     length = 10
-    elasticity = iter([-3] * length)
-    log_prices = iter(range(length))
+    elasticity = ConstantIterator(-3)
+    log_prices = np.arange(length)
 
     initial_condition = {"log_demand": 3, "log_price": 0.5, "elasticity": None}
 
@@ -116,7 +133,47 @@ class ElasticityStepper(BaseStepper):
         self.current_state["log_price"] = next_log_price
         self.current_state["elasticity"] = elasticity
 
-        return copy.deepcopy(self.current_state)
+        return self._output(self.current_state)
+
+    def compute_steps(self, n: int) -> Dict[str, np.ndarray]:
+        elasticity = draw_batch(self.model_params.elasticity, n)  # type: ignore
+        log_prices = draw_batch(self.model_params.log_prices, n)  # type: ignore
+
+        if self.model_params.log_base_demand is None:  # type: ignore
+            previous_log_prices = np.concatenate(
+                [[self.current_state["log_price"]], log_prices[:-1]]
+            )
+            log_demand = np.add.accumulate(
+                np.concatenate(
+                    [
+                        [self.current_state["log_demand"]],
+                        elasticity * (log_prices - previous_log_prices),
+                    ]
+                )
+            )[1:]
+            steps = {}
+        else:
+            log_base_demand = draw_batch(
+                self.model_params.log_base_demand, n  # type: ignore
+            )
+            log_demand = log_base_demand + elasticity * log_prices
+            steps = {"log_base_demand": log_base_demand}
+
+        steps.update(
+            {
+                "log_demand": log_demand,
+                "log_price": log_prices,
+                "elasticity": elasticity,
+            }
+        )
+        for key, value in self.current_state.items():
+            if key not in steps:
+                steps[key] = np.array([value] * n)
+
+        if n > 0:
+            self.current_state.update({key: steps[key][-1] for key in steps})
+
+        return {key: steps[key] for key in self.current_state}
 
     def __repr__(self) -> str:
         return (
@@ -124,3 +181,167 @@ class ElasticityStepper(BaseStepper):
             f"parameters: {self.model_params}\n"
             f"current_state: {self.current_state}"
         )
+
+
+@dataclass(frozen=True)
+class PanelElasticityParams(StepperParams):
+    """
+    Parameters for the constant elasticity model of a panel of SKUs.
+
+    The elasticities, log prices, and log base demands are either
+
+    - matrices of shape `(number of SKUs, number of steps)`, or
+    - iterators that generate an array of shape `(number of SKUs,)`
+      or a scalar shared by all SKUs in each step, e.g.,
+      [`ConstantIterator`][eerily.generators.utils.base.ConstantIterator].
+
+    ```python
+    n_skus, length = 100_000, 52
+
+    pep = PanelElasticityParams(
+        initial_state={
+            "log_demand": np.full(n_skus, 3.0),
+            "log_price": np.full(n_skus, 0.5),
+            "elasticity": None,
+        },
+        log_prices=np.log(rng.uniform(1, 2, size=(n_skus, length))),
+        elasticity=rng.normal(-3, 0.5, size=(n_skus, length)),
+        variable_names=["log_demand", "log_price", "elasticity"],
+    )
+    ```
+
+    :param elasticity: the elasticity of each SKU in each step
+    :param log_prices: the log prices of each SKU in each step
+    :param log_base_demand: the log base demand of each SKU in each step
+    :param skus: the labels of the SKUs, defaults to `0, 1, ...`
+    """
+
+    elasticity: Union[np.ndarray, Iterator]
+    log_prices: Union[np.ndarray, Iterator]
+    log_base_demand: Optional[Union[np.ndarray, Iterator]] = None
+    skus: Optional[Sequence] = None
+
+
+class PanelElasticityStepper(BaseStepper):
+    """Generates the next time step for a panel of SKUs.
+
+    This is the panel version of
+    [`ElasticityStepper`][eerily.generators.elasticity.ElasticityStepper]
+    with the same two modes.
+    Each step returns a dictionary of arrays of shape `(number of SKUs,)`
+    and `take(n)` returns a dictionary of arrays of shape
+    `(n, number of SKUs)`, computed with vectorized differences and
+    cumulative sums over the time axis.
+
+    ```python
+    pes = PanelElasticityStepper(model_params=pep, length=52)
+    pes.to_frame()
+    ```
+
+    :param model_params: the parameters, e.g.,
+        [`PanelElasticityParams`][eerily.generators.elasticity.PanelElasticityParams]
+    """
+
+    model_params: PanelElasticityParams
+
+    def __init__(
+        self,
+        model_params: PanelElasticityParams,
+        length: Optional[int] = None,
+        copy_output: bool = True,
+        n_paths: Optional[int] = None,
+    ) -> None:
+        super().__init__(
+            model_params, length=length, copy_output=copy_output, n_paths=n_paths
+        )
+        self.n_skus = len(self.current_state["log_demand"])
+        self._sources = {
+            "elasticity": self._as_source(model_params.elasticity),
+            "log_prices": self._as_source(model_params.log_prices),
+            "log_base_demand": self._as_source(model_params.log_base_demand),
+        }
+
+    @staticmethod
+    def _as_source(value: Optional[Union[np.ndarray, Iterator]]) -> Optional[Iterator]:
+        if isinstance(value, np.ndarray) and value.ndim == 2:
+            return ArrayIterator(value.T)
+        return as_source(value)
+
+    def _draw(self, name: str, n: int) -> np.ndarray:
+        """Draws `n` steps of a source as an array of shape `(n, number of SKUs)`."""
+        values = np.asarray(draw_batch(self._sources[name], n), dtype=float)
+        if values.ndim == 1:
+            values = values[:, np.newaxis]
+        return np.array(np.broadcast_to(values, (n, self.n_skus)))
+
+    def compute_step(self) -> Dict[str, np.ndarray]:
+        steps = self.compute_steps(1)
+        return self._output({key: value[0] for key, value in steps.items()})
+
+    def compute_steps(self, n: int) -> Dict[str, np.ndarray]:
+        elasticity = self._draw("elasticity", n)
+        log_prices = self._draw("log_prices", n)
+
+        if self._sources["log_base_demand"] is None:
+            previous_log_prices = np.concatenate(
+                [
+                    np.broadcast_to(self.current_state["log_price"], (1, self.n_skus)),
+                    log_prices[:-1],
+                ]
+            )
+            log_demand = self.current_state["log_demand"] + np.cumsum(
+                elasticity * (log_prices - previous_log_prices), axis=0
+            )
+            steps = {}
+        else:
+            log_base_demand = self._draw("log_base_demand", n)
+            log_demand = log_base_demand + elasticity * log_prices
+            steps = {"log_base_demand": log_base_demand}
+
+        steps.update(
+            {
+                "log_demand": log_demand,
+                "log_price": log_prices,
+                "elasticity": elasticity,
+            }
+        )
+        for key, value in self.current_state.items():
+            if key not in steps:
+                steps[key] = np.array(np.broadcast_to(value, (n, self.n_skus)))
+
+        if n > 0:
+            self.current_state.update({key: steps[key][-1].copy() for key in steps})
+
+        return {key: steps[key] for key in self.current_state}
+
+    def to_frame(self, n: Optional[int] = None) -> pd.DataFrame:
+        """Generates the next `n` steps as a long format dataframe with
+        one row per step and SKU.
+
+        The columns are `step`, `sku`, and the variables.
+        The dataframe is built from the arrays of `take`
+        without iterating over the rows.
+
+        :param n: number of steps, defaults to the remaining steps
+        """
+        if n is None:
+            if self.length is None:
+                raise ValueError("Please specify n or the length of the stepper")
+            n = self.length - self._counter
+        first_step = self._counter
+        steps = cast(Dict[str, np.ndarray], self.take(n))
+        n = len(next(iter(steps.values())))
+
+        skus = self.model_params.skus
+        if skus is None:
+            skus = range(self.n_skus)
+
+        columns = {
+            "step": np.repeat(np.arange(first_step, first_step + n), self.n_skus),
+            "sku": np.tile(np.asarray(skus), n),
+        }
+        columns.update(
+            {key: np.asarray(value).reshape(-1) for key, value in steps.items()}
+        )
+
+        return pd.DataFrame(columns)
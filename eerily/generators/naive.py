@@ -1,6 +1,8 @@
 import copy
 from dataclasses import dataclass
-from typing import Any, List
+from typing import Any, Dict, List
+
+import numpy as np
 
 from eerily.generators.utils.stepper import BaseStepper, StepperParams
 
@@ -38,6 +40,14 @@ class ConstantStepper(BaseStepper):
             zip(self.model_params.variable_names, self.model_params.initial_state)
         )
 
+    def compute_steps(self, n: int) -> Dict[Any, np.ndarray]:
+        return {
+            name: np.array([value] * n)
+            for name, value in zip(
+                self.model_params.variable_names, self.model_params.initial_state
+            )
+        }
+
     def __repr__(self) -> str:
         return (
             "ConstantStepper: \n"
@@ -85,9 +95,21 @@ class SequenceStepper(BaseStepper):
         for c, i in zip(self.current_state, self.model_params.step_sizes):
             new_state.append(c + i)
 
-        self.current_state = copy.deepcopy(new_state)
+        self.current_state = copy.deepcopy(new_state) if self.copy_output else new_state
         return dict(zip(self.model_params.variable_names, self.current_state))
 
+    def compute_steps(self, n: int) -> Dict[Any, np.ndarray]:
+        columns = [
+            np.add.accumulate(np.array([c] + [i] * n))[1:]
+            for c, i in zip(
+                self.current_state, self.model_params.step_sizes  # type: ignore
+            )
+        ]
+        if n > 0:
+            self.current_state = [column[-1] for column in columns]
+
+        return dict(zip(self.model_params.variable_names, columns))
+
     def __repr__(self) -> str:
         return (
             "SequenceStepper: \n"
@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+import numpy as np
+
+from eerily.generators.brownian import BrownianMotionParams, BrownianMotionStepper
+from eerily.generators.elasticity import (
+    ElasticityStepper,
+    LinearElasticityParams,
+    PanelElasticityParams,
+    PanelElasticityStepper,
+)
+from eerily.generators.naive import (
+    ConstantStepper,
+    ConstStepperParams,
+    SequenceStepper,
+    SequenceStepperParams,
+)
+from eerily.generators.spiking import SpikingEventParams, SpikingEventStepper
+from eerily.generators.utils.base import ArrayIterator, ConstantIterator
+from eerily.generators.utils.choices import Choices
+from eerily.generators.utils.events import PoissonEvent
+from eerily.generators.utils.noises import (
+    GaussianNoise,
+    LogNormalNoise,
+    MultiGaussianNoise,
+)
+from eerily.generators.utils.stepper import BaseStepper, StepperParams
+from eerily.generators.var import (
+    AR1Stepper,
+    ARModelParams,
+    ARpModelParams,
+    ARpStepper,
+    VAR1ModelParams,
+    VAR1Stepper,
+    VARpModelParams,
+    VARpStepper,
+)
+
+ITERATORS: Dict[str, Any] = {
+    "ArrayIterator": ArrayIterator,
+    "ConstantIterator": ConstantIterator,
+    "Choices": Choices,
+    "GaussianNoise": GaussianNoise,
+    "LogNormalNoise": LogNormalNoise,
+    "MultiGaussianNoise": MultiGaussianNoise,
+    "PoissonEvent": PoissonEvent,
+    "iter": lambda values: iter(values),
+}
+
+STEPPERS: Dict[str, Tuple[Type[BaseStepper], Type[StepperParams]]] = {
+    "AR1Stepper": (AR1Stepper, ARModelParams),
+    "ARpStepper": (ARpStepper, ARpModelParams),
+    "VAR1Stepper": (VAR1Stepper, VAR1ModelParams),
+    "VARpStepper": (VARpStepper, VARpModelParams),
+    "BrownianMotionStepper": (BrownianMotionStepper, BrownianMotionParams),
+    "SpikingEventStepper": (SpikingEventStepper, SpikingEventParams),
+    "ElasticityStepper": (ElasticityStepper, LinearElasticityParams),
+    "PanelElasticityStepper": (PanelElasticityStepper, PanelElasticityParams),
+    "ConstantStepper": (ConstantStepper, ConstStepperParams),
+    "SequenceStepper": (SequenceStepper, SequenceStepperParams),
+}
+
+
+@dataclass(frozen=True)
+class IteratorSpec:
+    """Specification of an iterator, e.g., a noise.
+
+    ```python
+    IteratorSpec("GaussianNoise", {"mu": 0, "std": 1}, seed=42)
+    IteratorSpec("iter", {"values": [1, 2, 3]})
+    ```
+
+    :param iterator: name of the iterator in `ITERATORS`
+    :param params: keyword arguments of the iterator, except the seed
+    :param seed: seed of the iterator, if it takes one
+    """
+
+    iterator: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.iterator not in ITERATORS:
+            raise ValueError(f"Unknown iterator: {self.iterator}")
+
+    @property
+    def takes_seed(self) -> bool:
+        """Whether the iterator is driven by a random number generator."""
+        return "seed" in inspect.signature(ITERATORS[self.iterator]).parameters
+
+    def build(self, seed: Optional[Any] = None) -> Iterator:
+        """Creates the iterator.
+
+        :param seed: overrides the seed of the specification,
+            e.g., a `numpy.random.SeedSequence`.
+        """
+        params = {key: _decode(value) for key, value in self.params.items()}
+        if self.takes_seed:
+            params["seed"] = self.seed if seed is None else seed
+        return ITERATORS[self.iterator](**params)
+
+
+@dataclass(frozen=True, eq=False)
+class StepperSpec:
+    """Specification of a stepper.
+
+    The parameters of steppers contain live iterators and random number
+    generators, which are expensive to pickle and can not be hashed.
+    A specification only describes how to build the stepper.
+    It can be converted to a dictionary or JSON,
+    pickled cheaply, and hashed into a cache key.
+
+    ```python
+    spec = StepperSpec(
+        stepper="AR1Stepper",
+        params={
+            "delta_t": 0.1,
+            "phi0": 0,
+            "phi1": 0.5,
+            "epsilon": IteratorSpec("GaussianNoise", {"mu": 0, "std": 1}, seed=42),
+            "initial_state": np.array([0]),
+            "variable_names": ["v"],
+        },
+        length=100,
+    )
+    stepper = spec.build()
+    ```
+
+    The parameters are the fields of the parameters dataclass of the stepper,
+    e.g., [`ARModelParams`][eerily.generators.var.ARModelParams]
+    for `AR1Stepper`, with iterators replaced by
+    [`IteratorSpec`][eerily.generators.spec.IteratorSpec].
+    The other keyword arguments of the stepper, e.g.,
+    `{"stationary": True, "seed": 42}` for `AR1Stepper`,
+    go in `stepper_kwargs`.
+
+    Specifications with the same key are equal and hash alike.
+
+    A specification is also a recipe for
+    [`ParallelFactory`][eerily.generators.utils.parallel.ParallelFactory]:
+    calling it with a `numpy.random.SeedSequence` builds the stepper with
+    seeds spawned from it.
+
+    :param stepper: name of the stepper in `STEPPERS`
+    :param params: the model parameters
+    :param length: the length of the stepper
+    :param n_paths: number of paths of the stepper
+    :param stepper_kwargs: other keyword arguments of the stepper,
+        e.g., `stationary`, `seed` or `copy_output`
+    """
+
+    stepper: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    length: Optional[int] = None
+    n_paths: Optional[int] = None
+    stepper_kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.stepper not in STEPPERS:
+            raise ValueError(f"Unknown stepper: {self.stepper}")
+
+    @property
+    def iterator_specs(self) -> List[IteratorSpec]:
+        """The specifications of the iterators in the parameters."""
+        return [v for v in self.params.values() if isinstance(v, IteratorSpec)]
+
+    @property
+    def is_seeded(self) -> bool:
+        """Whether all the random iterators of the stepper have a seed."""
+        if self.stepper_kwargs.get("stationary") and (
+            self.stepper_kwargs.get("seed") is None
+        ):
+            return False
+        return all(
+            spec.seed is not None for spec in self.iterator_specs if spec.takes_seed
+        )
+
+    def build(self, seed: Optional[np.random.SeedSequence] = None) -> BaseStepper:
+        """Creates the stepper.
+
+        :param seed: if specified, the seeds of the random iterators
+            are spawned from it in the order of the parameters,
+            overriding their own seeds, followed by the `seed`
+            of `stepper_kwargs` if any.
+        """
+        stepper_class, params_class = STEPPERS[self.stepper]
+        random_specs = [spec for spec in self.iterator_specs if spec.takes_seed]
+        n_seeds = len(random_specs) + ("seed" in self.stepper_kwargs)
+        seeds = iter(seed.spawn(n_seeds)) if seed is not None else None
+
+        params: Dict[str, Any] = {}
+        for key, value in self.params.items():
+            if isinstance(value, IteratorSpec):
+                iterator_seed = None
+                if seeds is not None and value.takes_seed:
+                    iterator_seed = next(seeds)
+                params[key] = value.build(seed=iterator_seed)
+            else:
+                params[key] = _decode(value)
+
+        stepper_kwargs = dict(self.stepper_kwargs)
+        if seeds is not None and "seed" in stepper_kwargs:
+            stepper_kwargs["seed"] = next(seeds)
+
+        return stepper_class(
+            model_params=params_class(**params),
+            length=self.length,
+            n_paths=self.n_paths,
+            **stepper_kwargs,
+        )
+
+    def __call__(self, seed: Optional[np.random.SeedSequence] = None) -> BaseStepper:
+        return self.build(seed=seed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the specification to a dictionary of JSON types."""
+        return {
+            "stepper": self.stepper,
+            "params": {key: _encode(value) for key, value in self.params.items()},
+            "length": self.length,
+            "n_paths": self.n_paths,
+            "stepper_kwargs": {
+                key: _encode(value) for key, value in self.stepper_kwargs.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any]) -> StepperSpec:
+        """Creates the specification from
+        [`to_dict`][eerily.generators.spec.StepperSpec.to_dict].
+
+        :param spec: the dictionary
+        """
+        return cls(
+            stepper=spec["stepper"],
+            params={key: _from_json(value) for key, value in spec["params"].items()},
+            length=spec.get("length"),
+            n_paths=spec.get("n_paths"),
+            stepper_kwargs={
+                key: _from_json(value)
+                for key, value in spec.get("stepper_kwargs", {}).items()
+            },
+        )
+
+    def to_json(self) -> str:
+        """Converts the specification to JSON."""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, spec: str) -> StepperSpec:
+        """Creates the specification from JSON.
+
+        :param spec: the JSON string
+        """
+        return cls.from_dict(json.loads(spec))
+
+    def key(self) -> str:
+        """A hash of the specification to be used as a cache key.
+
+        Numbers are compared by value, e.g., `phi0=0` and `phi0=0.0`
+        give the same key.
+        """
+        canonical = json.dumps(_canonical(self.to_dict()), sort_keys=True)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, StepperSpec):
+            return NotImplemented
+        return self.key() == other.key()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, IteratorSpec):
+        return {
+            "__iterator__": value.iterator,
+            "params": {key: _encode(v) for key, v in value.params.items()},
+            "seed": value.seed,
+        }
+    if isinstance(value, np.ndarray):
+        return {"__ndarray__": value.tolist(), "dtype": str(value.dtype)}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {key: _encode(v) for key, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and float(value) == value:
+        return float(value)
+    if isinstance(value, dict):
+        return {key: _canonical(v) for key, v in value.items()}
+    if isinstance(value, list):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def _from_json(value: Any) -> Any:
+    if isinstance(value, dict) and "__iterator__" in value:
+        return IteratorSpec(
+            iterator=value["__iterator__"],
+            params={key: _from_json(v) for key, v in value["params"].items()},
+            seed=value["seed"],
+        )
+    if isinstance(value, dict) and "__ndarray__" in value:
+        return np.array(value["__ndarray__"], dtype=value["dtype"])
+    if isinstance(value, dict):
+        return {key: _from_json(v) for key, v in value.items()}
+    if isinstance(value, list):
+        return [_from_json(v) for v in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, IteratorSpec):
+        return value.build()
+    return value
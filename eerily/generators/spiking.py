@@ -1,7 +1,9 @@
-import copy
 from dataclasses import dataclass
 from typing import Dict, Iterator
 
+import numpy as np
+
+from eerily.generators.utils.base import draw_batch
 from eerily.generators.utils.stepper import BaseStepper, StepperParams
 
 
@@ -23,27 +25,142 @@ class SpikingEventParams(StepperParams):
     spike_level: Iterator
     background: Iterator
 
+    _sources = ("spike", "spike_level", "background")
+
     def __post_init__(self):
+        super().__post_init__()
         if self.initial_state is None:
-            self.initial_state = 0
+            object.__setattr__(self, "initial_state", 0)
         if self.variable_names is None:
-            self.variable_names = ["event"]
+            object.__setattr__(self, "variable_names", ["event"])
+
+
+@dataclass(frozen=True)
+class SparseSpikes:
+    """Spiking events with the spikes stored sparsely.
+
+    The dense events are `background` plus the spike `levels` at the
+    positions `indices`, where `indices` are flat indices into `background`.
+
+    ```python
+    spikes = stepper.take_sparse(1_000_000)
+    spikes.steps, spikes.levels
+    spikes.to_dense()
+    ```
+
+    :param background: the background of all the steps,
+        of shape `(n,)`, or `(n, n_paths)` for an ensemble
+    :param indices: the flat indices of the spikes in `background`
+    :param levels: the levels of the spikes
+    """
+
+    background: np.ndarray
+    indices: np.ndarray
+    levels: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.background)
+
+    @property
+    def steps(self) -> np.ndarray:
+        """The steps of the spikes."""
+        return np.unravel_index(self.indices, self.background.shape)[0]
+
+    def to_dense(self) -> np.ndarray:
+        """The events as a dense array of the shape of `background`."""
+        dense = np.array(self.background, dtype=float)
+        dense.flat[self.indices] += self.levels
+        return dense
 
 
 class SpikingEventStepper(BaseStepper):
     """Calculates the next step in a spiking event.
 
+    !!! note "Sparse Spikes"
+        Spikes are usually rare.
+        `take_sparse` draws the background for all the steps at once
+        but the spikes only as the indices of the events,
+        which is cheap for
+        [`PoissonEvent`][eerily.generators.utils.events.PoissonEvent]
+        with `skip_ahead=True`.
+        The spike levels are only drawn for the events,
+        so the levels differ from `take` for the same seeds
+        unless they are constant.
+        The result is kept sparse in
+        [`SparseSpikes`][eerily.generators.spiking.SparseSpikes]
+        until `to_dense` is called.
+
     :param model_params: a dataclass that contains the necessary parameters for the model.
         e.g., [`SpikingEventParams`][eerily.generators.spiking.SpikingEventParams]
     """
 
+    _supports_n_paths = True
+
     def compute_step(self) -> Dict[str, float]:
-        background = next(self.model_params.background)  # type: ignore
-        spike = next(self.model_params.spike)  # type: ignore
-        spike_level = next(self.model_params.spike_level)  # type: ignore
+        if self.n_paths is None:
+            background = next(self.model_params.background)  # type: ignore
+            spike = next(self.model_params.spike)  # type: ignore
+            spike_level = next(self.model_params.spike_level)  # type: ignore
+        else:
+            background = self._draw_paths(self.model_params.background)  # type: ignore
+            spike = self._draw_paths(self.model_params.spike)  # type: ignore
+            spike_level = self._draw_paths(self.model_params.spike_level)  # type: ignore
 
         v_next = background + spike * spike_level
 
         self.current_state = v_next
 
-        return copy.deepcopy(self.current_state)
+        return self._output(self.current_state)
+
+    def compute_steps(self, n: int) -> np.ndarray:
+        if self.n_paths is None:
+            background = draw_batch(self.model_params.background, n)  # type: ignore
+            spike = draw_batch(self.model_params.spike, n)  # type: ignore
+            spike_level = draw_batch(self.model_params.spike_level, n)  # type: ignore
+        else:
+            background = self._draw_paths(self.model_params.background, n)  # type: ignore
+            spike = self._draw_paths(self.model_params.spike, n)  # type: ignore
+            spike_level = self._draw_paths(self.model_params.spike_level, n)  # type: ignore
+
+        steps = background + spike * spike_level
+        if n > 0:
+            self.current_state = steps[-1]
+
+        return steps
+
+    def take_sparse(self, n: int) -> SparseSpikes:
+        """Computes the next `n` steps with sparse spikes.
+
+        :param n: number of steps to compute
+        """
+        n = self._steps_left(n)
+        shape = (n,) + np.shape(self.current_state)
+        size = int(np.prod(shape))
+
+        background = draw_batch(self.model_params.background, size).reshape(shape)  # type: ignore
+        spike = self.model_params.spike  # type: ignore
+        if hasattr(spike, "next_event_indices"):
+            indices = spike.next_event_indices(size)
+            spike_levels = draw_batch(self.model_params.spike_level, len(indices))  # type: ignore
+        else:
+            spikes = draw_batch(spike, size)
+            indices = np.flatnonzero(spikes)
+            spike_levels = spikes[indices] * draw_batch(
+                self.model_params.spike_level, len(indices)  # type: ignore
+            )
+
+        sparse = SparseSpikes(
+            background=background,
+            indices=indices,
+            levels=np.asarray(spike_levels, dtype=float),
+        )
+        if n > 0:
+            last = np.array(background[-1], dtype=float)
+            in_last_step = indices >= size - last.size
+            last.flat[indices[in_last_step] - (size - last.size)] += sparse.levels[
+                in_last_step
+            ]
+            self.current_state = last if last.ndim else last[()]
+        self._counter += n
+
+        return sparse
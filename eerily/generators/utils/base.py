@@ -1,4 +1,24 @@
-from typing import Any
+from abc import ABC, abstractmethod
+from typing import Any, Iterator, Protocol, runtime_checkable
+
+import numpy as np
+
+
+@runtime_checkable
+class Source(Protocol):
+    """The protocol of the sources of values that steppers draw from.
+
+    A source is an iterator that can also return the next `n` values
+    as one array whose first axis is the step axis,
+    so that the batch methods of the steppers take a whole chunk at once.
+    `next_batch(n)` serves the same stream as `next`.
+    """
+
+    def __next__(self) -> Any:
+        ...
+
+    def next_batch(self, n: int) -> np.ndarray:
+        ...
 
 
 class ConstantIterator:
@@ -7,6 +27,7 @@ class ConstantIterator:
     ```python
     pe = ConstantIterator(constant=1)
     next(pe)
+    pe.next_batch(3)
     ```
 
     :param constant: the constant value to be emmited.
@@ -20,3 +41,168 @@ class ConstantIterator:
 
     def __next__(self) -> Any:
         return self.constant
+
+    def next_batch(self, n: int) -> np.ndarray:
+        """Returns the constant `n` times as a read-only array
+        without copying the constant.
+
+        :param n: number of values to return.
+        """
+        constant = np.asarray(self.constant)
+        return np.broadcast_to(constant, (n,) + constant.shape)
+
+
+class ArrayIterator:
+    """An iterator over the values of an array along its first axis.
+
+    Arrays are the fastest sources for the steppers:
+    `next_batch` returns a slice of the array without copying it.
+
+    ```python
+    ai = ArrayIterator(np.arange(10))
+    next(ai)
+    ai.next_batch(3)
+    ```
+
+    :param values: the values, the first axis being the step axis
+    """
+
+    def __init__(self, values: Any):
+        self.values = np.asarray(values)
+        self._position = 0
+
+    def __iter__(self):
+        return self
+
+    def __len__(self) -> int:
+        return len(self.values) - self._position
+
+    def __next__(self) -> Any:
+        if self._position >= len(self.values):
+            raise StopIteration
+        value = self.values[self._position]
+        self._position += 1
+        return value
+
+    def next_batch(self, n: int) -> np.ndarray:
+        """Returns the next `n` values as a read-only view of the array.
+
+        :param n: number of values to return.
+        """
+        if n > len(self):
+            raise ValueError(f"Requested {n} values but only {len(self)} are left")
+        batch = self.values[self._position : self._position + n].view()
+        batch.flags.writeable = False
+        self._position += n
+        return batch
+
+
+def as_source(value: Any) -> Any:
+    """Converts arrays to
+    [`ArrayIterator`][eerily.generators.utils.base.ArrayIterator].
+    Other values, e.g., iterators, are returned as they are.
+
+    :param value: an array or an iterator
+    """
+    if isinstance(value, np.ndarray):
+        return ArrayIterator(value)
+
+    return value
+
+
+def _read_only(value: Any) -> Any:
+    """Returns read-only views of arrays that can not be made writeable again.
+
+    The arrays are frozen themselves, so they should be owned by the caller,
+    e.g., the state of a stepper which is replaced by a new array in each step.
+    Views of other arrays are copied first as their bases can not be frozen.
+    """
+    if isinstance(value, np.ndarray):
+        if value.base is not None:
+            value = value.copy()
+        value.flags.writeable = False
+        return value.view()
+    if isinstance(value, dict):
+        return {key: _read_only(val) for key, val in value.items()}
+
+    return value
+
+
+class BufferedIterator(ABC):
+    """An iterator that draws its values in blocks and hands them out one at a time.
+
+    Subclasses implement `_draw` which returns `n` new values as an array
+    whose first axis is the step axis.
+    The values are drawn `block_size` at a time and `next` only indexes
+    into the buffer.
+    `next_batch` serves the same stream as `next`, so both can be interleaved.
+
+    !!! warning "Stream of Values"
+        `_draw(n) + _draw(m)` should be the same as `_draw(n + m)` so that
+        the values do not depend on how they are requested.
+        This is true for the samplers of `numpy.random.Generator` that
+        consume the bit generator sequentially, e.g., `normal` or `random`.
+
+    :param block_size: number of values to draw each time the buffer runs out.
+    """
+
+    def __init__(self, block_size: int = 65536):
+        if block_size < 1:
+            raise ValueError(f"block_size should be positive, got {block_size}")
+        self.block_size = block_size
+        self._buffer: np.ndarray = np.empty(0)
+        self._position = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Any:
+        if self._position >= len(self._buffer):
+            self._buffer = self._draw(self.block_size)
+            self._position = 0
+        value = self._buffer[self._position]
+        self._position += 1
+        return value
+
+    def next_batch(self, n: int) -> np.ndarray:
+        """Returns the next `n` values as an array.
+
+        :param n: number of values to return.
+        """
+        buffered = self._buffer[self._position : self._position + n]
+        self._position += len(buffered)
+        if len(buffered) == n:
+            return buffered.copy()
+
+        drawn = self._draw(n - len(buffered))
+        if len(buffered) == 0:
+            return drawn
+
+        return np.concatenate([buffered, drawn])
+
+    @abstractmethod
+    def _draw(self, n: int) -> np.ndarray:
+        pass
+
+
+def draw_batch(iterator: Iterator, n: int) -> np.ndarray:
+    """Draws the next `n` values from an iterator as an array.
+
+    [Sources][eerily.generators.utils.base.Source] that draw in blocks
+    or slice arrays, e.g.,
+    [`GaussianNoise`][eerily.generators.utils.noises.GaussianNoise] or
+    [`ArrayIterator`][eerily.generators.utils.base.ArrayIterator],
+    provide the values through `next_batch`.
+    Other iterators are called `n` times.
+
+    ```python
+    draw_batch(iter(range(10)), 3)
+    ```
+
+    :param iterator: the iterator to draw from
+    :param n: number of values to draw
+    """
+    if isinstance(iterator, Source):
+        return iterator.next_batch(n)
+
+    return np.array([next(iterator) for _ in range(n)])
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Literal, Optional, Union
+
+import numpy as np
+
+from eerily.generators.utils.base import _read_only
+
+if TYPE_CHECKING:  # pragma: no cover
+    from eerily.generators.spec import StepperSpec
+
+
+def _encode_array(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        data = np.ascontiguousarray(value).tobytes()
+        return {
+            "__ndarray__": hashlib.sha256(data).hexdigest(),
+            "dtype": value.dtype.str,
+            "shape": list(value.shape),
+        }
+    if isinstance(value, np.generic):
+        return value.item()
+
+    raise TypeError(f"Can not hash values of type {type(value).__name__}")
+
+
+def hash_key(*parts: Any) -> str:
+    """A hash of parameters to be used as a cache key.
+
+    The parameters are JSON types or arrays, which are hashed
+    with their data, dtype and shape.
+    Other values raise a `TypeError`.
+
+    ```python
+    hash_key("Pendulum", {"length": 1.0, "gravity": 9.81})
+    ```
+
+    :param parts: the parameters
+    """
+    canonical = json.dumps(parts, sort_keys=True, default=_encode_array)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def generate_spec(spec: StepperSpec) -> np.ndarray:
+    """Generates the full history of a specification as an array.
+
+    The array has the shape `(length, number of variables)`, or
+    `(length, n_paths, ...)` for ensembles.
+
+    :param spec: the specification, with the length set
+    """
+    from eerily.generators.utils.factory import Factory
+
+    if spec.length is None:
+        raise ValueError("The length of the specification is not set")
+
+    stepper = spec.build()
+    if stepper.n_paths is None:
+        return Factory(format="numpy")(stepper, length=spec.length)
+
+    return np.asarray(stepper.take(spec.length))
+
+
+MMapMode = Literal["r+", "r", "w+", "c"]
+
+
+class DiskCache:
+    """A cache of generated arrays on disk.
+
+    Each array is saved as a `.npy` file named by its key and
+    loaded as a memory-mapped array,
+    so loading a cached dataset is instant and the pages of the file
+    are shared by all the processes that read it.
+
+    ```python
+    cache = DiskCache("~/.cache/eerily", max_bytes=10 * 2**30)
+    history = cache.load(spec, dtype=np.float32, mmap_mode="c")
+    dataset = WindowDataset(history, input_length=24, prediction_length=6)
+    ```
+
+    Torch tensors share the memory of the arrays only if the dtypes match
+    and the arrays are writable, hence `np.float32` for the default dtype of
+    [`WindowDataset`][eerily.datasets.windows.WindowDataset] and
+    the copy-on-write `mmap_mode="c"`.
+    The default read-only arrays are copied into the tensors instead.
+
+    !!! note "Eviction"
+        The modification time of a file is updated whenever it is read.
+        If the files exceed `max_bytes` after writing a new file,
+        the least recently used files are removed.
+
+    :param directory: the directory of the files
+    :param max_bytes: the maximum total size of the files,
+        `None` for no limit
+    """
+
+    def __init__(
+        self, directory: Union[str, Path], max_bytes: Optional[int] = None
+    ) -> None:
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def path(self, key: str) -> Path:
+        """The path of the file of a key.
+
+        :param key: the key
+        """
+        return self.directory / f"{key}.npy"
+
+    def __contains__(self, key: str) -> bool:
+        return self.path(key).exists()
+
+    @property
+    def size(self) -> int:
+        """Total size of the files in bytes."""
+        return sum(path.stat().st_size for path in self.directory.glob("*.npy"))
+
+    def get_or_create(
+        self,
+        key: str,
+        create: Callable[[], np.ndarray],
+        mmap_mode: MMapMode = "r",
+    ) -> np.ndarray:
+        """Loads the array of a key, creating and saving it first if needed.
+
+        :param key: the key, e.g.,
+            [`StepperSpec.key`][eerily.generators.spec.StepperSpec.key]
+        :param create: a function that creates the array
+        :param mmap_mode: `mmap_mode` of `numpy.load`, e.g., `"r"` for
+            read-only arrays or `"c"` for arrays that can be modified in memory
+            without changing the file
+        """
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self._save(path, np.asarray(create()))
+            self._evict(keep=path)
+
+        return np.load(path, mmap_mode=mmap_mode)
+
+    def load(
+        self,
+        spec: StepperSpec,
+        dtype: Optional[np.dtype] = None,
+        mmap_mode: MMapMode = "r",
+    ) -> np.ndarray:
+        """Loads the history of a specification, generating it if it is not cached.
+
+        Only seeded specifications are cached, as the history of
+        an unseeded specification is different every time.
+
+        :param spec: the specification, with the length set
+        :param dtype: the dtype to save the history in, e.g., `np.float32`
+            to use the arrays as torch tensors without conversion
+        :param mmap_mode: `mmap_mode` of `numpy.load`
+        """
+        if not spec.is_seeded:
+            raise ValueError("Can not cache a specification without seeds")
+
+        key = spec.key()
+        if dtype is not None:
+            key = f"{key}-{np.dtype(dtype).name}"
+
+        def create() -> np.ndarray:
+            history = generate_spec(spec)
+            return history if dtype is None else history.astype(dtype)
+
+        return self.get_or_create(key, create, mmap_mode=mmap_mode)
+
+    def clear(self) -> None:
+        """Removes all the files."""
+        for path in self.directory.glob("*.npy"):
+            path.unlink(missing_ok=True)
+
+    def _save(self, path: Path, array: np.ndarray) -> None:
+        # write to a temporary file first so that readers never see partial files
+        temporary = path.with_name(f".{path.stem}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(temporary, "wb") as f:
+                np.save(f, array)
+            os.replace(temporary, path)
+        finally:
+            temporary.unlink(missing_ok=True)
+
+    def _evict(self, keep: Path) -> None:
+        if self.max_bytes is None:
+            return
+
+        files = []
+        for path in self.directory.glob("*.npy"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files, key=lambda f: f[0]):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def _nbytes(value: Any) -> int:
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    return 0
+
+
+def _shallow_copy(value: Any) -> Any:
+    # the cached dictionaries are shared, the arrays in them are read-only
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+class MemoryCache:
+    """A least recently used cache of generated arrays in memory.
+
+    Deterministic results, e.g., the histories of seeded specifications
+    or [`Pendulum.generate`][eerily.physics.pendulum.Pendulum.generate],
+    are computed once and returned as read-only arrays afterwards.
+    Dictionaries of arrays are returned as new dictionaries,
+    so replacing their values does not change the cache.
+
+    ```python
+    cache = MemoryCache(max_bytes=2**28)
+    history = cache.load(spec)
+    cache.hits, cache.misses
+    ```
+
+    The results used by the package are cached in `memory_cache`,
+    which can be disabled with `memory_cache.enabled = False`.
+
+    :param max_bytes: the memory budget of the arrays.
+        The least recently used arrays are removed if it is exceeded.
+    :param enabled: whether to cache, otherwise the results are computed
+        every time.
+    """
+
+    def __init__(self, max_bytes: int = 2**28, enabled: bool = True) -> None:
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._values: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._values
+
+    def get_or_create(
+        self, key: str, create: Callable[[], Union[np.ndarray, Dict[Any, np.ndarray]]]
+    ) -> Union[np.ndarray, Dict[Any, np.ndarray]]:
+        """Returns the cached value of a key, creating it first if needed.
+
+        :param key: the key, e.g., from [`hash_key`][eerily.generators.utils.cache.hash_key]
+        :param create: a function that creates an array or a dictionary of arrays
+        """
+        if not self.enabled:
+            return create()
+
+        with self._lock:
+            if key in self._values:
+                self.hits += 1
+                self._values.move_to_end(key)
+                return _shallow_copy(self._values[key])
+            self.misses += 1
+
+        value = _read_only(create())
+        nbytes = _nbytes(value)
+        if nbytes > self.max_bytes:
+            return value
+
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = value
+                self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._values.popitem(last=False)
+                self.nbytes -= _nbytes(evicted)
+
+        return _shallow_copy(value)
+
+    def load(self, spec: StepperSpec) -> np.ndarray:
+        """Returns the history of a specification, generating it if it is not cached.
+
+        Only seeded specifications are cached, as the history of
+        an unseeded specification is different every time.
+
+        :param spec: the specification, with the length set
+        """
+        if not spec.is_seeded:
+            raise ValueError("Can not cache a specification without seeds")
+
+        return self.get_or_create(spec.key(), lambda: generate_spec(spec))  # type: ignore
+
+    def clear(self) -> None:
+        """Removes all the values and resets the counters."""
+        with self._lock:
+            self._values.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+memory_cache = MemoryCache()
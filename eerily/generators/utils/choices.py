@@ -1,9 +1,12 @@
-from typing import Any, Optional, Sequence, Tuple, Union
+from typing import Any, Optional, Sequence, Tuple
 
 import numpy as np
+from numpy.typing import ArrayLike
 
+from eerily.generators.utils.base import BufferedIterator
 
-class Choices:
+
+class Choices(BufferedIterator):
     """Generating data by choosing from some given values.
 
     ```python
@@ -12,20 +15,108 @@ class Choices:
     next(c)
     ```
 
+    The elements can be weighted,
+
+    ```python
+    c = Choices(elements=["a", "b", "c"], weights=[0.2, 0.3, 0.5])
+    c.next_batch(10)
+    ```
+
+    !!! note "Alias Method"
+        The weights are converted into an alias table once
+        using Vose's alias method.
+        Each draw then takes a single uniform random number $u$
+        in $[0, k)$ for $k$ elements:
+        the integer part $i$ selects a column of the table
+        and the fractional part decides whether
+        we take $i$ or its alias.
+
     :param elements: the elements to choose from
     :param seed: seed of the RNG for reproducibility
+    :param weights: weights of the elements, normalized to probabilities.
+        The elements are equally likely if not specified.
+    :param block_size: number of indices to draw from the RNG at a time
     """
 
     def __init__(
         self,
         elements: Sequence[Any],
         seed: Optional[float] = None,
+        weights: Optional[Sequence[float]] = None,
+        block_size: int = 65536,
     ):
+        super().__init__(block_size=block_size)
         self.elements = elements
-        self.indices = range(len(elements))
+        self.weights = weights
+        if weights is not None and len(weights) != len(elements):
+            raise ValueError("weights should have the same length as elements")
+        self.probability, self.alias = self._alias_table(
+            np.ones(len(elements)) if weights is None else weights
+        )
+
+        self._elements_array = self._as_array(elements)
 
         self.rng = np.random.default_rng(seed=seed)
 
+    @staticmethod
+    def _alias_table(weights: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        values = np.asarray(weights, dtype=float)
+        if values.ndim != 1 or len(values) == 0:
+            raise ValueError("weights should be a non-empty 1 D sequence")
+        if np.any(values < 0) or values.sum() <= 0:
+            raise ValueError("weights should be non-negative with a positive sum")
+
+        k = len(values)
+        scaled = values * k / values.sum()
+        probability = np.ones(k)
+        alias = np.arange(k)
+
+        small = [i for i in range(k) if scaled[i] < 1]
+        large = [i for i in range(k) if scaled[i] >= 1]
+        while small and large:
+            i_small = small.pop()
+            i_large = large.pop()
+            probability[i_small] = scaled[i_small]
+            alias[i_small] = i_large
+            scaled[i_large] = scaled[i_large] + scaled[i_small] - 1
+            if scaled[i_large] < 1:
+                small.append(i_large)
+            else:
+                large.append(i_large)
+
+        return probability, alias
+
+    @staticmethod
+    def _as_array(elements: Sequence[Any]) -> np.ndarray:
+        if len({type(e) for e in elements}) == 1:
+            array = np.asarray(elements)
+            if array.ndim == 1:
+                return array
+
+        array = np.empty(len(elements), dtype=object)
+        array[:] = list(elements)
+        return array
+
+    def _draw(self, n: int) -> np.ndarray:
+        k = len(self.probability)
+        u = self.rng.random(n) * k
+        column = np.minimum(u.astype(np.intp), k - 1)
+        accept = (u - column) < self.probability[column]
+        return np.where(accept, column, self.alias[column])
+
     def __next__(self) -> Any:
-        idx = self.rng.choice(self.indices)
+        idx = super().__next__()
         return self.elements[idx]
+
+    def next_batch(self, n: int, return_indices: bool = False) -> np.ndarray:
+        """Returns the next `n` choices as an array.
+
+        :param n: number of choices to return.
+        :param return_indices: whether to return the indices of the chosen
+            elements instead of the elements.
+        """
+        indices = np.asarray(super().next_batch(n), dtype=np.intp)
+        if return_indices:
+            return indices
+
+        return self._elements_array[indices]
@@ -2,29 +2,118 @@ from typing import Optional
 
 import numpy as np
 
+from eerily.generators.utils.base import BufferedIterator
 
-class PoissonEvent:
+
+class PoissonEvent(BufferedIterator):
     """A Poisson process event generator.
 
     See [this notebook](https://github.com/btel/python-in-neuroscience-tutorials/blob/master/poisson_process.ipynb) for more about a Poisson process.
 
     ```python
     rate = 0.1
-    pe = PoissonEvents(rate=rate)
+    pe = PoissonEvent(rate=rate)
     next(pe)
     ```
 
-    :param lambda: the mean rate of the Poisson process
+    !!! note "Skip Ahead"
+        By default, we draw a uniform random number for each step and
+        emit an event if it is below the rate.
+        For sparse events, `skip_ahead=True` draws the gaps between two events
+        from the geometric distribution instead,
+        which is the distribution of the number of steps until the first event.
+        The steps between two events are zeros without touching the RNG.
+        The events follow the same distribution in both modes but
+        the values are different for the same seed.
+
+        ```python
+        pe = PoissonEvent(rate=0.001, skip_ahead=True)
+        pe.next_event_indices(100000)
+        ```
+
+    :param rate: the mean rate of the Poisson process
     :param seed: seed of the RNG for reproducibility
+    :param skip_ahead: whether to draw the gaps between events
+        instead of one uniform random number per step
+    :param block_size: number of values to draw from the RNG at a time
     """
 
-    def __init__(self, rate: float, seed: Optional[float] = None):
+    def __init__(
+        self,
+        rate: float,
+        seed: Optional[float] = None,
+        skip_ahead: bool = False,
+        block_size: int = 65536,
+    ):
+        if skip_ahead and not 0 < rate <= 1:
+            raise ValueError(f"rate should be in (0, 1] to skip ahead, got {rate}")
+        super().__init__(block_size=block_size)
         self.rate = rate
+        self.skip_ahead = skip_ahead
         self.rng = np.random.default_rng(seed=seed)
+        self._zeros_before_event: Optional[int] = None
+
+    def _draw(self, n: int) -> np.ndarray:
+        if self.skip_ahead:
+            return self.rng.geometric(self.rate, size=n)
+        return (self.rng.random(n) <= self.rate).astype(int)
+
+    def __next__(self) -> int:
+        if not self.skip_ahead:
+            return super().__next__()
+
+        if self._zeros_before_event is None:
+            self._zeros_before_event = super().__next__() - 1
+        if self._zeros_before_event > 0:
+            self._zeros_before_event -= 1
+            return 0
+
+        self._zeros_before_event = None
+        return 1
+
+    def next_batch(self, n: int) -> np.ndarray:
+        """Returns the next `n` steps as a dense array of 0 and 1.
+
+        :param n: number of steps to return.
+        """
+        if not self.skip_ahead:
+            return super().next_batch(n)
+
+        events = np.zeros(n, dtype=int)
+        events[self.next_event_indices(n)] = 1
+        return events
+
+    def next_event_indices(self, n: int) -> np.ndarray:
+        """Advances `n` steps and returns the indices of the steps with an event.
+
+        :param n: number of steps to advance.
+        """
+        if not self.skip_ahead:
+            return np.flatnonzero(super().next_batch(n))
+
+        if self._zeros_before_event is None:
+            self._zeros_before_event = super().__next__() - 1
+        position = self._zeros_before_event
+
+        indices = []
+        while position < n:
+            if self._position >= len(self._buffer):
+                self._buffer = self._draw(self.block_size)
+                self._position = 0
+            gaps = self._buffer[self._position : self._position + n]
+            positions = position + np.concatenate([[0], np.cumsum(gaps)])
+            n_events = int(np.searchsorted(positions, n))
+            if n_events < len(positions):
+                indices.append(positions[:n_events])
+                self._position += n_events
+                position = positions[n_events]
+            else:
+                indices.append(positions[:-1])
+                self._position += len(gaps)
+                position = positions[-1]
 
-    def __iter__(self):
-        return self
+        self._zeros_before_event = int(position - n)
 
-    def __next__(self) -> float:
-        random_state = self.rng.random() <= self.rate
-        return int(random_state)
+        if not indices:
+            return np.empty(0, dtype=int)
+        return np.concatenate(indices).astype(int)
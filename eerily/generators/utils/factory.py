@@ -1,16 +1,150 @@
-from typing import Iterator, Literal, Optional
+import itertools
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from eerily.generators.utils.stepper import (
+    BaseStepper,
+    MergedStepper,
+    SequentialStepper,
+)
 
 
 class Factory:
     """
     An experimental factor that generates a history
     based on a stepper and the given length.
+
+    Without a format, the factory returns a generator of the steps.
+    With a format, the history is generated at once,
+
+    ```python
+    factory = Factory(format="dataframe")
+    factory(stepper, length=1000)
+    ```
+
+    - `"list"`: a list of the steps,
+    - `"dataframe"`: a dataframe with one column per variable,
+    - `"numpy"`: an array of shape `(length, number of variables)`,
+      or `(length, n_paths, number of variables)` for ensembles,
+    - `"torch"`: a tensor of the same shape as the numpy format.
+
+    For steppers, the dataframe, numpy and torch formats use the batch methods
+    of the steppers and write the steps into arrays that are allocated once,
+    see [`MergedStepper.iter_columns`][eerily.generators.utils.stepper.MergedStepper.iter_columns].
+    Other iterators are called step by step.
+    Variables of strings and numbers are combined into an array of objects
+    in the numpy format.
+
+    :param format: the format of the history
+    :param chunk_size: number of steps to take from the stepper at a time
+    :param dtype: dtype of the numpy and torch histories, e.g., `np.float32`,
+        defaults to the common dtype of the variables
     """
 
-    def __init__(self, format: Optional[Literal["list", "dataframe"]] = None):
+    def __init__(
+        self,
+        format: Optional[Literal["list", "dataframe", "numpy", "torch"]] = None,
+        chunk_size: int = 65536,
+        dtype: Optional[Any] = None,
+    ):
+        if format not in (None, "list", "dataframe", "numpy", "torch"):
+            raise ValueError(f"Unknown format: {format}")
         self.format = format
+        self.chunk_size = chunk_size
+        self.dtype = dtype
+
+    def __call__(self, stepper: Iterator, length: int) -> Any:
+        if self.format is None:
+            return self._generate(stepper, length)
+        if self.format == "list":
+            return list(self._generate(stepper, length))
+
+        if self.format == "dataframe":
+            if not isinstance(stepper, (BaseStepper, SequentialStepper, MergedStepper)):
+                return pd.DataFrame(list(self._generate(stepper, length)))
+
+            columns = MergedStepper([stepper]).to_columns(
+                n=length, chunk_size=self.chunk_size
+            )
+            if any(np.ndim(values) > 1 for values in columns.values()):
+                raise ValueError(
+                    "Ensembles can not be converted to a dataframe, "
+                    "use the numpy format instead"
+                )
+            return pd.DataFrame(columns)
+
+        history = self._history(*self._chunks(stepper, length))
+        if self.format == "torch":
+            import torch
+
+            return torch.from_numpy(history)
+
+        return history
+
+    def _chunks(
+        self,
+        stepper: Union[Iterator, BaseStepper, SequentialStepper, MergedStepper],
+        length: int,
+    ) -> Tuple[int, Iterator[Dict[Any, np.ndarray]]]:
+        """The number of steps to allocate and the chunks of the columns."""
+        if isinstance(stepper, (BaseStepper, SequentialStepper, MergedStepper)):
+            merged = MergedStepper([stepper])
+            length = merged._columns_length(length)
+            return length, merged.iter_columns(n=length, chunk_size=self.chunk_size)
+
+        return length, self._iterator_chunks(stepper, length)
+
+    def _iterator_chunks(
+        self, iterator: Iterator, length: int
+    ) -> Iterator[Dict[Any, np.ndarray]]:
+        steps = self._generate(iterator, length)
+        while True:
+            rows: List[Any] = list(itertools.islice(steps, self.chunk_size))
+            if not rows:
+                return
+            if isinstance(rows[0], dict):
+                yield {key: np.array([row[key] for row in rows]) for key in rows[0]}
+            else:
+                values = np.array(rows)
+                values = values.reshape(len(rows), -1)
+                yield {i: values[:, i] for i in range(values.shape[1])}
+
+    @staticmethod
+    def _dtype(columns: List[np.ndarray]) -> np.dtype:
+        kinds = {values.dtype.kind in "US" for values in columns}
+        if len(kinds) > 1:
+            return np.dtype(object)
+
+        return np.result_type(*columns)
+
+    def _history(
+        self, length: int, chunks: Iterator[Dict[Any, np.ndarray]]
+    ) -> np.ndarray:
+        """Writes the chunks of the steps into one array that is allocated once."""
+        history = None
+        filled = 0
+        for chunk in chunks:
+            columns = list(chunk.values())
+            if not columns:
+                break
+            if history is None:
+                history = np.empty(
+                    (length,) + columns[0].shape[1:] + (len(columns),),
+                    dtype=self._dtype(columns) if self.dtype is None else self.dtype,
+                )
+            size = len(columns[0])
+            for i, values in enumerate(columns):
+                history[filled : filled + size, ..., i] = values
+            filled += size
+
+        if history is None:
+            return np.empty((0, 0))
+
+        return history[:filled]
 
-    def __call__(self, stepper: Iterator, length: int):
+    def _generate(self, stepper: Iterator, length: int) -> Iterator:
         i = 0
         while i < length:
             yield next(stepper)
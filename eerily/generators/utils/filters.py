@@ -0,0 +1,115 @@
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+
+try:
+    from scipy.signal import lfilter
+except ImportError:  # pragma: no cover
+    lfilter = None
+
+
+def ar_filter(
+    x: np.ndarray, phi: Sequence[float], history: np.ndarray, block_size: int = 128
+) -> Tuple[np.ndarray, np.ndarray]:
+    r"""Applies the autoregressive filter
+
+    $$s(t) = x(t) + \sum_{k=1}^p \phi_k s(t-k)$$
+
+    to a whole array of inputs at once.
+
+    The filter uses `scipy.signal.lfilter` if scipy is installed.
+    Otherwise, the inputs are split into blocks of `block_size` steps;
+    the response to the inputs of all blocks is one matrix multiplication
+    with the impulse response, and only the response to
+    the last $p$ values of the previous block is computed block by block.
+
+    :param x: the inputs of shape `(n, ...)`, the first axis being time
+    :param phi: the coefficients $\phi_1, \cdots, \phi_p$
+    :param history: the last $p$ values of $s$ before the inputs,
+        of shape `(p, ...)` and the latest value last.
+    :param block_size: number of steps in each block for the NumPy kernel
+    :return: the filtered values of shape `(n, ...)`
+        and the last $p$ values of $s$ as the new history.
+    """
+    coefficients = np.asarray(phi, dtype=float)
+    history = np.asarray(history, dtype=float)
+    x = np.asarray(x, dtype=float)
+    p = len(coefficients)
+    if p == 0 or len(x) == 0:
+        return x, history
+
+    if lfilter is not None:
+        s, _ = lfilter(
+            [1.0],
+            np.concatenate([[1.0], -coefficients]),
+            x,
+            axis=0,
+            zi=_initial(coefficients, history),
+        )
+    else:
+        s = _block_filter(x, coefficients, history, block_size=max(block_size, p))
+
+    return s, np.concatenate([history, s])[-p:]
+
+
+def _initial(phi: np.ndarray, history: np.ndarray) -> np.ndarray:
+    """Initial conditions of the transposed direct form II for `lfilter`."""
+    p = len(phi)
+    zi = np.zeros_like(history)
+    for k in range(p):
+        for j in range(k + 1, p + 1):
+            zi[k] += phi[j - 1] * history[k - j]
+    return zi
+
+
+def _block_filter(
+    x: np.ndarray, phi: np.ndarray, history: np.ndarray, block_size: int
+) -> np.ndarray:
+    p = len(phi)
+    n = len(x)
+    n_blocks = -(-n // block_size)
+    impulse, free = _responses(tuple(phi), block_size)
+
+    padded = np.zeros((n_blocks * block_size,) + x.shape[1:])
+    padded[:n] = x
+    blocks = impulse @ padded.reshape(n_blocks, block_size, -1)
+
+    state = history.reshape(p, -1)
+    for block in blocks:
+        block += free @ state
+        state = block[-p:]
+
+    return blocks.reshape(padded.shape)[:n]
+
+
+@lru_cache(maxsize=32)
+def _responses(
+    phi: Tuple[float, ...], block_size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Responses of the filter within a block.
+
+    :return: the lower triangular matrix of the impulse response and
+        the responses to each of the $p$ values before the block.
+    """
+    p = len(phi)
+    coefficients = np.asarray(phi)[::-1]
+
+    impulse = np.zeros(block_size + p)
+    impulse[p] = 1
+    for i in range(p + 1, block_size + p):
+        impulse[i] = coefficients @ impulse[i - p : i]
+    impulse = impulse[p:]
+    steps = np.arange(block_size)
+    lag = steps[:, np.newaxis] - steps[np.newaxis, :]
+    impulse_matrix = np.where(lag >= 0, impulse[np.abs(lag)], 0.0)
+
+    free = np.zeros((block_size, p))
+    for k in range(p):
+        values = np.zeros(block_size + p)
+        values[k] = 1
+        for i in range(p, block_size + p):
+            values[i] = coefficients @ values[i - p : i]
+        free[:, k] = values[p:]
+
+    return impulse_matrix, free
@@ -1,55 +1,79 @@
-from typing import Optional
+from typing import Any, Iterator, Optional, Tuple
 
 import numpy as np
 
+from eerily.generators.utils.base import BufferedIterator, ConstantIterator
 
-class GaussianNoise:
+
+class GaussianNoise(BufferedIterator):
     """1 D Gaussian noise
 
+    The values are drawn in blocks of `block_size` for speed.
+    The stream of values for a given seed does not depend on the block size.
+
+    ```python
+    gn = GaussianNoise(mu=0, std=1, seed=42)
+    next(gn)
+    gn.next_batch(10)
+    ```
+
     :param mu: mean of the Gaussian distribution
     :param std: standard deviation of the Gaussian distribution
     :param seed: seed of the RNG for reproducibility
+    :param block_size: number of values to draw from the RNG at a time
     """
 
-    def __init__(self, mu: float, std: float, seed: Optional[float] = None):
+    def __init__(
+        self,
+        mu: float,
+        std: float,
+        seed: Optional[float] = None,
+        block_size: int = 65536,
+    ):
+        super().__init__(block_size=block_size)
         self.mu = mu
         self.std = std
         self.rng = np.random.default_rng(seed=seed)
 
-    def __iter__(self):
-        return self
+    def _draw(self, n: int) -> np.ndarray:
+        return self.rng.normal(self.mu, self.std, size=n)
 
-    def __next__(self) -> float:
-        return self.rng.normal(self.mu, self.std)
 
-
-class LogNormalNoise:
+class LogNormalNoise(BufferedIterator):
     """1 D lognormal noise
 
+    The values are drawn in blocks of `block_size` for speed.
+    The stream of values for a given seed does not depend on the block size.
+
     :param mu: mean of the Gaussian distribution
     :param std: standard deviation of the Gaussian distribution
     :param seed: seed of the RNG for reproducibility
+    :param block_size: number of values to draw from the RNG at a time
     """
 
-    def __init__(self, mu: float, std: float, seed: Optional[float] = None):
+    def __init__(
+        self,
+        mu: float,
+        std: float,
+        seed: Optional[float] = None,
+        block_size: int = 65536,
+    ):
+        super().__init__(block_size=block_size)
         self.mu = mu
         self.std = std
         self.rng = np.random.default_rng(seed=seed)
 
-    def __iter__(self):
-        return self
-
-    def __next__(self) -> float:
-        return self.rng.lognormal(self.mu, self.std)
+    def _draw(self, n: int) -> np.ndarray:
+        return self.rng.lognormal(self.mu, self.std, size=n)
 
 
-class MultiGaussianNoise:
-    """A multivariate Gaussian noise
+class MultiGaussianNoise(BufferedIterator):
+    r"""A multivariate Gaussian noise
 
     To generate constants,
 
     ```python
-    mge = MultiGaussianEpsilon(
+    mge = MultiGaussianNoise(
         mu=np.array([1,2]), cov=np.array([
             [0, 0],
             [0, 0]
@@ -60,7 +84,7 @@ class MultiGaussianNoise:
     To generate independent noises,
 
     ```python
-    mge = MultiGaussianEpsilon(
+    mge = MultiGaussianNoise(
         mu=np.array([1,2]), cov=np.array([
             [1, 0],
             [0, 1]
@@ -68,15 +92,70 @@ class MultiGaussianNoise:
     )
     ```
 
+    The covariance is factorized once as $\Sigma = L L^T$ so that each
+    sample is $\mu + L z$ with standard normal $z$.
+    We use the Cholesky decomposition and fall back to the eigendecomposition
+    for positive semi-definite covariances such as the constant example above.
+    The values are drawn in blocks of `block_size` and
+    `next_batch(n)` returns an array of shape `(n, d)`.
+
     :param mu: means of the variables
     :param cov: covariance of the variables
     :param seed: seed of the random number generator for reproducibility
+    :param block_size: number of samples to draw from the RNG at a time
     """
 
-    def __init__(self, mu: np.ndarray, cov: np.ndarray, seed: Optional[float] = None):
+    def __init__(
+        self,
+        mu: np.ndarray,
+        cov: np.ndarray,
+        seed: Optional[float] = None,
+        block_size: int = 4096,
+    ):
+        super().__init__(block_size=block_size)
         self.mu = mu
         self.cov = cov
         self.rng = np.random.default_rng(seed=seed)
+        self.factor = self._factorize(np.asarray(cov, dtype=float))
+
+    @staticmethod
+    def _factorize(cov: np.ndarray) -> np.ndarray:
+        try:
+            return np.linalg.cholesky(cov)
+        except np.linalg.LinAlgError:
+            eigenvalues, eigenvectors = np.linalg.eigh(cov)
+            if eigenvalues.min() < -1e-8 * max(np.abs(eigenvalues).max(), 1.0):
+                raise ValueError("cov should be positive semi-definite")
+            return eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
 
-    def __next__(self) -> np.ndarray:
-        return self.rng.multivariate_normal(self.mu, self.cov)
+    def _draw(self, n: int) -> np.ndarray:
+        z = self.rng.standard_normal((n, self.factor.shape[1]))
+        return self.mu + z @ self.factor.T
+
+
+def noise_moments(noise: Iterator) -> Tuple[Any, Any]:
+    """The mean and the (co)variance of a Gaussian noise.
+
+    Constants are noises with zero variance.
+
+    ```python
+    noise_moments(GaussianNoise(mu=0, std=2))
+    ```
+
+    :param noise: a [`GaussianNoise`][eerily.generators.utils.noises.GaussianNoise],
+        [`MultiGaussianNoise`][eerily.generators.utils.noises.MultiGaussianNoise] or
+        [`ConstantIterator`][eerily.generators.utils.base.ConstantIterator]
+    :return: the mean and the variance, or the covariance matrix
+        for multivariate noises.
+    """
+    if isinstance(noise, MultiGaussianNoise):
+        return noise.mu, noise.cov
+    if isinstance(noise, GaussianNoise):
+        return noise.mu, noise.std**2
+    if isinstance(noise, ConstantIterator):
+        return noise.constant, 0.0
+
+    raise TypeError(
+        "Expected GaussianNoise, MultiGaussianNoise or ConstantIterator, "
+        f"got {type(noise).__name__}"
+    )
@@ -0,0 +1,111 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterator, List, Literal, Optional
+
+import numpy as np
+
+from eerily.generators.utils.factory import Factory
+
+
+def _generate_series(
+    seed: np.random.SeedSequence,
+    recipe: Callable[[np.random.SeedSequence], Iterator],
+    length: int,
+    format: str,
+    chunk_size: int,
+) -> Any:
+    stepper = recipe(seed)
+    return Factory(format=format, chunk_size=chunk_size)(  # type: ignore
+        stepper, length=length
+    )
+
+
+class ParallelFactory:
+    """
+    Generates many independent series of a stepper in a process pool.
+
+    The stepper is described by a recipe, a picklable function that
+    takes a seed and returns a stepper.
+    Each series gets its own child seed spawned from `seed` using
+    `numpy.random.SeedSequence.spawn`, so the series are independent
+    and the results do not depend on the number of workers.
+
+    ```python
+    def recipe(seed):
+        seeds = seed.spawn(1)
+        return AR1Stepper(
+            model_params=ARModelParams(
+                delta_t=0.1,
+                phi0=0,
+                phi1=0.5,
+                epsilon=GaussianNoise(mu=0, std=1, seed=seeds[0]),
+                initial_state=np.array([0]),
+                variable_names=["v"],
+            )
+        )
+
+    factory = ParallelFactory(format="numpy", max_workers=4)
+    series = factory(recipe, length=1000, n_series=100, seed=42)
+    ```
+
+    !!! note "Seeds"
+        The recipe receives a `numpy.random.SeedSequence` which can be used
+        as the seed of the noises.
+        Spawn more seeds from it if the stepper uses several noises,
+        e.g., `seed.spawn(3)`.
+
+    :param format: the format of each series,
+        see [`Factory`][eerily.generators.utils.factory.Factory].
+    :param max_workers: number of worker processes,
+        defaults to the number of processors.
+        With `max_workers=1`, the series are generated in the current process.
+    :param chunk_size: number of steps to take from a stepper at a time
+    """
+
+    def __init__(
+        self,
+        format: Literal["list", "dataframe", "numpy", "torch"] = "numpy",
+        max_workers: Optional[int] = None,
+        chunk_size: int = 65536,
+    ):
+        if format not in ("list", "dataframe", "numpy", "torch"):
+            raise ValueError(f"Unknown format: {format}")
+        self.format = format
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+
+    def __call__(
+        self,
+        recipe: Callable[[np.random.SeedSequence], Iterator],
+        length: int,
+        n_series: int,
+        seed: Optional[int] = None,
+    ) -> List[Any]:
+        """Generates `n_series` series of the given length.
+
+        :param recipe: a picklable function that takes a seed
+            and returns a stepper.
+        :param length: the length of each series
+        :param n_series: number of series to generate
+        :param seed: the root seed that the seeds of the series are spawned from
+        """
+        seeds = np.random.SeedSequence(seed).spawn(n_series)
+        generate = partial(
+            _generate_series,
+            recipe=recipe,
+            length=length,
+            format=self.format,
+            chunk_size=self.chunk_size,
+        )
+
+        if self.max_workers == 1:
+            return [generate(s) for s in seeds]
+
+        max_workers = self.max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    generate, seeds, chunksize=max(1, n_series // (4 * max_workers))
+                )
+            )
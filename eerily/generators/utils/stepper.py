@@ -3,10 +3,14 @@ from __future__ import annotations
 import copy
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, List, Optional, Union
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
+import pandas as pd
 from loguru import logger
 
+from eerily.generators.utils.base import _read_only, as_source, draw_batch
+
 
 class StepperOperator:
     """Allowing `&` and `+` for the steppers."""
@@ -32,6 +36,13 @@ class StepperOperator:
 class StepperParams:
     """Base Parameters for Stepper
 
+    The fields listed in `_sources` are the sources of values
+    that the stepper draws from in each step, e.g., noises.
+    They also accept NumPy arrays whose first axis is the step axis,
+    which are converted to
+    [`ArrayIterator`][eerily.generators.utils.base.ArrayIterator]
+    so that the batch methods of the steppers take slices of the arrays.
+
     :param initial_state: the initial state, e.g., `np.array([1])`
     :param variable_name: variable names of the time series provided as a list.
     """
@@ -39,18 +50,77 @@ class StepperParams:
     initial_state: Any
     variable_names: List[Any]
 
+    _sources: ClassVar[Tuple[str, ...]] = ()
+
+    def __post_init__(self):
+        for name in self._sources:
+            object.__setattr__(self, name, as_source(getattr(self, name)))
+
 
 class BaseStepper(ABC, StepperOperator):
-    """A framework to evolve a DGP to the next step"""
+    """A framework to evolve a DGP to the next step
+
+    Besides iterating over the stepper step by step,
+    we can compute many steps at once using `take`,
+
+    ```python
+    stepper.take(1000)
+    ```
+
+    which returns an array whose first axis is the step, or
+    a dictionary of such arrays if the steps are dictionaries.
+    `take` falls back to calling `compute_step` repeatedly.
+    Steppers can implement a faster `compute_steps` that
+    draws the noises in batches.
+
+    !!! note "Copying the Output"
+        By default, each step returns a deep copy of the current state
+        so that the consumers can not modify the state of the stepper.
+        Deep copies are expensive compared to the steps themselves.
+        With `copy_output=False`, the arrays of the state are made read-only
+        and returned as views, and dictionaries as new dictionaries of
+        read-only values instead.
+
+    !!! note "Ensembles"
+        Steppers with array states can simulate `n_paths` independent paths
+        of the same process at once.
+        The initial state is repeated for each path, the state becomes an
+        array of shape `(n_paths, ...)`, and the noises are drawn for all
+        paths in one batch.
+        `take(n)` then returns an array of shape `(n, n_paths, ...)`.
+
+    :param model_params: the parameters of the model
+    :param length: the number of steps to generate
+    :param copy_output: whether to return deep copies of the state in each step
+    :param n_paths: number of independent paths to simulate,
+        `None` for a single path without the ensemble axis.
+    """
+
+    _supports_n_paths = False
 
     def __init__(
-        self, model_params: StepperParams, length: Optional[int] = None
+        self,
+        model_params: StepperParams,
+        length: Optional[int] = None,
+        copy_output: bool = True,
+        n_paths: Optional[int] = None,
     ) -> None:
         self.model_params = model_params
         self.current_state = copy.deepcopy(self.model_params.initial_state)
         self.length = length
+        self.copy_output = copy_output
+        self.n_paths = n_paths
         self._counter = 0
 
+        if n_paths is not None:
+            if not self._supports_n_paths:
+                raise NotImplementedError(
+                    f"{self.__class__.__name__} does not support n_paths"
+                )
+            self.current_state = np.repeat(
+                np.asarray(self.current_state)[np.newaxis, ...], n_paths, axis=0
+            )
+
     def __iter__(self):
         return self
 
@@ -75,10 +145,158 @@ class BaseStepper(ABC, StepperOperator):
     def __str__(self) -> str:
         return f"Model Parameters: {self.model_params}"
 
+    def take(self, n: int) -> Union[np.ndarray, Dict[Any, np.ndarray]]:
+        """Computes the next `n` steps at once.
+
+        The steps are counted in the same way as `next`,
+        so `take` and `next` can be interleaved.
+        If `length` is set, at most the remaining steps are computed.
+
+        :param n: number of steps to compute
+        """
+        n = self._steps_left(n)
+
+        steps = self.compute_steps(n)
+        self._counter += n
+
+        return steps
+
+    def _steps_left(self, n: int) -> int:
+        """Caps `n` at the number of steps left if `length` is set.
+
+        :param n: number of steps requested
+        """
+        if self.length is None:
+            logger.warning("length is not set")
+        else:
+            n = min(n, self.length - self._counter)
+
+        return max(n, 0)
+
+    def _draw_paths(self, iterator: Iterator, n: Optional[int] = None) -> np.ndarray:
+        """Draws the values of an iterator for all the paths of the ensemble.
+
+        The values are reshaped to the shape of the state,
+        with an extra leading step axis if `n` is specified.
+
+        :param iterator: the iterator to draw from
+        :param n: number of steps to draw, `None` for a single step
+        """
+        shape = np.shape(self.current_state)
+        if n is None:
+            return draw_batch(iterator, self.n_paths).reshape(shape)
+
+        return draw_batch(iterator, n * self.n_paths).reshape((n,) + shape)
+
+    def _output(self, state: Any) -> Any:
+        """Protects the state from the consumers before returning it.
+
+        :param state: the state to be returned by a step
+        """
+        if self.copy_output:
+            return copy.deepcopy(state)
+
+        return _read_only(state)
+
     @abstractmethod
     def compute_step(self):
         pass
 
+    def compute_steps(self, n: int) -> Union[np.ndarray, Dict[Any, np.ndarray]]:
+        """Computes the next `n` steps by calling `compute_step` `n` times.
+
+        Steppers override this method to compute the steps in batches.
+
+        :param n: number of steps to compute
+        """
+        steps = [self.compute_step() for _ in range(n)]
+
+        if steps and isinstance(steps[0], dict):
+            return {key: np.array([step[key] for step in steps]) for key in steps[0]}
+
+        return np.array(steps)
+
+
+def _take_columns(
+    stepper: Union[BaseStepper, SequentialStepper, MergedStepper], n: int
+) -> Dict[Any, np.ndarray]:
+    """Takes the next `n` steps of a stepper as a dictionary of columns.
+
+    Array steps are split into columns using the `variable_names` of the stepper.
+    For ensembles, the path axis is kept and the columns have the shape
+    `(n, n_paths)`.
+    The steppers of sequential and merged steppers are taken
+    in the same way, so no dictionary is created for the individual steps.
+
+    :param stepper: the stepper to take the steps from
+    :param n: number of steps to take
+    """
+    if isinstance(stepper, SequentialStepper):
+        return _take_sequential_columns(stepper, n)
+
+    if isinstance(stepper, MergedStepper):
+        columns: Dict[Any, np.ndarray] = {}
+        for child in stepper.iterators:
+            columns.update(_take_columns(child, n))
+        size = min([len(values) for values in columns.values()] + [n])
+        return {name: values[:size] for name, values in columns.items()}
+
+    steps = stepper.take(n)
+    if isinstance(steps, dict):
+        return steps
+
+    variable_names = stepper.model_params.variable_names
+    steps = np.asarray(steps)
+    # the axis of the steps, and of the paths for ensembles
+    leading = (
+        (len(steps),) if stepper.n_paths is None else (len(steps), stepper.n_paths)
+    )
+    if len(steps) == 0:
+        return {name: np.empty(leading) for name in variable_names}
+
+    state_shape = steps.shape[len(leading) :]
+    if state_shape == () and len(variable_names) == 1:
+        return {variable_names[0]: steps}
+
+    if state_shape != (len(variable_names),):
+        raise ValueError(
+            f"Can not split steps of shape {steps.shape} "
+            f"into the variables {variable_names}"
+            + ("" if stepper.n_paths is None else f" of {stepper.n_paths} paths")
+        )
+
+    return {name: steps[..., i] for i, name in enumerate(variable_names)}
+
+
+def _take_sequential_columns(
+    stepper: SequentialStepper, n: int
+) -> Dict[Any, np.ndarray]:
+    """Takes the next `n` steps of the steppers of a sequential stepper in turn,
+    moving on to the next stepper when one runs out of steps."""
+    chunks: List[Dict[Any, np.ndarray]] = []
+    taken = 0
+    for child in stepper.iterators:
+        if taken >= n:
+            break
+        columns = _take_columns(child, n - taken)
+        size = min([len(values) for values in columns.values()], default=0)
+        if size == 0:
+            continue
+        if chunks and columns.keys() != chunks[0].keys():
+            raise ValueError(
+                "The steppers of a sequence should have the same variables, got "
+                f"{list(chunks[0])} and {list(columns)}"
+            )
+        chunks.append({name: values[:size] for name, values in columns.items()})
+        taken += size
+
+    if not chunks:
+        return {}
+
+    return {
+        name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]
+    }
+
 
 class SequentialStepper(StepperOperator):
     def __init__(
@@ -87,9 +305,7 @@ class SequentialStepper(StepperOperator):
             Union[StepperOperator, BaseStepper, SequentialStepper, MergedStepper]
         ],
     ):
-        self.iterators: List[
-            Union[StepperOperator, BaseStepper, SequentialStepper, MergedStepper]
-        ] = []
+        self.iterators: List[Union[BaseStepper, SequentialStepper, MergedStepper]] = []
         self._length = 0
         for stepper in iterators:
             if isinstance(stepper, SequentialStepper):
@@ -122,9 +338,7 @@ class MergedStepper(StepperOperator):
             Union[StepperOperator, BaseStepper, SequentialStepper, MergedStepper]
         ],
     ):
-        self.iterators: List[
-            Union[StepperOperator, BaseStepper, SequentialStepper, MergedStepper]
-        ] = []
+        self.iterators: List[Union[BaseStepper, SequentialStepper, MergedStepper]] = []
         self._length = 0
         self._counter = 0
         for stepper in iterators:
@@ -157,6 +371,97 @@ class MergedStepper(StepperOperator):
             yield combined
             self._counter = idx
 
+    def _columns_length(self, n: Optional[int]) -> int:
+        lengths = [stepper.length for stepper in self.iterators]
+        if all([length is not None for length in lengths]):
+            return min(lengths) if n is None else min(lengths + [n])
+        if n is not None:
+            return min([length for length in lengths if length is not None] + [n])
+        raise ValueError("length is not set")
+
+    def iter_columns(
+        self, n: Optional[int] = None, chunk_size: int = 65536
+    ) -> Iterator[Dict[Any, np.ndarray]]:
+        """Generates the merged steps in chunks of one array per variable.
+
+        At most `chunk_size` steps are held in memory at a time,
+        so histories of any length can be streamed, e.g., to the writers in
+        [`eerily.generators.utils.writers`][eerily.generators.utils.writers].
+
+        ```python
+        for chunk in (es & ss & cs).iter_columns(n=10**8, chunk_size=10**6):
+            ...
+        ```
+
+        :param n: number of steps to generate, defaults to the length
+            of the merged stepper.
+        :param chunk_size: number of steps in each chunk.
+            The last chunk may be shorter.
+        """
+        length = self._columns_length(n)
+
+        taken = 0
+        while taken < length:
+            requested = min(chunk_size, length - taken)
+            chunk: Dict[Any, np.ndarray] = {}
+            for stepper in self.iterators:
+                chunk.update(_take_columns(stepper, requested))
+            size = min([len(values) for values in chunk.values()] + [requested])
+
+            yield {name: values[:size] for name, values in chunk.items()}
+            taken += size
+
+            if size < requested:
+                break
+
+    def to_columns(
+        self, n: Optional[int] = None, chunk_size: int = 65536
+    ) -> Dict[Any, np.ndarray]:
+        """Generates the merged steps as one array per variable.
+
+        The steppers are advanced `chunk_size` steps at a time
+        using their batch methods, and the steps are written into arrays
+        that are allocated once.
+        No dictionary is created for the individual steps.
+
+        ```python
+        merged = es & ss & cs
+        merged.to_columns()
+        ```
+
+        :param n: number of steps to generate, defaults to the length
+            of the merged stepper.
+        :param chunk_size: number of steps to take from the steppers at a time.
+        """
+        length = self._columns_length(n)
+
+        columns: Dict[Any, np.ndarray] = {}
+        filled = 0
+        for chunk in self.iter_columns(n=length, chunk_size=chunk_size):
+            size = min([len(values) for values in chunk.values()], default=0)
+            for name, values in chunk.items():
+                if name not in columns:
+                    columns[name] = np.empty(
+                        (length,) + values.shape[1:], dtype=values.dtype
+                    )
+                columns[name][filled : filled + size] = values
+            filled += size
+
+        return {name: values[:filled] for name, values in columns.items()}
+
+    def to_frame(
+        self, n: Optional[int] = None, chunk_size: int = 65536
+    ) -> pd.DataFrame:
+        """Generates the merged steps as a dataframe.
+
+        See [`to_columns`][eerily.generators.utils.stepper.MergedStepper.to_columns].
+
+        :param n: number of steps to generate, defaults to the length
+            of the merged stepper.
+        :param chunk_size: number of steps to take from the steppers at a time.
+        """
+        return pd.DataFrame(self.to_columns(n=n, chunk_size=chunk_size))
+
     @property
     def length(self):
         self._length = min([stepper.length for stepper in self.iterators])
@@ -0,0 +1,206 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from eerily.generators.utils.stepper import (
+    BaseStepper,
+    MergedStepper,
+    SequentialStepper,
+)
+
+
+class ChunkWriter(ABC):
+    """Writes the history of a stepper to disk in chunks.
+
+    The steps are generated `chunk_size` at a time with
+    [`MergedStepper.iter_columns`][eerily.generators.utils.stepper.MergedStepper.iter_columns]
+    and each chunk is written before the next one is generated,
+    so the memory does not grow with the length of the history.
+
+    ```python
+    writer = ParquetWriter("history.parquet", chunk_size=10**6)
+    writer(es & ss & cs, length=10**8)
+    ```
+
+    :param path: the file or directory to write to
+    :param chunk_size: number of steps to generate and write at a time
+    """
+
+    def __init__(self, path: Union[str, Path], chunk_size: int = 65536) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size should be positive, got {chunk_size}")
+        self.path = Path(path).expanduser()
+        self.chunk_size = chunk_size
+
+    def __call__(
+        self,
+        stepper: Union[BaseStepper, SequentialStepper, MergedStepper],
+        length: Optional[int] = None,
+    ) -> int:
+        """Generates and writes the history of a stepper.
+
+        :param stepper: the stepper, e.g., `es & ss` or `es + es2`
+        :param length: number of steps to write, defaults to the length
+            of the stepper.
+        :return: the number of steps written
+        """
+        chunks = MergedStepper([stepper]).iter_columns(  # type: ignore
+            n=length, chunk_size=self.chunk_size
+        )
+        return self.write_chunks(chunks)
+
+    @abstractmethod
+    def write_chunks(self, chunks: Iterable[Dict[Any, np.ndarray]]) -> int:
+        """Writes chunks of columns.
+
+        :param chunks: dictionaries of one array per variable
+        :return: the number of steps written
+        """
+        pass
+
+
+def _flat_columns(chunk: Dict[Any, np.ndarray]) -> Dict[str, np.ndarray]:
+    columns = {}
+    for name, values in chunk.items():
+        values = np.asarray(values)
+        if values.ndim != 1:
+            raise ValueError(
+                f"Can not write the variable {name} of shape {values.shape} "
+                "as a column, use NPZWriter instead"
+            )
+        columns[str(name)] = values
+
+    return columns
+
+
+class ParquetWriter(ChunkWriter):
+    """Writes the history of a stepper to a Parquet file,
+    one row group per chunk.
+
+    Requires pyarrow.
+
+    ```python
+    ParquetWriter("history.parquet", chunk_size=10**6)(stepper, length=10**8)
+    pd.read_parquet("history.parquet")
+    ```
+
+    :param path: the Parquet file
+    :param chunk_size: number of steps in each row group
+    :param compression: the compression codec of the file
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        chunk_size: int = 65536,
+        compression: str = "snappy",
+    ) -> None:
+        super().__init__(path, chunk_size=chunk_size)
+        self.compression = compression
+
+    def write_chunks(self, chunks: Iterable[Dict[Any, np.ndarray]]) -> int:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        rows = 0
+        try:
+            for chunk in chunks:
+                table = pa.table(_flat_columns(chunk))
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        self.path, table.schema, compression=self.compression
+                    )
+                else:
+                    table = table.cast(writer.schema)
+                if table.num_rows:
+                    writer.write_table(table, row_group_size=table.num_rows)
+                rows += table.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return rows
+
+
+class CSVWriter(ChunkWriter):
+    """Writes the history of a stepper to a CSV file,
+    appending one chunk at a time.
+
+    ```python
+    CSVWriter("history.csv")(stepper, length=10**7)
+    ```
+
+    :param path: the CSV file
+    :param chunk_size: number of steps to generate and write at a time
+    """
+
+    def write_chunks(self, chunks: Iterable[Dict[Any, np.ndarray]]) -> int:
+        rows = 0
+        with open(self.path, "w", newline="") as f:
+            for i, chunk in enumerate(chunks):
+                dataframe = pd.DataFrame(_flat_columns(chunk))
+                dataframe.to_csv(f, header=i == 0, index=False)
+                rows += len(dataframe)
+
+        return rows
+
+
+class NPZWriter(ChunkWriter):
+    """Writes the history of a stepper to a directory of `.npz` files,
+    one file per chunk.
+
+    The files are named `part-00000.npz`, `part-00001.npz`, ...,
+    and contain one array per variable.
+    Unlike Parquet and CSV, the variables may have several dimensions.
+    The parts of a previous history in the directory are removed first.
+
+    ```python
+    NPZWriter("history")(stepper, length=10**8)
+    for chunk in read_npz_chunks("history"):
+        ...
+    ```
+
+    :param path: the directory
+    :param chunk_size: number of steps in each file
+    :param compressed: whether to compress the files
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        chunk_size: int = 65536,
+        compressed: bool = False,
+    ) -> None:
+        super().__init__(path, chunk_size=chunk_size)
+        self.compressed = compressed
+
+    def write_chunks(self, chunks: Iterable[Dict[Any, np.ndarray]]) -> int:
+        self.path.mkdir(parents=True, exist_ok=True)
+        for part in self.path.glob("part-*.npz"):
+            part.unlink()
+
+        save = np.savez_compressed if self.compressed else np.savez
+        rows = 0
+        for i, chunk in enumerate(chunks):
+            arrays: Dict[str, Any] = {
+                str(name): values for name, values in chunk.items()
+            }
+            save(self.path / f"part-{i:05d}.npz", **arrays)
+            rows += min([len(values) for values in chunk.values()], default=0)
+
+        return rows
+
+
+def read_npz_chunks(path: Union[str, Path]) -> Iterator[Dict[str, np.ndarray]]:
+    """Reads the chunks written by
+    [`NPZWriter`][eerily.generators.utils.writers.NPZWriter] one at a time.
+
+    :param path: the directory
+    """
+    for part in sorted(Path(path).expanduser().glob("part-*.npz")):
+        with np.load(part) as data:
+            yield {name: data[name] for name in data.files}
@@ -1,11 +1,113 @@
-import copy
 from dataclasses import dataclass
-from typing import Iterator
+from functools import cached_property, lru_cache
+from typing import Any, Iterator, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
+from eerily.generators.utils.base import draw_batch
+from eerily.generators.utils.filters import ar_filter
+from eerily.generators.utils.noises import MultiGaussianNoise, noise_moments
 from eerily.generators.utils.stepper import BaseStepper, StepperParams
 
+try:
+    from scipy.linalg import solve_discrete_lyapunov
+except ImportError:  # pragma: no cover
+    solve_discrete_lyapunov = None
+
+
+def stationary_distribution(
+    phi0: Any, phi1: Any, noise_mean: Any, noise_cov: Any
+) -> Tuple[np.ndarray, np.ndarray]:
+    r"""The stationary distribution of the VAR(1) model
+
+    $$\mathbf s(t+1) = \boldsymbol\phi_0 + \boldsymbol\phi_1 \mathbf s(t) + \boldsymbol\epsilon,$$
+
+    with noise of mean $\boldsymbol\mu$ and covariance $\boldsymbol\Sigma$.
+    The stationary mean is
+
+    $$\bar{\mathbf s} = (\mathbf I - \boldsymbol\phi_1)^{-1} (\boldsymbol\phi_0 + \boldsymbol\mu)$$
+
+    and the stationary covariance $\boldsymbol\Gamma$ solves the discrete
+    Lyapunov equation
+
+    $$\boldsymbol\Gamma = \boldsymbol\phi_1 \boldsymbol\Gamma \boldsymbol\phi_1^T + \boldsymbol\Sigma.$$
+
+    The results are cached for each set of parameters.
+    AR(1) models are the special case with scalar parameters.
+
+    :param phi0: the constant $\boldsymbol\phi_0$
+    :param phi1: the coefficient $\boldsymbol\phi_1$
+    :param noise_mean: the mean of the noise $\boldsymbol\mu$
+    :param noise_cov: the covariance of the noise $\boldsymbol\Sigma$
+    :return: the stationary mean of shape `(d,)` and
+        covariance of shape `(d, d)`, both read-only.
+    :raises ValueError: if the spectral radius of $\boldsymbol\phi_1$
+        is not smaller than 1, i.e., the model is not stationary.
+    """
+    phi1 = np.atleast_2d(np.asarray(phi1, dtype=float))
+    d = phi1.shape[0]
+
+    return _stationary_distribution(
+        tuple(np.broadcast_to(np.asarray(phi0, dtype=float), (d,))),
+        tuple(map(tuple, phi1)),
+        tuple(np.broadcast_to(np.asarray(noise_mean, dtype=float), (d,))),
+        tuple(map(tuple, np.broadcast_to(np.asarray(noise_cov, dtype=float), (d, d)))),
+    )
+
+
+@lru_cache(maxsize=32)
+def _stationary_distribution(
+    phi0: Tuple[float, ...],
+    phi1: Tuple[Tuple[float, ...], ...],
+    noise_mean: Tuple[float, ...],
+    noise_cov: Tuple[Tuple[float, ...], ...],
+) -> Tuple[np.ndarray, np.ndarray]:
+    phi1_array = np.array(phi1)
+    noise_cov_array = np.array(noise_cov)
+    d = len(phi0)
+
+    spectral_radius = np.abs(np.linalg.eigvals(phi1_array)).max()
+    if spectral_radius >= 1:
+        raise ValueError(
+            "The model is not stationary: "
+            f"the spectral radius of phi1 is {spectral_radius}"
+        )
+
+    mean = np.linalg.solve(np.eye(d) - phi1_array, np.add(phi0, noise_mean))
+    if solve_discrete_lyapunov is not None:
+        cov = solve_discrete_lyapunov(phi1_array, noise_cov_array)
+    else:
+        cov = np.linalg.solve(
+            np.eye(d * d) - np.kron(phi1_array, phi1_array), noise_cov_array.ravel()
+        ).reshape(d, d)
+    cov = (cov + cov.T) / 2
+
+    mean.flags.writeable = False
+    cov.flags.writeable = False
+
+    return mean, cov
+
+
+def _stationary_state(
+    model_params: Union["ARModelParams", "VAR1ModelParams"],
+    n_paths: Optional[int],
+    seed: Optional[Any],
+) -> np.ndarray:
+    """Draws initial states from the stationary distribution of an AR(1)
+    or VAR(1) model."""
+    mean, cov = stationary_distribution(
+        model_params.phi0,
+        model_params.phi1,
+        *noise_moments(model_params.epsilon),
+    )
+    shape = np.shape(model_params.initial_state)
+    states = MultiGaussianNoise(mu=mean, cov=cov, seed=seed)
+
+    if n_paths is None:
+        return next(states).reshape(shape)
+
+    return states.next_batch(n_paths).reshape((n_paths,) + shape)
+
 
 @dataclass(frozen=True)
 class ARModelParams(StepperParams):
@@ -27,24 +129,163 @@ class ARModelParams(StepperParams):
     phi1: float
     epsilon: Iterator
 
+    _sources = ("epsilon",)
+
 
 class AR1Stepper(BaseStepper):
     """Stepper that calculates the next step in time in an AR model
 
+    With `stationary=True`, the initial state is drawn from the stationary
+    distribution of the model instead of `initial_state`,
+    see [`stationary_distribution`][eerily.generators.var.stationary_distribution],
+    so no burn-in steps are needed to forget the initial state.
+    Each path of an ensemble gets its own initial state.
+
     :param model_params: parameters for the AR model
+    :param stationary: whether to draw the initial state from
+        the stationary distribution
+    :param seed: seed of the RNG for the stationary initial state
     """
 
+    _supports_n_paths = True
+
+    def __init__(
+        self,
+        model_params: ARModelParams,
+        length: Optional[int] = None,
+        copy_output: bool = True,
+        n_paths: Optional[int] = None,
+        stationary: bool = False,
+        seed: Optional[Any] = None,
+    ) -> None:
+        super().__init__(
+            model_params, length=length, copy_output=copy_output, n_paths=n_paths
+        )
+        if stationary:
+            self.current_state = _stationary_state(model_params, n_paths, seed)
+
     def compute_step(self):
-        epsilon = next(self.model_params.epsilon)
+        if self.n_paths is None:
+            epsilon = next(self.model_params.epsilon)
+        else:
+            epsilon = self._draw_paths(self.model_params.epsilon)
 
+        # the same order of operations as the filter in compute_steps
         next_s = (
-            self.model_params.phi0
-            + self.model_params.phi1 * self.current_state
-            + epsilon
-        )
+            self.model_params.phi0 + epsilon
+        ) + self.model_params.phi1 * self.current_state
         self.current_state = next_s
 
-        return copy.deepcopy(self.current_state)
+        return self._output(self.current_state)
+
+    def compute_steps(self, n: int) -> np.ndarray:
+        if self.n_paths is None:
+            epsilon = draw_batch(self.model_params.epsilon, n)  # type: ignore
+        else:
+            epsilon = self._draw_paths(self.model_params.epsilon, n)  # type: ignore
+
+        state = np.asarray(self.current_state, dtype=float)
+        noise_shape = epsilon.shape[1:]
+        shape = np.broadcast_shapes(state.shape, noise_shape)
+        epsilon = epsilon.reshape(
+            (n,) + (1,) * (len(shape) - len(noise_shape)) + noise_shape
+        )
+
+        steps, history = ar_filter(
+            np.broadcast_to(
+                self.model_params.phi0 + epsilon, (n,) + shape  # type: ignore
+            ),
+            [self.model_params.phi1],  # type: ignore
+            np.broadcast_to(state, shape)[np.newaxis],
+        )
+        self.current_state = history[0]
+
+        return steps
+
+
+@dataclass(frozen=True)
+class ARpModelParams(StepperParams):
+    r"""Parameters of an AR(p) model,
+
+    $$s(t+1) = \phi_0 + \sum_{k=1}^p \phi_k s(t+1-k) + \epsilon.$$
+
+    :param phi0: $\phi_0$ in the AR model
+    :param phi: the lag coefficients $\phi_1, \cdots, \phi_p$
+    :param epsilon: noise iterator, e.g., Gaussian noise
+    :param initial_state: an array of the last $p$ values with the latest value last,
+        e.g., `np.array([0, 0])` for an AR(2) model
+    :param variable_names: variable names
+    """
+
+    phi0: float
+    phi: Sequence[float]
+    epsilon: Iterator
+
+    _sources = ("epsilon",)
+
+
+class ARpStepper(BaseStepper):
+    """Stepper that calculates the next step in time in an AR(p) model.
+
+    The state of the stepper is the last $p$ values of the series
+    and each step returns the new value.
+    AR(1) is the special case with one coefficient.
+
+    ```python
+    arp = ARpStepper(
+        model_params=ARpModelParams(
+            phi0=0.1,
+            phi=[0.5, -0.2, 0.1],
+            epsilon=GaussianNoise(mu=0, std=1, seed=42),
+            initial_state=np.array([0, 0, 0]),
+            variable_names=["s"],
+        )
+    )
+    arp.take(10_000_000)
+    ```
+
+    `take` draws the noise for all the steps at once and
+    applies the AR recursion as a linear filter, see
+    [`ar_filter`][eerily.generators.utils.filters.ar_filter].
+    The last $p$ values are kept so the next steps continue the series.
+
+    :param model_params: parameters for the AR(p) model, e.g.,
+        [`ARpModelParams`][eerily.generators.var.ARpModelParams]
+    """
+
+    _supports_n_paths = True
+
+    def compute_step(self):
+        if self.n_paths is None:
+            epsilon = next(self.model_params.epsilon)
+        else:
+            epsilon = draw_batch(self.model_params.epsilon, self.n_paths)
+        phi = np.asarray(self.model_params.phi, dtype=float)
+
+        history = np.asarray(self.current_state, dtype=float)
+        next_s = self.model_params.phi0 + history[..., ::-1] @ phi + epsilon
+        self.current_state = np.concatenate(
+            [history[..., 1:], np.expand_dims(next_s, -1)], axis=-1
+        )
+
+        return self._output(next_s)
+
+    def compute_steps(self, n: int) -> np.ndarray:
+        if self.n_paths is None:
+            epsilon = draw_batch(self.model_params.epsilon, n)  # type: ignore
+        else:
+            epsilon = draw_batch(
+                self.model_params.epsilon, n * self.n_paths  # type: ignore
+            ).reshape(n, self.n_paths)
+
+        steps, history = ar_filter(
+            self.model_params.phi0 + epsilon,  # type: ignore
+            self.model_params.phi,  # type: ignore
+            np.moveaxis(np.asarray(self.current_state, dtype=float), -1, 0),
+        )
+        self.current_state = np.moveaxis(history, 0, -1)
+
+        return steps
 
 
 @dataclass(frozen=True)
@@ -73,19 +314,199 @@ class VAR1ModelParams(StepperParams):
     phi1: np.ndarray
     epsilon: Iterator
 
+    _sources = ("epsilon",)
+
 
 class VAR1Stepper(BaseStepper):
     """Calculate the next values using VAR(1) model.
 
+    With `n_paths`, the state of shape `(n_paths, d)` is advanced
+    for all the paths with one matrix multiplication.
+
+    With `stationary=True`, the initial state is drawn from the stationary
+    distribution of the model instead of `initial_state`,
+    see [`stationary_distribution`][eerily.generators.var.stationary_distribution].
+
     :param model_params: the parameters of the VAR(1) model, e.g.,
         [`VAR1ModelParams`][eerily.generators.var.VAR1ModelParams]
+    :param stationary: whether to draw the initial state from
+        the stationary distribution
+    :param seed: seed of the RNG for the stationary initial state
     """
 
+    _supports_n_paths = True
+
+    def __init__(
+        self,
+        model_params: VAR1ModelParams,
+        length: Optional[int] = None,
+        copy_output: bool = True,
+        n_paths: Optional[int] = None,
+        stationary: bool = False,
+        seed: Optional[Any] = None,
+    ) -> None:
+        super().__init__(
+            model_params, length=length, copy_output=copy_output, n_paths=n_paths
+        )
+        if stationary:
+            self.current_state = _stationary_state(model_params, n_paths, seed)
+
     def compute_step(self):
-        epsilon = next(self.model_params.epsilon)
         phi0 = self.model_params.phi0
         phi1 = self.model_params.phi1
 
-        self.current_state = phi0 + np.matmul(phi1, self.current_state) + epsilon
+        if self.n_paths is None:
+            epsilon = next(self.model_params.epsilon)
+        else:
+            epsilon = self._draw_paths(self.model_params.epsilon)
+        # the same order of operations as compute_steps
+        self.current_state = np.asarray(self.current_state, dtype=float) @ phi1.T + (
+            phi0 + epsilon
+        )
+
+        return self._output(self.current_state)
+
+    def compute_steps(self, n: int) -> np.ndarray:
+        state = np.asarray(self.current_state, dtype=float)
+        if n == 0:
+            return np.empty((0,) + state.shape)
+
+        if self.n_paths is None:
+            epsilon = draw_batch(self.model_params.epsilon, n)  # type: ignore
+        else:
+            epsilon = self._draw_paths(self.model_params.epsilon, n)  # type: ignore
+
+        phi1_t = np.asarray(self.model_params.phi1, dtype=float).T  # type: ignore
+        inputs = self.model_params.phi0 + epsilon  # type: ignore
+        steps = np.empty((n,) + np.broadcast_shapes(state.shape, inputs.shape[1:]))
+        for t in range(n):
+            np.matmul(state, phi1_t, out=steps[t])
+            steps[t] += inputs[t]
+            state = steps[t]
+        self.current_state = state.copy()
+
+        return steps
+
+
+@dataclass(frozen=True)
+class VARpModelParams(StepperParams):
+    r"""Parameters of a VAR(p) model,
+
+    $$\mathbf s(t+1) = \boldsymbol\phi_0 + \sum_{k=1}^p \boldsymbol\phi_k \mathbf s(t+1-k) + \boldsymbol\epsilon.$$
+
+    :param phi0: the constant vector $\boldsymbol\phi_0$ of shape `(d,)`
+    :param phi: the lag matrices $\boldsymbol\phi_1, \cdots, \boldsymbol\phi_p$,
+        each of shape `(d, d)`
+    :param epsilon: noise iterator, e.g.,
+        [`MultiGaussianNoise`][eerily.generators.utils.noises.MultiGaussianNoise]
+    :param initial_state: an array of shape `(p, d)` of the last $p$ states
+        with the latest state last
+    :param variable_names: variable names of the $d$ variables
+    """
+
+    phi0: np.ndarray
+    phi: Sequence[np.ndarray]
+    epsilon: Iterator
+
+    _sources = ("epsilon",)
+
+
+class VARpStepper(BaseStepper):
+    r"""Calculate the next values using VAR(p) model.
+
+    The VAR(p) model is written as a VAR(1) model of the stacked state
+    $\mathbf z(t) = (\mathbf s(t), \cdots, \mathbf s(t-p+1))$,
+
+    $$\mathbf z(t+1) = \mathbf c + \mathbf F \mathbf z(t) + \mathbf e,$$
+
+    where the companion matrix
+
+    $$
+    \mathbf F = \begin{pmatrix}
+    \boldsymbol\phi_1 & \boldsymbol\phi_2 & \cdots & \boldsymbol\phi_p \\
+    \mathbf I & 0 & \cdots & 0 \\
+    \vdots & \ddots & \ddots & \vdots \\
+    0 & \cdots & \mathbf I & 0
+    \end{pmatrix}
+    $$
+
+    is built once.
+    `take` draws the noises for all the steps at once and
+    each step is one matrix multiplication, also for all the paths
+    of an ensemble.
+
+    ```python
+    varp = VARpStepper(
+        model_params=VARpModelParams(
+            phi0=np.zeros(2),
+            phi=[np.eye(2) * 0.5, np.eye(2) * 0.2],
+            epsilon=MultiGaussianNoise(mu=np.zeros(2), cov=np.eye(2), seed=42),
+            initial_state=np.zeros((2, 2)),
+            variable_names=["s1", "s2"],
+        ),
+        n_paths=1000,
+    )
+    varp.take(100)
+    ```
+
+    :param model_params: the parameters of the VAR(p) model, e.g.,
+        [`VARpModelParams`][eerily.generators.var.VARpModelParams]
+    """
+
+    _supports_n_paths = True
+
+    @cached_property
+    def companion(self) -> np.ndarray:
+        """The companion matrix $\\mathbf F$."""
+        phi = [
+            np.asarray(phi_k, dtype=float)
+            for phi_k in self.model_params.phi  # type: ignore
+        ]
+        d = phi[0].shape[0]
+        p = len(phi)
+
+        companion = np.zeros((d * p, d * p))
+        companion[:d] = np.concatenate(phi, axis=1)
+        companion[d:, :-d] = np.eye(d * (p - 1))
+
+        return companion
+
+    def _stacked_state(self) -> np.ndarray:
+        state = np.asarray(self.current_state, dtype=float)
+        return state[..., ::-1, :].reshape(state.shape[:-2] + (-1,))
+
+    def _unstack_state(self, stacked: np.ndarray) -> np.ndarray:
+        p = len(self.model_params.phi)  # type: ignore
+        return stacked.reshape(stacked.shape[:-1] + (p, -1))[..., ::-1, :]
+
+    def compute_step(self):
+        if self.n_paths is None:
+            epsilon = next(self.model_params.epsilon)
+        else:
+            epsilon = draw_batch(self.model_params.epsilon, self.n_paths)
+        d = self.companion.shape[0] // len(self.model_params.phi)
+
+        stacked = self._stacked_state() @ self.companion.T
+        stacked[..., :d] += self.model_params.phi0 + epsilon
+        self.current_state = self._unstack_state(stacked)
+
+        return self._output(stacked[..., :d])
+
+    def compute_steps(self, n: int) -> np.ndarray:
+        d = self.companion.shape[0] // len(self.model_params.phi)  # type: ignore
+        paths = () if self.n_paths is None else (self.n_paths,)
+        epsilon = draw_batch(
+            self.model_params.epsilon, n * int(np.prod(paths))  # type: ignore
+        ).reshape((n,) + paths + (d,))
+        shocks = self.model_params.phi0 + epsilon  # type: ignore
+        companion_t = self.companion.T
+
+        stacked = self._stacked_state()
+        steps = np.empty(shocks.shape)
+        for t in range(n):
+            stacked = stacked @ companion_t
+            stacked[..., :d] += shocks[t]
+            steps[t] = stacked[..., :d]
+        self.current_state = self._unstack_state(stacked)
 
-        return copy.deepcopy(self.current_state)
+        return steps
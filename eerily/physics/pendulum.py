@@ -1,24 +1,233 @@
 import math
 from functools import cached_property
-from typing import Dict, List
+from typing import Dict, List, Literal, Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from eerily.generators.utils.cache import MemoryCache, hash_key, memory_cache
+
+PendulumMethod = Literal["small_angle", "rk4", "symplectic"]
+
+
+def pendulum_angles(
+    lengths: ArrayLike,
+    initial_angles: ArrayLike,
+    time_step: ArrayLike,
+    num_steps: int,
+    gravity: float = 9.81,
+    method: PendulumMethod = "small_angle",
+    substeps: int = 1,
+) -> np.ndarray:
+    r"""Calculates the angles of many pendulums at once.
+
+    The pendulums are released at rest from the initial angles and follow
+
+    $$\ddot\theta = - \frac{g}{l} \sin\theta.$$
+
+    - `"small_angle"`: the solution of the small angle approximation
+      $\sin\theta\approx\theta$,
+      $\theta(t) = \theta_0 \cos(\sqrt{g/l}\, t)$,
+      evaluated for all the steps at once.
+    - `"rk4"`: the nonlinear equation integrated with the
+      fourth order Runge-Kutta method.
+    - `"symplectic"`: the nonlinear equation integrated with the
+      velocity Verlet method, which conserves the energy in the long run.
+
+    The integrators advance all the pendulums together,
+    each step being a few vectorized operations.
+
+    ```python
+    pendulum_angles(
+        lengths=np.array([0.5, 1.0, 2.0]),
+        initial_angles=np.array([0.1, 1.0, 3.0]),
+        time_step=0.01,
+        num_steps=1000,
+        method="rk4",
+    )
+    ```
+
+    :param lengths: lengths of the pendulums
+    :param initial_angles: initial angles of the pendulums
+    :param time_step: time between two samples,
+        either shared or one for each pendulum
+    :param num_steps: number of samples
+    :param gravity: acceleration due to gravity
+    :param method: `"small_angle"`, `"rk4"`, or `"symplectic"`
+    :param substeps: number of integration steps between two samples
+    :return: the angles of shape `(num_steps, number of pendulums)`,
+        or `(num_steps,)` for scalar parameters
+    """
+    lengths, initial_angles, time_step = np.broadcast_arrays(
+        np.asarray(lengths, dtype=float),
+        np.asarray(initial_angles, dtype=float),
+        np.asarray(time_step, dtype=float),
+    )
+    omega_squared = gravity / lengths
+
+    if method == "small_angle":
+        steps = np.arange(num_steps).reshape((-1,) + (1,) * lengths.ndim)
+        return initial_angles * np.cos(np.sqrt(omega_squared) * steps * time_step)
+
+    if method == "rk4":
+        integrate = _rk4_step
+    elif method == "symplectic":
+        integrate = _verlet_step
+    else:
+        raise ValueError(f"Unknown method: {method}")
+
+    if substeps < 1:
+        raise ValueError(f"substeps should be positive, got {substeps}")
+    dt = time_step / substeps
+
+    theta = initial_angles.copy()
+    omega = np.zeros_like(theta)
+    angles = np.empty((num_steps,) + theta.shape)
+    for i in range(num_steps):
+        angles[i] = theta
+        for _ in range(substeps):
+            theta, omega = integrate(theta, omega, dt, omega_squared)
+
+    return angles
+
+
+def _rk4_step(
+    theta: np.ndarray, omega: np.ndarray, dt: np.ndarray, omega_squared: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    k1_theta = omega
+    k1_omega = -omega_squared * np.sin(theta)
+    k2_theta = omega + dt / 2 * k1_omega
+    k2_omega = -omega_squared * np.sin(theta + dt / 2 * k1_theta)
+    k3_theta = omega + dt / 2 * k2_omega
+    k3_omega = -omega_squared * np.sin(theta + dt / 2 * k2_theta)
+    k4_theta = omega + dt * k3_omega
+    k4_omega = -omega_squared * np.sin(theta + dt * k3_theta)
+
+    return (
+        theta + dt / 6 * (k1_theta + 2 * k2_theta + 2 * k3_theta + k4_theta),
+        omega + dt / 6 * (k1_omega + 2 * k2_omega + 2 * k3_omega + k4_omega),
+    )
+
+
+def _verlet_step(
+    theta: np.ndarray, omega: np.ndarray, dt: np.ndarray, omega_squared: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    omega_half = omega - dt / 2 * omega_squared * np.sin(theta)
+    theta = theta + dt * omega_half
+
+    return theta, omega_half - dt / 2 * omega_squared * np.sin(theta)
 
 
 class Pendulum:
     """Class for generating time series data for a pendulum.
 
+    ```python
+    pendulum = Pendulum(length=1.0)
+    pendulum.generate(num_periods=10, num_samples_per_period=100)
+    ```
+
+    For large initial angles, the small angle approximation is not valid
+    and the nonlinear equation can be integrated instead,
+
+    ```python
+    pendulum.generate(
+        num_periods=10, num_samples_per_period=100,
+        initial_angle=2.0, method="symplectic", substeps=10,
+    )
+    ```
+
+    To simulate many pendulums at once, use
+    [`pendulum_angles`][eerily.physics.pendulum.pendulum_angles].
+
+    The generated data only depends on the parameters and is memoized in
+    [`memory_cache`][eerily.generators.utils.cache.MemoryCache] by default.
+
     :param length: Length of the pendulum.
     :param gravity: Acceleration due to gravity.
+    :param cache: the cache of the generated data, `None` to disable caching.
     """
 
-    def __init__(self, length: float, gravity: float = 9.81) -> None:
+    def __init__(
+        self,
+        length: float,
+        gravity: float = 9.81,
+        cache: Optional[MemoryCache] = memory_cache,
+    ) -> None:
         self.length = length
         self.gravity = gravity
+        self.cache = cache
 
     @cached_property
     def period(self) -> float:
         """Calculate the period of the pendulum."""
         return 2 * math.pi * math.sqrt(self.length / self.gravity)
 
+    def generate(
+        self,
+        num_periods: int,
+        num_samples_per_period: int,
+        initial_angle: float = 0.1,
+        method: PendulumMethod = "small_angle",
+        substeps: int = 1,
+    ) -> Dict[str, np.ndarray]:
+        """Generate time series data for the pendulum as arrays.
+
+        The period is the period in the small angle approximation.
+        The arrays are read-only if they are cached.
+
+        :param num_periods: Number of periods to generate.
+        :param num_samples_per_period: Number of samples per period.
+        :param initial_angle: Initial angle of the pendulum.
+        :param method: `"small_angle"`, `"rk4"`, or `"symplectic"`, see
+            [`pendulum_angles`][eerily.physics.pendulum.pendulum_angles].
+        :param substeps: number of integration steps between two samples
+        """
+        if self.cache is None:
+            return self._generate(
+                num_periods, num_samples_per_period, initial_angle, method, substeps
+            )
+
+        key = hash_key(
+            "Pendulum.generate",
+            self.length,
+            self.gravity,
+            num_periods,
+            num_samples_per_period,
+            initial_angle,
+            method,
+            substeps,
+        )
+        return self.cache.get_or_create(  # type: ignore
+            key,
+            lambda: self._generate(
+                num_periods, num_samples_per_period, initial_angle, method, substeps
+            ),
+        )
+
+    def _generate(
+        self,
+        num_periods: int,
+        num_samples_per_period: int,
+        initial_angle: float,
+        method: PendulumMethod,
+        substeps: int,
+    ) -> Dict[str, np.ndarray]:
+        time_step = self.period / num_samples_per_period
+        num_steps = num_periods * num_samples_per_period
+
+        return {
+            "t": np.arange(num_steps) * time_step,
+            "theta": pendulum_angles(
+                lengths=self.length,
+                initial_angles=initial_angle,
+                time_step=time_step,
+                num_steps=num_steps,
+                gravity=self.gravity,
+                method=method,
+                substeps=substeps,
+            ),
+        }
+
     def __call__(
         self, num_periods: int, num_samples_per_period: int, initial_angle: float = 0.1
     ) -> Dict[str, List[float]]:
@@ -26,19 +235,13 @@ class Pendulum:
 
         Returns a list of floats representing the angle
         of the pendulum at each time step.
+        Use [`generate`][eerily.physics.pendulum.Pendulum.generate]
+        to get arrays instead.
 
         :param num_periods: Number of periods to generate.
         :param num_samples_per_period: Number of samples per period.
         :param initial_angle: Initial angle of the pendulum.
         """
-        time_step = self.period / num_samples_per_period
-        steps = []
-        time_series = []
-        for i in range(num_periods * num_samples_per_period):
-            t = i * time_step
-            # angle = self.length * math.cos(2 * math.pi * t / self.period)
-            angle = initial_angle * math.cos(2 * math.pi * t / self.period)
-            steps.append(t)
-            time_series.append(angle)
-
-        return {"t": steps, "theta": time_series}
+        data = self.generate(num_periods, num_samples_per_period, initial_angle)
+
+        return {key: value.tolist() for key, value in data.items()}
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+import torch
+from torch.utils.data import BatchSampler, DataLoader, SequentialSampler
+
+from eerily.datasets.generators import SinTimeSeriesDataset
+
+
+def test_sin_time_series_dataset():
+    dataset = SinTimeSeriesDataset(100, 5, 1, 3)
+
+    inputs, targets = dataset[10]
+
+    assert len(dataset) == 95
+    assert dataset.data.shape == (3, 101)
+    assert inputs.shape == (3, 5)
+    assert targets.shape == (3, 1)
+    torch.testing.assert_close(inputs[1], torch.sin(torch.arange(11.0, 16.0)))
+    torch.testing.assert_close(targets[1], torch.sin(torch.tensor([16.0])))
+    assert (
+        inputs.untyped_storage().data_ptr() == dataset.data.untyped_storage().data_ptr()
+    )
+
+
+@pytest.mark.parametrize("index", [np.int64(3), torch.tensor(3)])
+def test_sin_time_series_dataset_scalar_index(index):
+    dataset = SinTimeSeriesDataset(100, 5, 1, 3)
+
+    inputs, targets = dataset[index]
+
+    assert inputs.shape == (3, 5)
+    assert targets.shape == (3, 1)
+    torch.testing.assert_close(inputs, dataset[3][0])
+    torch.testing.assert_close(targets, dataset[3][1])
+
+
+def test_sin_time_series_dataset_batch():
+    dataset = SinTimeSeriesDataset(50, 10, 2, 4)
+
+    inputs, targets = dataset[[3, 0, 7]]
+
+    assert inputs.shape == (3, 4, 10)
+    assert targets.shape == (3, 4, 2)
+    for i, index in enumerate([3, 0, 7]):
+        torch.testing.assert_close(inputs[i], dataset[index][0])
+        torch.testing.assert_close(targets[i], dataset[index][1])
+
+
+def test_sin_time_series_dataset_dataloader():
+    dataset = SinTimeSeriesDataset(50, 10, 2, 4)
+
+    batches = list(DataLoader(dataset, batch_size=8))
+    batched = list(
+        DataLoader(
+            dataset,
+            sampler=BatchSampler(
+                SequentialSampler(dataset), batch_size=8, drop_last=False
+            ),
+            batch_size=None,
+        )
+    )
+
+    assert len(batches) == len(batched) == 5
+    for (inputs, targets), (batch_inputs, batch_targets) in zip(batches, batched):
+        torch.testing.assert_close(inputs, batch_inputs)
+        torch.testing.assert_close(targets, batch_targets)
+    assert batches[0][0].shape == (8, 4, 10)
+    torch.testing.assert_close(batches[1][0][0], dataset[8][0])
@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+import torch
+from torch.utils.data import DataLoader
+
+from eerily.datasets.windows import StreamingWindowDataset
+from eerily.generators.spec import IteratorSpec, StepperSpec
+
+
+@pytest.fixture
+def var_spec():
+    return StepperSpec(
+        stepper="VAR1Stepper",
+        params={
+            "delta_t": 0.1,
+            "phi0": np.array([0.1, 0.1]),
+            "phi1": np.array([[0.5, -0.25], [-0.35, 0.65]]),
+            "epsilon": IteratorSpec(
+                "MultiGaussianNoise", {"mu": np.zeros(2), "cov": np.eye(2)}
+            ),
+            "initial_state": np.array([1.0, 0.0]),
+            "variable_names": ["s1", "s2"],
+        },
+    )
+
+
+def collect(loader):
+    inputs, targets = zip(*loader)
+    return torch.cat(inputs), torch.cat(targets)
+
+
+def test_streaming_window_dataset(var_spec):
+    dataset = StreamingWindowDataset(
+        var_spec,
+        input_length=10,
+        prediction_length=2,
+        series_length=50,
+        stride=2,
+        n_series=3,
+        seed=42,
+    )
+
+    windows = list(dataset)
+    inputs, targets = windows[0]
+
+    assert len(windows) == 3 * 20
+    assert inputs.shape == (10, 2)
+    assert targets.shape == (2, 2)
+    torch.testing.assert_close(windows[1][0][:8], inputs[2:])
+
+    series = var_spec.build(seed=np.random.SeedSequence(42).spawn(3)[1]).take(50)
+    torch.testing.assert_close(
+        windows[20][0], torch.as_tensor(series[:10], dtype=torch.float32)
+    )
+
+
+def test_streaming_window_dataset_batches(var_spec):
+    dataset = StreamingWindowDataset(
+        var_spec,
+        input_length=10,
+        prediction_length=2,
+        series_length=50,
+        n_series=3,
+        seed=42,
+        batch_size=32,
+    )
+    single = StreamingWindowDataset(
+        var_spec,
+        input_length=10,
+        prediction_length=2,
+        series_length=50,
+        n_series=3,
+        seed=42,
+    )
+
+    batches = list(dataset)
+    inputs, targets = collect(DataLoader(single, batch_size=32))
+
+    assert [len(b[0]) for b in batches] == [32] * 3 + [3 * 39 - 96]
+    torch.testing.assert_close(torch.cat([b[0] for b in batches]), inputs)
+    torch.testing.assert_close(torch.cat([b[1] for b in batches]), targets)
+
+
+def test_streaming_window_dataset_workers(var_spec):
+    dataset = StreamingWindowDataset(
+        var_spec,
+        input_length=5,
+        prediction_length=1,
+        series_length=20,
+        n_series=4,
+        seed=42,
+        batch_size=16,
+    )
+
+    inputs, _ = collect(DataLoader(dataset, batch_size=None))
+    worker_inputs, _ = collect(DataLoader(dataset, batch_size=None, num_workers=2))
+
+    assert len(worker_inputs) == len(inputs) == 4 * 15
+    torch.testing.assert_close(
+        worker_inputs[torch.argsort(worker_inputs[:, 0, 0])],
+        inputs[torch.argsort(inputs[:, 0, 0])],
+    )
+
+
+def test_streaming_window_dataset_n_paths(var_spec):
+    spec = StepperSpec(var_spec.stepper, var_spec.params, n_paths=4)
+    dataset = StreamingWindowDataset(
+        spec,
+        input_length=5,
+        prediction_length=1,
+        series_length=20,
+        n_series=2,
+        seed=42,
+        batch_size=1000,
+    )
+
+    ((inputs, targets),) = list(dataset)
+    paths = spec.build(seed=np.random.SeedSequence(42).spawn(1)[0]).take(20)
+
+    assert inputs.shape == (2 * 4 * 15, 5, 2)
+    torch.testing.assert_close(
+        inputs[15], torch.as_tensor(paths[:5, 1], dtype=torch.float32)
+    )
+
+
+def test_streaming_window_dataset_endless(var_spec):
+    dataset = StreamingWindowDataset(
+        var_spec, input_length=5, prediction_length=1, series_length=10, seed=42
+    )
+
+    windows = iter(dataset)
+
+    assert len([next(windows) for _ in range(100)]) == 100
@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+import torch
+from torch.utils.data import DataLoader
+
+from eerily.datasets.windows import WindowDataset
+from eerily.generators.naive import SequenceStepper, SequenceStepperParams
+from eerily.generators.utils.noises import MultiGaussianNoise
+from eerily.generators.var import VAR1ModelParams, VAR1Stepper
+
+
+@pytest.fixture
+def sequence_stepper():
+    return SequenceStepper(
+        model_params=SequenceStepperParams(
+            initial_state=[0], variable_names=["t"], step_sizes=[1]
+        ),
+        length=100,
+    )
+
+
+@pytest.fixture
+def var_stepper():
+    return VAR1Stepper(
+        model_params=VAR1ModelParams(
+            delta_t=0.1,
+            phi0=np.array([0.1, 0.1]),
+            phi1=np.array([[0.5, -0.25], [-0.35, 0.65]]),
+            epsilon=MultiGaussianNoise(mu=np.zeros(2), cov=np.eye(2), seed=42),
+            initial_state=np.array([1, 0]),
+            variable_names=["s1", "s2"],
+        ),
+        length=100,
+    )
+
+
+def test_window_dataset_stepper(var_stepper, sequence_stepper):
+    dataset = WindowDataset(
+        var_stepper & sequence_stepper, input_length=10, prediction_length=2
+    )
+
+    inputs, targets = dataset[5]
+
+    assert dataset.variable_names == ["s1", "s2", "t"]
+    assert dataset.data.shape == (100, 3)
+    assert dataset.data.dtype == torch.float32
+    assert len(dataset) == 89
+    assert inputs.shape == (10, 3)
+    assert targets.shape == (2, 3)
+    torch.testing.assert_close(inputs[:, 2], torch.arange(6.0, 16.0))
+    torch.testing.assert_close(targets[:, 2], torch.tensor([16.0, 17.0]))
+    assert (
+        inputs.untyped_storage().data_ptr() == dataset.data.untyped_storage().data_ptr()
+    )
+
+
+@pytest.mark.parametrize("stride", [1, 3])
+def test_window_dataset_array(stride):
+    data = np.arange(40.0).reshape(20, 2)
+
+    dataset = WindowDataset(data, input_length=4, prediction_length=1, stride=stride)
+    inputs, targets = dataset[[0, 2]]
+
+    assert len(dataset) == (20 - 5) // stride + 1
+    assert inputs.shape == (2, 4, 2)
+    torch.testing.assert_close(
+        inputs[1], torch.tensor(data[2 * stride : 2 * stride + 4], dtype=torch.float32)
+    )
+    torch.testing.assert_close(
+        targets[1],
+        torch.tensor(data[2 * stride + 4 : 2 * stride + 5], dtype=torch.float32),
+    )
+
+
+def test_window_dataset_columns_dataloader():
+    columns = {"a": np.arange(30), "b": -np.arange(30)}
+    dataset = WindowDataset(columns, input_length=5, prediction_length=2, stride=2)
+
+    inputs, targets = next(iter(DataLoader(dataset, batch_size=4)))
+
+    assert inputs.shape == (4, 5, 2)
+    assert targets.shape == (4, 2, 2)
+    torch.testing.assert_close(inputs[3], dataset[3][0])
+    torch.testing.assert_close(targets[3, :, 1], -torch.tensor([11.0, 12.0]))
+
+
+def test_window_dataset_too_short():
+    with pytest.raises(ValueError):
+        WindowDataset(np.zeros((5, 1)), input_length=5, prediction_length=1)
+
+
+@pytest.mark.parametrize("index", [np.int64(2), torch.tensor(2)])
+def test_window_dataset_scalar_index(index):
+    dataset = WindowDataset(np.arange(20.0), input_length=4, prediction_length=2)
+
+    inputs, targets = dataset[index]
+
+    assert inputs.shape == (4, 1)
+    torch.testing.assert_close(inputs, dataset[2][0])
+    torch.testing.assert_close(targets, dataset[2][1])
+
+
+def test_window_dataset_ensemble():
+    stepper = VAR1Stepper(
+        model_params=VAR1ModelParams(
+            delta_t=0.1,
+            phi0=np.array([0.1, 0.1]),
+            phi1=np.array([[0.5, -0.25], [-0.35, 0.65]]),
+            epsilon=MultiGaussianNoise(mu=np.zeros(2), cov=np.eye(2), seed=42),
+            initial_state=np.array([1, 0]),
+            variable_names=["s1", "s2"],
+        ),
+        length=20,
+        n_paths=3,
+    )
+
+    with pytest.raises(ValueError):
+        WindowDataset(stepper, input_length=4, prediction_length=1)
@@ -3,7 +3,7 @@ import pandas as pd
 import pytest
 
 from eerily.generators.brownian import BrownianMotionParams, BrownianMotionStepper
-from eerily.generators.utils.noises import GaussianNoise
+from eerily.generators.utils.noises import GaussianNoise, MultiGaussianNoise
 
 
 @pytest.fixture
@@ -50,3 +50,188 @@ def test_brownian_motion_stepper(brownian_motion_stepper, length):
     )
 
     np.testing.assert_allclose(container, container_truth)
+
+
+@pytest.fixture
+def damped_brownian_motion_params(seed):
+    def model_params(mu=0, std=1, cov=None, **kwargs):
+        params = dict(
+            gamma=0.5,
+            delta_t=0.1,
+            force_densities=(
+                GaussianNoise(mu=mu, std=std, seed=seed)
+                if cov is None
+                else MultiGaussianNoise(mu=mu, cov=cov, seed=seed)
+            ),
+            initial_state=np.array([1.0]),
+            variable_names=["v"],
+        )
+        params.update(kwargs)
+        return BrownianMotionParams(**params)
+
+    return model_params
+
+
+def test_brownian_motion_stepper_take(damped_brownian_motion_params, length):
+    scalar_stepper = BrownianMotionStepper(model_params=damped_brownian_motion_params())
+    expected = np.array([next(scalar_stepper) for _ in range(length)])
+
+    stepper = BrownianMotionStepper(
+        model_params=damped_brownian_motion_params(), length=length
+    )
+    values = np.concatenate([stepper.take(3), [next(stepper)], stepper.take(100)])
+
+    assert values.shape == (length, 1)
+    np.testing.assert_array_equal(values, expected)
+
+
+def test_brownian_motion_stepper_no_copy(brownian_motion_params):
+    stepper = BrownianMotionStepper(
+        model_params=brownian_motion_params, copy_output=False
+    )
+
+    first = next(stepper)
+
+    assert not first.flags.writeable
+    with pytest.raises(ValueError):
+        first += 1
+    with pytest.raises(ValueError):
+        first.flags.writeable = True
+    assert not stepper.current_state.flags.writeable
+    np.testing.assert_allclose(first, [0.030471707975443137])
+    np.testing.assert_allclose(next(stepper), [-0.07352670264860642])
+
+
+def test_brownian_motion_stepper_n_paths(damped_brownian_motion_params, seed, length):
+    scalar_stepper = BrownianMotionStepper(
+        model_params=damped_brownian_motion_params(), n_paths=4
+    )
+    expected = np.array([next(scalar_stepper) for _ in range(length)])
+
+    values = BrownianMotionStepper(
+        model_params=damped_brownian_motion_params(), n_paths=4
+    ).take(length)
+    empty = BrownianMotionStepper(
+        model_params=damped_brownian_motion_params(), n_paths=4
+    ).take(0)
+
+    assert values.shape == (length, 4, 1)
+    np.testing.assert_array_equal(values, expected)
+    assert empty.shape == (0, 4, 1)
+    np.testing.assert_allclose(
+        values[0, :, 0],
+        0.95 + 0.1 * GaussianNoise(mu=0, std=1, seed=seed).next_batch(4),
+    )
+
+
+def test_brownian_motion_params_method(damped_brownian_motion_params):
+    with pytest.raises(ValueError):
+        damped_brownian_motion_params(method="midpoint")
+
+
+@pytest.mark.parametrize("n_paths", [None, 4])
+@pytest.mark.parametrize("initial_state", [np.array([1.0]), np.array([1.0, 0, -1])])
+def test_brownian_motion_stepper_exact_take(
+    damped_brownian_motion_params, length, n_paths, initial_state
+):
+    model_params = dict(
+        mu=0.3,
+        delta_t=2.0,
+        initial_state=initial_state,
+        variable_names=[f"v{i}" for i in range(len(initial_state))],
+        method="exact",
+    )
+
+    scalar_stepper = BrownianMotionStepper(
+        model_params=damped_brownian_motion_params(**model_params), n_paths=n_paths
+    )
+    expected = np.array([next(scalar_stepper) for _ in range(length)])
+
+    batch_stepper = BrownianMotionStepper(
+        model_params=damped_brownian_motion_params(**model_params), n_paths=n_paths
+    )
+    values = np.concatenate(
+        [batch_stepper.take(4), [next(batch_stepper)], batch_stepper.take(length - 5)]
+    )
+
+    shape = (
+        np.shape(initial_state) if n_paths is None else (n_paths, len(initial_state))
+    )
+    assert values.shape == (length,) + shape
+    np.testing.assert_allclose(values, expected, atol=1e-12)
+    np.testing.assert_allclose(
+        batch_stepper.current_state, scalar_stepper.current_state, atol=1e-12
+    )
+    # the components and paths get their own force densities
+    assert len(np.unique(values[-1])) == np.prod(shape)
+
+
+@pytest.mark.parametrize("method", ["euler", "exact"])
+@pytest.mark.parametrize("n_paths", [None, 4])
+def test_brownian_motion_stepper_vector_force(
+    damped_brownian_motion_params, seed, length, method, n_paths
+):
+    model_params = dict(
+        mu=np.array([0.1, -0.1]),
+        cov=np.eye(2),
+        initial_state=np.zeros(2),
+        variable_names=["v1", "v2"],
+        method=method,
+    )
+
+    scalar_stepper = BrownianMotionStepper(
+        model_params=damped_brownian_motion_params(**model_params), n_paths=n_paths
+    )
+    expected = np.array([next(scalar_stepper) for _ in range(length)])
+
+    batch_stepper = BrownianMotionStepper(
+        model_params=damped_brownian_motion_params(**model_params), n_paths=n_paths
+    )
+    values = np.concatenate(
+        [batch_stepper.take(4), [next(batch_stepper)], batch_stepper.take(length - 5)]
+    )
+
+    shape = (2,) if n_paths is None else (n_paths, 2)
+    assert values.shape == (length,) + shape
+    np.testing.assert_allclose(values, expected, atol=1e-12)
+
+    # one vector of force densities per path and step
+    forces = MultiGaussianNoise(mu=np.array([0.1, -0.1]), cov=np.eye(2), seed=seed)
+    first = forces.next_batch(1 if n_paths is None else n_paths).reshape(shape)
+    if method == "euler":
+        np.testing.assert_allclose(values[0], 0.1 * first)
+
+
+def test_brownian_motion_stepper_exact_gamma_zero(
+    damped_brownian_motion_params, length
+):
+    exact = BrownianMotionStepper(
+        model_params=damped_brownian_motion_params(mu=0.2, gamma=0, method="exact")
+    )
+    euler = BrownianMotionStepper(
+        model_params=damped_brownian_motion_params(mu=0.2, gamma=0, method="euler")
+    )
+
+    np.testing.assert_allclose(exact.take(length), euler.take(length))
+
+
+def test_brownian_motion_stepper_exact_stationary(damped_brownian_motion_params):
+    gamma = 1.0
+    delta_t = 2.0
+    stepper = BrownianMotionStepper(
+        model_params=damped_brownian_motion_params(
+            # white noise of unit intensity averaged over a time step
+            mu=0.5,
+            std=1 / np.sqrt(delta_t),
+            gamma=gamma,
+            delta_t=delta_t,
+            initial_state=np.array([0.0]),
+            method="exact",
+        ),
+        n_paths=20000,
+    )
+
+    values = stepper.take(10)[-1]
+
+    assert values.mean() == pytest.approx(0.5 / gamma, abs=0.02)
+    assert values.var() == pytest.approx(1 / (2 * gamma), rel=0.05)
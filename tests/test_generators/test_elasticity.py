@@ -2,7 +2,12 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from eerily.generators.elasticity import ElasticityStepper, LinearElasticityParams
+from eerily.generators.elasticity import (
+    ElasticityStepper,
+    LinearElasticityParams,
+    PanelElasticityParams,
+    PanelElasticityStepper,
+)
 from eerily.generators.utils.base import ConstantIterator
 from eerily.generators.utils.noises import GaussianNoise
 
@@ -189,3 +194,252 @@ def test_stochastic_elasticity_stepper(stochastic_elasticity_stepper, length):
     pd.testing.assert_frame_equal(
         pd.DataFrame(container), pd.DataFrame(container_truth), check_like=True
     )
+
+
+def test_deterministic_elasticity_stepper_take(
+    deterministic_elasticity_stepper, length
+):
+    steps = deterministic_elasticity_stepper.take(length)
+
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(steps),
+        pd.DataFrame(
+            {
+                "log_demand": [4.5 - 3 * i for i in range(length)],
+                "log_price": list(range(length)),
+                "elasticity": [-3] * length,
+            }
+        ),
+    )
+
+
+def test_deterministic_base_demand_elasticity_stepper_take(
+    deterministic_base_demand_elasticity_stepper, length
+):
+    first = next(deterministic_base_demand_elasticity_stepper)
+    steps = deterministic_base_demand_elasticity_stepper.take(length - 1)
+
+    assert first == {
+        "log_demand": 0,
+        "log_price": 0,
+        "elasticity": -3,
+        "log_base_demand": 0,
+    }
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(steps),
+        pd.DataFrame(
+            {
+                "log_demand": [-2 * i for i in range(1, length)],
+                "log_price": list(range(1, length)),
+                "elasticity": [-3] * (length - 1),
+                "log_base_demand": list(range(1, length)),
+            }
+        ),
+    )
+
+
+@pytest.fixture
+def linear_elasticity_params(seed):
+    def model_params(log_prices=None, elasticity=None):
+        return LinearElasticityParams(
+            initial_state={"log_demand": 3, "log_price": 0.5, "elasticity": None},
+            log_prices=(
+                GaussianNoise(mu=1, std=0.1, seed=seed + 1)
+                if log_prices is None
+                else log_prices
+            ),
+            elasticity=(
+                GaussianNoise(mu=-3, std=0.5, seed=seed)
+                if elasticity is None
+                else elasticity
+            ),
+            variable_names=["log_demand", "log_price", "elasticity"],
+        )
+
+    return model_params
+
+
+def test_stochastic_elasticity_stepper_take(linear_elasticity_params, length):
+    scalar_stepper = ElasticityStepper(model_params=linear_elasticity_params())
+    expected = pd.DataFrame([next(scalar_stepper) for _ in range(length)])
+
+    batch_stepper = ElasticityStepper(model_params=linear_elasticity_params())
+    values = pd.concat(
+        [
+            pd.DataFrame(batch_stepper.take(4)),
+            pd.DataFrame([next(batch_stepper)]),
+            pd.DataFrame(batch_stepper.take(length - 5)),
+        ],
+        ignore_index=True,
+    )
+
+    pd.testing.assert_frame_equal(values, expected, check_exact=True)
+
+
+def test_deterministic_elasticity_stepper_no_copy(
+    linear_elasticity_params, constant_elasticity, log_prices
+):
+    lep = linear_elasticity_params(log_prices, constant_elasticity)
+    es = ElasticityStepper(model_params=lep, copy_output=False)
+
+    first = next(es)
+    first["log_demand"] = 100
+
+    assert next(es) == {"log_price": 1, "log_demand": 1.5, "elasticity": -3}
+    assert first == {"log_price": 0, "log_demand": 100, "elasticity": -3}
+
+
+def test_elasticity_stepper_n_paths(
+    linear_elasticity_params, constant_elasticity, log_prices
+):
+    lep = linear_elasticity_params(log_prices, constant_elasticity)
+
+    with pytest.raises(NotImplementedError):
+        ElasticityStepper(model_params=lep, n_paths=2)
+
+
+@pytest.fixture
+def panel_prices():
+    return np.log(np.random.default_rng(42).uniform(1, 2, size=(5, 20)))
+
+
+@pytest.fixture
+def panel_elasticity():
+    return np.random.default_rng(7).normal(-3, 0.5, size=(5, 20))
+
+
+@pytest.mark.parametrize("base_demand", [False, True])
+def test_panel_elasticity_stepper(panel_prices, panel_elasticity, base_demand):
+    n_skus, length = panel_prices.shape
+    log_demand = np.arange(n_skus, dtype=float)
+    log_price = np.full(n_skus, 0.5)
+    base = np.random.default_rng(3).normal(size=(n_skus, length))
+
+    panel = PanelElasticityStepper(
+        model_params=PanelElasticityParams(
+            initial_state={
+                "log_demand": log_demand,
+                "log_price": log_price,
+                "elasticity": None,
+            },
+            log_prices=panel_prices,
+            elasticity=panel_elasticity,
+            log_base_demand=base if base_demand else None,
+            variable_names=["log_demand", "log_price", "elasticity"],
+        ),
+        length=length,
+    )
+    values = panel.take(7)
+    rest = panel.take(length)
+
+    for sku in range(n_skus):
+        stepper = ElasticityStepper(
+            model_params=LinearElasticityParams(
+                initial_state={
+                    "log_demand": log_demand[sku],
+                    "log_price": log_price[sku],
+                    "elasticity": None,
+                },
+                log_prices=iter(panel_prices[sku]),
+                elasticity=iter(panel_elasticity[sku]),
+                log_base_demand=iter(base[sku]) if base_demand else None,
+                variable_names=["log_demand", "log_price", "elasticity"],
+            )
+        )
+        expected = pd.DataFrame([next(stepper) for _ in range(length)])
+        for key in expected.columns:
+            np.testing.assert_allclose(
+                np.concatenate([values[key], rest[key]])[:, sku], expected[key]
+            )
+
+    assert rest["log_demand"].shape == (length - 7, n_skus)
+    np.testing.assert_allclose(panel.current_state["log_price"], panel_prices[:, -1])
+
+
+def test_panel_elasticity_stepper_iterators(length):
+    n_skus = 3
+    panel = PanelElasticityStepper(
+        model_params=PanelElasticityParams(
+            initial_state={
+                "log_demand": np.full(n_skus, 3.0),
+                "log_price": np.full(n_skus, 0.5),
+                "elasticity": None,
+            },
+            log_prices=iter(range(length)),
+            elasticity=ConstantIterator(constant=-3),
+            variable_names=["log_demand", "log_price", "elasticity"],
+        )
+    )
+
+    first = next(panel)
+    steps = panel.take(length - 1)
+
+    np.testing.assert_array_equal(first["log_demand"], [4.5] * n_skus)
+    np.testing.assert_array_equal(
+        steps["log_demand"][:, 0], [4.5 - 3 * i for i in range(1, length)]
+    )
+    assert steps["elasticity"].shape == (length - 1, n_skus)
+
+
+def test_panel_elasticity_stepper_to_frame(panel_prices, panel_elasticity):
+    n_skus, length = panel_prices.shape
+    panel = PanelElasticityStepper(
+        model_params=PanelElasticityParams(
+            initial_state={
+                "log_demand": np.zeros(n_skus),
+                "log_price": np.zeros(n_skus),
+                "elasticity": None,
+            },
+            log_prices=panel_prices,
+            elasticity=panel_elasticity,
+            variable_names=["log_demand", "log_price", "elasticity"],
+            skus=[f"sku_{i}" for i in range(n_skus)],
+        ),
+        length=length,
+    )
+
+    first = panel.to_frame(2)
+    df = panel.to_frame()
+
+    assert list(df.columns) == ["step", "sku", "log_demand", "log_price", "elasticity"]
+    assert len(first) == 2 * n_skus
+    assert len(df) == (length - 2) * n_skus
+    assert df["step"].iloc[0] == 2
+    row = df[(df["step"] == 5) & (df["sku"] == "sku_3")].iloc[0]
+    assert row["log_price"] == panel_prices[3, 5]
+    assert row["elasticity"] == panel_elasticity[3, 5]
+
+
+def test_elasticity_stepper_arrays(linear_elasticity_params, seed, length):
+    log_prices = np.random.default_rng(seed + 1).normal(1, 0.1, size=length)
+    elasticity = np.random.default_rng(seed).normal(-3, 0.5, size=length)
+
+    scalar_stepper = ElasticityStepper(
+        model_params=linear_elasticity_params(iter(log_prices), iter(elasticity))
+    )
+    expected = pd.DataFrame([next(scalar_stepper) for _ in range(length)])
+
+    array_stepper = ElasticityStepper(
+        model_params=linear_elasticity_params(log_prices, elasticity)
+    )
+    values = pd.concat(
+        [
+            pd.DataFrame([next(array_stepper)]),
+            pd.DataFrame(array_stepper.take(length - 1)),
+        ],
+        ignore_index=True,
+    )
+
+    pd.testing.assert_frame_equal(values, expected)
+
+
+def test_elasticity_params_defaults(constant_elasticity, log_prices):
+    lep = LinearElasticityParams(
+        initial_state=None,
+        log_prices=log_prices,
+        elasticity=constant_elasticity,
+        variable_names=None,
+    )
+
+    assert lep.initial_state == {"log_demand": 1, "log_price": 10, "elasticity": None}
+    assert lep.variable_names == ["log_demand", "log_price", "elasticity"]
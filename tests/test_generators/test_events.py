@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from eerily.generators.utils.events import PoissonEvent
@@ -19,3 +20,48 @@ def test_poisson_events(rate, expected):
     events = [next(pe) for _ in range(length)]
 
     assert events == expected
+
+
+@pytest.mark.parametrize("rate", [0.001, 0.1, 0.9, 1])
+def test_poisson_events_skip_ahead(rate):
+    seed = 42
+    length = 5000
+
+    pe_scalar = PoissonEvent(rate=rate, seed=seed, skip_ahead=True, block_size=7)
+    expected = np.array([next(pe_scalar) for _ in range(length)])
+
+    pe = PoissonEvent(rate=rate, seed=seed, skip_ahead=True, block_size=7)
+    values = np.concatenate(
+        [[next(pe)], pe.next_batch(1000), [next(pe)], pe.next_batch(3998)]
+    )
+
+    np.testing.assert_array_equal(values, expected)
+    assert set(np.unique(values)) <= {0, 1}
+
+    pe_indices = PoissonEvent(rate=rate, seed=seed, skip_ahead=True, block_size=7)
+    indices = np.concatenate(
+        [pe_indices.next_event_indices(3), 3 + pe_indices.next_event_indices(4997)]
+    )
+
+    np.testing.assert_array_equal(indices, np.flatnonzero(expected))
+
+
+def test_poisson_events_skip_ahead_rate():
+    pe = PoissonEvent(rate=0.01, seed=42, skip_ahead=True)
+
+    events = pe.next_batch(1000000)
+
+    assert events.mean() == pytest.approx(0.01, rel=0.05)
+
+
+@pytest.mark.parametrize("rate, expected", [(0.5, [1, 4, 8, 9]), (0.1, [4])])
+def test_poisson_events_next_event_indices(rate, expected):
+    pe = PoissonEvent(rate=rate, seed=42)
+
+    np.testing.assert_array_equal(pe.next_event_indices(10), expected)
+
+
+@pytest.mark.parametrize("rate", [0, 1.5])
+def test_poisson_events_skip_ahead_invalid_rate(rate):
+    with pytest.raises(ValueError):
+        PoissonEvent(rate=rate, skip_ahead=True)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from eerily.generators.naive import (
     ConstantStepper,
     ConstStepperParams,
@@ -32,3 +34,34 @@ def test_sequence_stepper_length():
     ss = SequenceStepper(model_params=ssp, length=5)
 
     assert list(ss) == [{"y": i} for i in range(2, 7)]
+
+
+def test_constant_stepper_take():
+    csp = ConstStepperParams(initial_state=[1, "a"], variable_names=["y", "z"])
+    cs = ConstantStepper(model_params=csp, length=3)
+
+    steps = cs.take(5)
+
+    np.testing.assert_array_equal(steps["y"], [1, 1, 1])
+    np.testing.assert_array_equal(steps["z"], ["a", "a", "a"])
+
+
+def test_sequence_stepper_take():
+    ssp = SequenceStepperParams(
+        initial_state=[1, 0.0], variable_names=["y", "z"], step_sizes=[1, 0.1]
+    )
+    ss = SequenceStepper(model_params=ssp, length=6)
+    expected = list(SequenceStepper(model_params=ssp, length=6))
+
+    steps = ss.take(2)
+    last = next(ss)
+    rest = ss.take(3)
+
+    np.testing.assert_array_equal(
+        np.concatenate([steps["y"], [last["y"]], rest["y"]]),
+        [step["y"] for step in expected],
+    )
+    np.testing.assert_array_equal(
+        np.concatenate([steps["z"], [last["z"]], rest["z"]]),
+        [step["z"] for step in expected],
+    )
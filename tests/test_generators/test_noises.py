@@ -1,7 +1,13 @@
 import numpy as np
 import pytest
 
-from eerily.generators.utils.noises import LogNormalNoise
+from eerily.generators.utils.base import ConstantIterator
+from eerily.generators.utils.noises import (
+    GaussianNoise,
+    LogNormalNoise,
+    MultiGaussianNoise,
+    noise_moments,
+)
 
 
 @pytest.mark.parametrize(
@@ -34,3 +40,102 @@ def test_lognormal_noise(mu, std, expected):
     expected = np.array(expected)
 
     np.testing.assert_allclose(values, expected)
+
+
+@pytest.mark.parametrize("noise_class", [GaussianNoise, LogNormalNoise])
+@pytest.mark.parametrize("block_size", [1, 3, 65536])
+def test_buffered_noise_same_stream(noise_class, block_size):
+    seed = 42
+    length = 10
+
+    rng = np.random.default_rng(seed=seed)
+    if noise_class is GaussianNoise:
+        expected = np.array([rng.normal(1, 0.3) for _ in range(length)])
+    else:
+        expected = np.array([rng.lognormal(1, 0.3) for _ in range(length)])
+
+    noise = noise_class(mu=1, std=0.3, seed=seed, block_size=block_size)
+    values = np.array([next(noise) for _ in range(length)])
+
+    np.testing.assert_array_equal(values, expected)
+
+
+@pytest.mark.parametrize("noise_class", [GaussianNoise, LogNormalNoise])
+def test_buffered_noise_next_batch(noise_class):
+    seed = 42
+
+    scalar_noise = noise_class(mu=1, std=0.3, seed=seed, block_size=4)
+    expected = np.array([next(scalar_noise) for _ in range(20)])
+
+    noise = noise_class(mu=1, std=0.3, seed=seed, block_size=4)
+    values = np.concatenate(
+        [
+            [next(noise)],
+            noise.next_batch(2),
+            noise.next_batch(9),
+            [next(noise)],
+            noise.next_batch(0),
+            noise.next_batch(7),
+        ]
+    )
+
+    assert values.shape == (20,)
+    np.testing.assert_array_equal(values, expected)
+
+
+def test_multi_gaussian_noise_constant():
+    mu = np.array([1.0, 2.0])
+    mgn = MultiGaussianNoise(mu=mu, cov=np.zeros((2, 2)), seed=42)
+
+    np.testing.assert_allclose(next(mgn), mu)
+    np.testing.assert_allclose(mgn.next_batch(5), np.tile(mu, (5, 1)))
+
+
+@pytest.mark.parametrize(
+    "cov",
+    [
+        pytest.param(np.array([[2.0, 0.5], [0.5, 1.0]]), id="positive_definite"),
+        pytest.param(np.array([[1.0, 1.0], [1.0, 1.0]]), id="singular"),
+    ],
+)
+def test_multi_gaussian_noise_covariance(cov):
+    mu = np.array([1.0, -1.0])
+    mgn = MultiGaussianNoise(mu=mu, cov=cov, seed=42)
+
+    np.testing.assert_allclose(mgn.factor @ mgn.factor.T, cov, atol=1e-12)
+
+    values = mgn.next_batch(100000)
+    assert values.shape == (100000, 2)
+    np.testing.assert_allclose(values.mean(axis=0), mu, atol=0.02)
+    np.testing.assert_allclose(np.cov(values.T), cov, atol=0.03)
+
+
+def test_multi_gaussian_noise_next_batch():
+    mu = np.array([0.0, 1.0, 2.0])
+    cov = np.diag([1.0, 2.0, 3.0])
+
+    scalar_mgn = MultiGaussianNoise(mu=mu, cov=cov, seed=42, block_size=4)
+    expected = np.array([next(scalar_mgn) for _ in range(10)])
+
+    mgn = MultiGaussianNoise(mu=mu, cov=cov, seed=42, block_size=4)
+    values = np.concatenate([[next(mgn)], mgn.next_batch(6), [next(mgn), next(mgn)]])
+    values = np.concatenate([values, mgn.next_batch(1)])
+
+    np.testing.assert_array_equal(values, expected)
+
+
+def test_multi_gaussian_noise_not_positive_semidefinite():
+    with pytest.raises(ValueError):
+        MultiGaussianNoise(mu=np.zeros(2), cov=np.array([[1.0, 2.0], [2.0, 1.0]]))
+
+
+def test_noise_moments():
+    cov = np.array([[1.0, 0.5], [0.5, 2.0]])
+
+    assert noise_moments(GaussianNoise(mu=1, std=2)) == (1, 4)
+    assert noise_moments(ConstantIterator(constant=3)) == (3, 0)
+    mu, noise_cov = noise_moments(MultiGaussianNoise(mu=np.zeros(2), cov=cov))
+    np.testing.assert_array_equal(noise_cov, cov)
+
+    with pytest.raises(TypeError):
+        noise_moments(LogNormalNoise(mu=0, std=1))
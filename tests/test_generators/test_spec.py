@@ -0,0 +1,158 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eerily.generators.spec import IteratorSpec, StepperSpec
+from eerily.generators.utils.parallel import ParallelFactory
+from eerily.generators.var import AR1Stepper
+
+
+@pytest.fixture
+def ar_spec(seed, length):
+    return StepperSpec(
+        stepper="AR1Stepper",
+        params={
+            "delta_t": 0.1,
+            "phi0": 0.1,
+            "phi1": 0.5,
+            "epsilon": IteratorSpec("GaussianNoise", {"mu": 0, "std": 1}, seed=seed),
+            "initial_state": np.array([0.0]),
+            "variable_names": ["v"],
+        },
+        length=length,
+    )
+
+
+@pytest.fixture
+def elasticity_spec(length):
+    return StepperSpec(
+        stepper="ElasticityStepper",
+        params={
+            "initial_state": {"log_demand": 3, "log_price": 0.5, "elasticity": None},
+            "log_prices": IteratorSpec("iter", {"values": list(range(length))}),
+            "elasticity": IteratorSpec("ConstantIterator", {"constant": -3}),
+            "variable_names": ["log_demand", "log_price", "elasticity"],
+        },
+        length=length,
+    )
+
+
+def test_stepper_spec_build(ar_spec, length):
+    stepper = ar_spec.build()
+
+    assert isinstance(stepper, AR1Stepper)
+    assert stepper.length == length
+
+    np.testing.assert_array_equal(stepper.take(length), ar_spec.build().take(length))
+
+
+def test_stepper_spec_round_trip(ar_spec, elasticity_spec, length):
+    for spec in [ar_spec, elasticity_spec]:
+        restored = StepperSpec.from_json(spec.to_json())
+
+        assert restored.to_dict() == spec.to_dict()
+        assert restored.key() == spec.key()
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(restored.build().take(length)),
+            pd.DataFrame(spec.build().take(length)),
+        )
+
+    assert pickle.loads(pickle.dumps(ar_spec)).key() == ar_spec.key()
+
+
+def test_stepper_spec_key(ar_spec):
+    other = StepperSpec(
+        stepper=ar_spec.stepper,
+        params={**ar_spec.params, "phi1": 0.6},
+        length=ar_spec.length,
+    )
+
+    assert other.key() != ar_spec.key()
+    assert StepperSpec.from_dict(ar_spec.to_dict()).key() == ar_spec.key()
+
+
+def test_stepper_spec_key_numbers(ar_spec):
+    integer = StepperSpec(
+        stepper=ar_spec.stepper,
+        params={**ar_spec.params, "phi0": 0},
+        length=ar_spec.length,
+    )
+    floating = StepperSpec(
+        stepper=ar_spec.stepper,
+        params={**ar_spec.params, "phi0": 0.0},
+        length=ar_spec.length,
+    )
+
+    assert integer.key() == floating.key()
+    assert integer == floating
+    assert len({integer, floating, ar_spec}) == 2
+    assert integer != ar_spec
+
+
+def test_stepper_spec_stepper_kwargs(ar_spec, seed, length):
+    spec = StepperSpec(
+        stepper=ar_spec.stepper,
+        params=ar_spec.params,
+        length=length,
+        n_paths=3,
+        stepper_kwargs={"stationary": True, "seed": seed},
+    )
+    restored = StepperSpec.from_json(spec.to_json())
+    stepper = AR1Stepper(
+        model_params=ar_spec.build().model_params,
+        length=length,
+        n_paths=3,
+        stationary=True,
+        seed=seed,
+    )
+
+    assert restored == spec
+    assert (
+        spec.key()
+        != StepperSpec.from_dict({**spec.to_dict(), "stepper_kwargs": {}}).key()
+    )
+    assert spec.is_seeded
+    assert not StepperSpec(
+        stepper=ar_spec.stepper,
+        params=ar_spec.params,
+        stepper_kwargs={"stationary": True},
+    ).is_seeded
+    np.testing.assert_array_equal(restored.build().take(length), stepper.take(length))
+    assert not np.array_equal(
+        spec.build(seed=np.random.SeedSequence(1)).current_state,
+        spec.build(seed=np.random.SeedSequence(2)).current_state,
+    )
+
+
+def test_stepper_spec_is_seeded(ar_spec, elasticity_spec):
+    unseeded = StepperSpec(
+        stepper=ar_spec.stepper,
+        params={
+            **ar_spec.params,
+            "epsilon": IteratorSpec("GaussianNoise", {"mu": 0, "std": 1}),
+        },
+    )
+
+    assert ar_spec.is_seeded
+    assert elasticity_spec.is_seeded
+    assert not unseeded.is_seeded
+
+
+def test_stepper_spec_parallel_factory(ar_spec, length):
+    series = ParallelFactory(max_workers=2)(ar_spec, length=length, n_series=3, seed=1)
+    expected = [
+        ar_spec.build(seed=s).take(length) for s in np.random.SeedSequence(1).spawn(3)
+    ]
+
+    for s, e in zip(series, expected):
+        np.testing.assert_array_equal(s, e)
+    assert not np.array_equal(series[0], series[1])
+
+
+def test_stepper_spec_unknown():
+    with pytest.raises(ValueError):
+        StepperSpec(stepper="UnknownStepper")
+    with pytest.raises(ValueError):
+        IteratorSpec(iterator="UnknownNoise")
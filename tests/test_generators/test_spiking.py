@@ -1,7 +1,12 @@
 import numpy as np
 import pytest
 
-from eerily.generators.spiking import SpikingEventParams, SpikingEventStepper
+from eerily.generators.spiking import (
+    SparseSpikes,
+    SpikingEventParams,
+    SpikingEventStepper,
+)
+from eerily.generators.utils.base import ConstantIterator
 from eerily.generators.utils.events import PoissonEvent
 from eerily.generators.utils.noises import LogNormalNoise
 
@@ -60,3 +65,138 @@ def test_spiking_event_stepper(
     expected = np.array(expected)
 
     np.testing.assert_allclose(values, expected)
+
+
+@pytest.fixture
+def spiking_event_params(seed):
+    def model_params(spike_rate=0.1, spike_level=None, background_seed=None):
+        return SpikingEventParams(
+            initial_state=0,
+            variable_names=["event"],
+            spike=PoissonEvent(rate=spike_rate, seed=seed),
+            spike_level=(
+                LogNormalNoise(mu=1.7, std=0.05, seed=seed)
+                if spike_level is None
+                else spike_level
+            ),
+            background=LogNormalNoise(
+                mu=1.5,
+                std=0.1,
+                seed=seed if background_seed is None else background_seed,
+            ),
+        )
+
+    return model_params
+
+
+def test_spiking_event_stepper_take(spiking_event_params, length):
+    scalar_stepper = SpikingEventStepper(model_params=spiking_event_params())
+    expected = np.array([next(scalar_stepper) for _ in range(length)])
+
+    stepper = SpikingEventStepper(model_params=spiking_event_params(), length=length)
+    values = np.concatenate(
+        [stepper.take(3), [next(stepper)], stepper.take(length - 4)]
+    )
+
+    assert values.shape == (length,)
+    np.testing.assert_array_equal(values, expected)
+    assert stepper.current_state == expected[-1]
+
+
+def test_spiking_event_stepper_n_paths(spiking_event_params, length):
+    n_paths = 8
+
+    scalar_stepper = SpikingEventStepper(
+        model_params=spiking_event_params(), n_paths=n_paths
+    )
+    expected = np.array([next(scalar_stepper) for _ in range(length)])
+
+    values = SpikingEventStepper(
+        model_params=spiking_event_params(), n_paths=n_paths
+    ).take(length)
+
+    assert values.shape == (length, n_paths)
+    np.testing.assert_array_equal(values, expected)
+
+
+def test_spiking_event_stepper_arrays():
+    rng = np.random.default_rng(42)
+    length = 100
+    spike = (rng.random(length) < 0.1).astype(int)
+    spike_level = rng.lognormal(1.7, 0.05, size=length)
+    background = rng.lognormal(1.5, 0.1, size=length)
+
+    stepper = SpikingEventStepper(
+        model_params=SpikingEventParams(
+            initial_state=None,
+            variable_names=None,
+            spike=spike,
+            spike_level=spike_level,
+            background=background,
+        )
+    )
+    values = np.concatenate([[next(stepper)], stepper.take(length - 1)])
+
+    assert stepper.model_params.variable_names == ["event"]
+    np.testing.assert_array_equal(values, background + spike * spike_level)
+
+
+@pytest.mark.parametrize("n_paths", [None, 4])
+def test_spiking_event_stepper_take_sparse_constant_level(
+    spiking_event_params, n_paths
+):
+    # long enough for a few rare spikes
+    length = 200
+    model_params = dict(
+        spike_rate=0.05,
+        spike_level=ConstantIterator(constant=5.0),
+        background_seed=7,
+    )
+
+    dense_stepper = SpikingEventStepper(
+        model_params=spiking_event_params(**model_params), n_paths=n_paths
+    )
+    expected = dense_stepper.take(length)
+
+    sparse_stepper = SpikingEventStepper(
+        model_params=spiking_event_params(**model_params), n_paths=n_paths
+    )
+    sparse = sparse_stepper.take_sparse(length)
+
+    assert len(sparse) == length
+    assert sparse.background.shape == expected.shape
+    np.testing.assert_allclose(sparse.to_dense(), expected)
+    np.testing.assert_array_equal(sparse.levels, 5.0)
+    np.testing.assert_allclose(sparse_stepper.current_state, expected[-1])
+    np.testing.assert_array_equal(next(sparse_stepper), next(dense_stepper))
+
+
+def test_spiking_event_stepper_take_sparse_skip_ahead(seed):
+    length = 100_000
+    stepper = SpikingEventStepper(
+        model_params=SpikingEventParams(
+            initial_state=0,
+            variable_names=["event"],
+            spike=PoissonEvent(rate=0.001, seed=seed, skip_ahead=True),
+            spike_level=LogNormalNoise(mu=1.7, std=0.05, seed=seed),
+            background=LogNormalNoise(mu=1.5, std=0.1, seed=7),
+        ),
+        length=length,
+    )
+
+    sparse = stepper.take_sparse(length + 10)
+    expected_indices = PoissonEvent(
+        rate=0.001, seed=seed, skip_ahead=True
+    ).next_event_indices(length)
+
+    assert isinstance(sparse, SparseSpikes)
+    np.testing.assert_array_equal(sparse.indices, expected_indices)
+    np.testing.assert_array_equal(sparse.steps, expected_indices)
+    # the levels are only drawn for the events
+    np.testing.assert_array_equal(
+        sparse.levels,
+        LogNormalNoise(mu=1.7, std=0.05, seed=seed).next_batch(len(expected_indices)),
+    )
+    dense = sparse.to_dense()
+    assert np.count_nonzero(dense != sparse.background) == len(expected_indices)
+    assert len(stepper.take_sparse(10)) == 0
@@ -1,7 +1,14 @@
 import numpy as np
 import pytest
 
-from eerily.generators.utils.base import ConstantIterator
+from eerily.generators.utils.base import (
+    ArrayIterator,
+    ConstantIterator,
+    Source,
+    as_source,
+    draw_batch,
+)
+from eerily.generators.utils.noises import GaussianNoise
 
 
 @pytest.mark.parametrize(
@@ -26,3 +33,43 @@ def test_constant_iterator(constant, expected_val):
         assert all([np.array_equal(i, expected_val) for i in results])
     else:
         assert all([i == expected_val for i in results])
+
+
+def test_buffered_iterator_invalid_block_size():
+    with pytest.raises(ValueError):
+        GaussianNoise(mu=0, std=1, block_size=0)
+
+
+def test_constant_iterator_next_batch():
+    constant_iterator = ConstantIterator(constant=np.array([1, 2]))
+
+    batch = constant_iterator.next_batch(3)
+
+    np.testing.assert_array_equal(batch, [[1, 2]] * 3)
+    assert not batch.flags.writeable
+    assert isinstance(constant_iterator, Source)
+
+
+def test_array_iterator():
+    values = np.arange(10)
+    array_iterator = ArrayIterator(values)
+
+    first = next(array_iterator)
+    batch = draw_batch(array_iterator, 5)
+
+    assert first == 0
+    np.testing.assert_array_equal(batch, [1, 2, 3, 4, 5])
+    assert np.shares_memory(batch, values)
+    assert not batch.flags.writeable
+    assert len(array_iterator) == 4
+    assert list(array_iterator) == [6, 7, 8, 9]
+    with pytest.raises(ValueError):
+        array_iterator.next_batch(1)
+
+
+def test_as_source():
+    iterator = iter(range(3))
+
+    assert as_source(iterator) is iterator
+    assert isinstance(as_source(np.arange(3)), ArrayIterator)
+    assert not isinstance(iterator, Source)
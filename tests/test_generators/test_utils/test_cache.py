@@ -0,0 +1,255 @@
+import os
+import warnings
+
+import numpy as np
+import pytest
+import torch
+
+from eerily.datasets.generators import SinTimeSeriesDataset
+from eerily.datasets.windows import WindowDataset
+from eerily.generators.spec import IteratorSpec, StepperSpec
+from eerily.generators.utils.cache import (
+    DiskCache,
+    MemoryCache,
+    generate_spec,
+    hash_key,
+)
+from eerily.physics.pendulum import Pendulum
+
+
+@pytest.fixture
+def ar_spec():
+    return StepperSpec(
+        stepper="AR1Stepper",
+        params={
+            "delta_t": 0.1,
+            "phi0": 0.1,
+            "phi1": 0.5,
+            "epsilon": IteratorSpec("GaussianNoise", {"mu": 0, "std": 1}, seed=42),
+            "initial_state": np.array([0.0]),
+            "variable_names": ["v"],
+        },
+        length=100,
+    )
+
+
+def test_disk_cache_load(tmp_path, ar_spec):
+    cache = DiskCache(tmp_path)
+
+    history = cache.load(ar_spec)
+    cached = cache.load(ar_spec)
+
+    assert ar_spec.key() in cache
+    assert isinstance(cached, np.memmap)
+    assert not cached.flags.writeable
+    assert cached.shape == (100, 1)
+    np.testing.assert_array_equal(cached, generate_spec(ar_spec))
+    np.testing.assert_array_equal(cached, history)
+
+
+def test_disk_cache_get_or_create(tmp_path):
+    cache = DiskCache(tmp_path)
+    calls = []
+
+    def create():
+        calls.append(1)
+        return np.arange(10)
+
+    first = cache.get_or_create("arange", create)
+    second = cache.get_or_create("arange", create)
+
+    assert len(calls) == 1
+    np.testing.assert_array_equal(first, second)
+    assert [p.name for p in tmp_path.iterdir()] == ["arange.npy"]
+
+
+def test_disk_cache_dtype(tmp_path, ar_spec):
+    cache = DiskCache(tmp_path)
+
+    history = cache.load(ar_spec, dtype=np.float32, mmap_mode="c")
+
+    assert history.dtype == np.float32
+    assert torch.from_numpy(history).dtype == torch.float32
+    assert f"{ar_spec.key()}-float32" in cache
+
+
+def test_disk_cache_window_dataset(tmp_path, ar_spec):
+    cache = DiskCache(tmp_path)
+    history = cache.load(ar_spec, dtype=np.float32, mmap_mode="c")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        dataset = WindowDataset(history, input_length=4, prediction_length=1)
+
+    assert dataset.data.data_ptr() == history.ctypes.data
+
+
+def test_disk_cache_unseeded(tmp_path, ar_spec):
+    spec = StepperSpec(
+        ar_spec.stepper,
+        {
+            **ar_spec.params,
+            "epsilon": IteratorSpec("GaussianNoise", {"mu": 0, "std": 1}),
+        },
+        length=100,
+    )
+
+    with pytest.raises(ValueError):
+        DiskCache(tmp_path).load(spec)
+
+
+def test_disk_cache_eviction(tmp_path):
+    array = np.zeros(1000)
+    cache = DiskCache(tmp_path)
+    cache.get_or_create("a", lambda: array)
+    cache.max_bytes = int(2.5 * cache.size)
+
+    cache.get_or_create("b", lambda: array)
+    os.utime(cache.path("a"), ns=(1, 1))
+    os.utime(cache.path("b"), ns=(2, 2))
+    # reading a makes b the least recently used
+    cache.get_or_create("a", lambda: array)
+    cache.get_or_create("c", lambda: array)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.size <= cache.max_bytes
+
+    cache.clear()
+    assert cache.size == 0
+
+
+def test_sin_time_series_dataset_cache(tmp_path):
+    cache = DiskCache(tmp_path)
+
+    SinTimeSeriesDataset(100, 5, 1, 3, cache=cache)
+    dataset = SinTimeSeriesDataset(100, 5, 1, 3, cache=cache)
+
+    torch.testing.assert_close(dataset.data, SinTimeSeriesDataset(100, 5, 1, 3).data)
+    torch.testing.assert_close(dataset[3][0], SinTimeSeriesDataset(100, 5, 1, 3)[3][0])
+
+
+def test_hash_key():
+    assert hash_key("a", {"x": 1, "y": 2}) == hash_key("a", {"y": 2, "x": 1})
+    assert hash_key("a", 1) != hash_key("a", 2)
+
+
+def test_hash_key_arrays():
+    a = np.zeros(2000)
+    b = a.copy()
+    b[1000] = 1
+
+    assert hash_key(a) == hash_key(a.copy())
+    assert hash_key(a) != hash_key(b)
+    assert hash_key(a) != hash_key(a.astype(np.float32))
+    assert hash_key(a) != hash_key(a.reshape(2, 1000))
+    assert hash_key(np.float64(1.5)) == hash_key(1.5)
+
+    with pytest.raises(TypeError):
+        hash_key(object())
+
+
+def test_memory_cache_get_or_create():
+    cache = MemoryCache()
+    calls = []
+
+    def create():
+        calls.append(1)
+        return np.arange(10)
+
+    first = cache.get_or_create("arange", create)
+    second = cache.get_or_create("arange", create)
+
+    assert len(calls) == 1
+    assert second is first
+    assert not first.flags.writeable
+    with pytest.raises(ValueError):
+        first.flags.writeable = True
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.nbytes == first.nbytes
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses, cache.nbytes) == (0, 0, 0)
+
+
+def test_memory_cache_eviction():
+    cache = MemoryCache(max_bytes=2 * np.arange(10).nbytes)
+
+    cache.get_or_create("a", lambda: np.arange(10))
+    cache.get_or_create("b", lambda: np.arange(10))
+    cache.get_or_create("a", lambda: np.arange(10))
+    cache.get_or_create("c", lambda: np.arange(10))
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.nbytes <= cache.max_bytes
+
+    too_large = cache.get_or_create("d", lambda: np.arange(100))
+    assert "d" not in cache
+    assert len(too_large) == 100
+
+
+def test_memory_cache_disabled():
+    cache = MemoryCache(enabled=False)
+
+    first = cache.get_or_create("arange", lambda: np.arange(10))
+    second = cache.get_or_create("arange", lambda: np.arange(10))
+
+    assert first is not second
+    assert first.flags.writeable
+    assert len(cache) == 0
+
+
+def test_memory_cache_load(ar_spec):
+    cache = MemoryCache()
+
+    history = cache.load(ar_spec)
+
+    assert cache.load(ar_spec) is history
+    np.testing.assert_array_equal(history, generate_spec(ar_spec))
+
+
+def test_memory_cache_unseeded(ar_spec):
+    unseeded = StepperSpec(
+        stepper=ar_spec.stepper,
+        params={
+            **ar_spec.params,
+            "epsilon": IteratorSpec("GaussianNoise", {"mu": 0, "std": 1}),
+        },
+        length=ar_spec.length,
+    )
+
+    with pytest.raises(ValueError, match="without seeds"):
+        MemoryCache().load(unseeded)
+
+
+def test_pendulum_memory_cache():
+    cache = MemoryCache()
+    pendulum = Pendulum(length=1.0, cache=cache)
+
+    first = pendulum.generate(num_periods=2, num_samples_per_period=10)
+    second = pendulum.generate(num_periods=2, num_samples_per_period=10)
+    pendulum.generate(num_periods=3, num_samples_per_period=10)
+
+    assert second["theta"] is first["theta"]
+    assert not first["theta"].flags.writeable
+    with pytest.raises(ValueError):
+        first["theta"].flags.writeable = True
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert pendulum(num_periods=2, num_samples_per_period=10) == {
+        key: value.tolist() for key, value in first.items()
+    }
+
+    # replacing the values of a returned dictionary does not change the cache
+    first["theta"] = None
+    assert pendulum.generate(num_periods=2, num_samples_per_period=10)["theta"] is (
+        second["theta"]
+    )
+
+    uncached = Pendulum(length=1.0, cache=None).generate(
+        num_periods=2, num_samples_per_period=10
+    )
+    np.testing.assert_array_equal(uncached["theta"], second["theta"])
@@ -1,3 +1,6 @@
+import numpy as np
+import pytest
+
 from eerily.generators.utils.choices import Choices
 
 
@@ -7,3 +10,52 @@ def test_choices():
     first_value = next(c)
 
     assert first_value in elements
+
+
+def test_choices_positional_seed():
+    first = Choices([0, 1, 2], 42).next_batch(10)
+
+    np.testing.assert_array_equal(
+        first, Choices(elements=[0, 1, 2], seed=42).next_batch(10)
+    )
+
+
+def test_choices_weighted():
+    elements = ["a", "b", "c", "d"]
+    weights = [0.1, 0.2, 0.3, 0.4]
+    c = Choices(elements=elements, weights=weights, seed=42)
+
+    indices = c.next_batch(200000, return_indices=True)
+    frequencies = np.bincount(indices, minlength=len(elements)) / len(indices)
+
+    np.testing.assert_allclose(frequencies, weights, atol=0.01)
+
+
+def test_choices_zero_weight():
+    c = Choices(elements=[0, 1, 2], weights=[1, 0, 1], seed=42)
+
+    assert 1 not in c.next_batch(10000)
+
+
+def test_choices_next_batch():
+    elements = [10, "a", (1, 2)]
+    c_scalar = Choices(elements=elements, weights=[3, 1, 2], seed=42, block_size=3)
+    expected = [next(c_scalar) for _ in range(10)]
+
+    c = Choices(elements=elements, weights=[3, 1, 2], seed=42, block_size=3)
+    values = [next(c)] + list(c.next_batch(5)) + [next(c)] + list(c.next_batch(3))
+
+    assert values == expected
+
+
+@pytest.mark.parametrize(
+    "weights",
+    [
+        pytest.param([1, -1], id="negative"),
+        pytest.param([0, 0], id="zero_sum"),
+        pytest.param([1], id="wrong_length"),
+    ],
+)
+def test_choices_invalid_weights(weights):
+    with pytest.raises(ValueError):
+        Choices(elements=[0, 1], weights=weights)
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+
+from eerily.generators.naive import SequenceStepper, SequenceStepperParams
+from eerily.generators.utils.factory import Factory
+from eerily.generators.utils.noises import MultiGaussianNoise
+from eerily.generators.var import VAR1ModelParams, VAR1Stepper
+
+
+@pytest.fixture
+def sequence_stepper():
+    ssp = SequenceStepperParams(
+        initial_state=[0, 1.0], variable_names=["y", "z"], step_sizes=[1, 0.5]
+    )
+    return SequenceStepper(model_params=ssp, length=10)
+
+
+@pytest.fixture
+def var_stepper(seed):
+    return VAR1Stepper(
+        model_params=VAR1ModelParams(
+            delta_t=0.1,
+            phi0=np.array([0.1, 0.1]),
+            phi1=np.array([[0.5, -0.25], [-0.35, 0.65]]),
+            epsilon=MultiGaussianNoise(mu=np.zeros(2), cov=np.eye(2), seed=seed),
+            initial_state=np.array([1, 0]),
+            variable_names=["s1", "s2"],
+        ),
+        length=100,
+    )
+
+
+def test_factory_generator(sequence_stepper):
+    history = Factory()(sequence_stepper, length=3)
+
+    assert list(history) == [{"y": 1, "z": 1.5}, {"y": 2, "z": 2.0}, {"y": 3, "z": 2.5}]
+
+
+def test_factory_list(sequence_stepper):
+    history = Factory(format="list")(sequence_stepper, length=2)
+
+    assert history == [{"y": 1, "z": 1.5}, {"y": 2, "z": 2.0}]
+
+
+def test_factory_dataframe(sequence_stepper):
+    history = Factory(format="dataframe", chunk_size=3)(sequence_stepper, length=4)
+
+    pd.testing.assert_frame_equal(
+        history, pd.DataFrame({"y": [1, 2, 3, 4], "z": [1.5, 2.0, 2.5, 3.0]})
+    )
+
+
+@pytest.mark.parametrize("format", ["numpy", "torch"])
+def test_factory_array(var_stepper, seed, format):
+    expected = VAR1Stepper(
+        model_params=VAR1ModelParams(
+            delta_t=0.1,
+            phi0=np.array([0.1, 0.1]),
+            phi1=np.array([[0.5, -0.25], [-0.35, 0.65]]),
+            epsilon=MultiGaussianNoise(mu=np.zeros(2), cov=np.eye(2), seed=seed),
+            initial_state=np.array([1, 0]),
+            variable_names=["s1", "s2"],
+        )
+    ).take(50)
+
+    history = Factory(format=format, chunk_size=7)(var_stepper, length=50)
+
+    if format == "torch":
+        assert isinstance(history, torch.Tensor)
+        history = history.numpy()
+
+    assert history.shape == (50, 2)
+    np.testing.assert_array_equal(history, expected)
+
+
+def test_factory_array_n_paths(seed):
+    def stepper():
+        return VAR1Stepper(
+            model_params=VAR1ModelParams(
+                delta_t=0.1,
+                phi0=np.array([0.1, 0.1]),
+                phi1=np.array([[0.5, -0.25], [-0.35, 0.65]]),
+                epsilon=MultiGaussianNoise(mu=np.zeros(2), cov=np.eye(2), seed=seed),
+                initial_state=np.array([1, 0]),
+                variable_names=["s1", "s2"],
+            ),
+            length=20,
+            n_paths=3,
+        )
+
+    history = Factory(format="numpy", chunk_size=7)(stepper(), length=50)
+
+    assert history.shape == (20, 3, 2)
+    np.testing.assert_array_equal(history, stepper().take(20))
+
+    with pytest.raises(ValueError, match="numpy"):
+        Factory(format="dataframe")(stepper(), length=20)
+
+
+def test_factory_iterator():
+    rows = [{"y": i, "z": 2.0 * i} for i in range(5)]
+
+    history = Factory(format="numpy", chunk_size=2)(iter(rows), length=4)
+    frame = Factory(format="dataframe")(iter(rows), length=4)
+
+    np.testing.assert_array_equal(history, [[0, 0], [1, 2], [2, 4], [3, 6]])
+    pd.testing.assert_frame_equal(frame, pd.DataFrame(rows[:4]))
+    np.testing.assert_array_equal(
+        Factory(format="numpy")(iter(range(10)), length=3), [[0], [1], [2]]
+    )
+
+
+def test_factory_array_mixed_types():
+    rows = [{"y": i, "label": "a"} for i in range(3)]
+
+    history = Factory(format="numpy")(iter(rows), length=3)
+
+    assert history.dtype == object
+    assert history[2].tolist() == [2, "a"]
+
+
+def test_factory_unknown_format():
+    with pytest.raises(ValueError):
+        Factory(format="parquet")
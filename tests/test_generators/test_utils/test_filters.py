@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from eerily.generators.utils import filters
+from eerily.generators.utils.filters import ar_filter
+
+
+def ar_recursion(x, phi, history):
+    values = list(history)
+    for x_t in x:
+        values.append(x_t + sum(phi[k] * values[-1 - k] for k in range(len(phi))))
+    return np.array(values[len(history) :])
+
+
+@pytest.mark.parametrize(
+    "phi",
+    [
+        pytest.param([0.9], id="ar_1"),
+        pytest.param([0.5, -0.2, 0.1], id="ar_3"),
+    ],
+)
+@pytest.mark.parametrize("use_scipy", [True, False])
+def test_ar_filter(phi, use_scipy, monkeypatch):
+    if not use_scipy:
+        monkeypatch.setattr(filters, "lfilter", None)
+
+    rng = np.random.default_rng(42)
+    x = rng.standard_normal((300, 4))
+    history = rng.standard_normal((len(phi), 4))
+
+    expected = ar_recursion(x, phi, history)
+    values, new_history = ar_filter(x, phi, history, block_size=64)
+
+    np.testing.assert_allclose(values, expected, atol=1e-12)
+    np.testing.assert_allclose(new_history, expected[-len(phi) :], atol=1e-12)
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eerily.generators.spiking import SpikingEventParams, SpikingEventStepper
+from eerily.generators.utils.events import PoissonEvent
+from eerily.generators.utils.noises import LogNormalNoise, MultiGaussianNoise
+from eerily.generators.utils.parallel import ParallelFactory
+from eerily.generators.var import VAR1ModelParams, VAR1Stepper
+
+
+def var_recipe(seed):
+    return VAR1Stepper(
+        model_params=VAR1ModelParams(
+            delta_t=0.1,
+            phi0=np.array([0.1, 0.1]),
+            phi1=np.array([[0.5, -0.25], [-0.35, 0.65]]),
+            epsilon=MultiGaussianNoise(mu=np.zeros(2), cov=np.eye(2), seed=seed),
+            initial_state=np.array([1, 0]),
+            variable_names=["s1", "s2"],
+        )
+    )
+
+
+def spiking_recipe(seed):
+    spike_seed, spike_level_seed, background_seed = seed.spawn(3)
+    return SpikingEventStepper(
+        model_params=SpikingEventParams(
+            initial_state=0,
+            variable_names=["event"],
+            spike=PoissonEvent(rate=0.1, seed=spike_seed),
+            spike_level=LogNormalNoise(mu=1.7, std=0.05, seed=spike_level_seed),
+            background=LogNormalNoise(mu=1.5, std=0.1, seed=background_seed),
+        )
+    )
+
+
+@pytest.mark.parametrize("max_workers", [2, 3])
+def test_parallel_factory_reproducible(max_workers):
+    sequential = ParallelFactory(max_workers=1)(
+        var_recipe, length=20, n_series=5, seed=42
+    )
+    parallel = ParallelFactory(max_workers=max_workers)(
+        var_recipe, length=20, n_series=5, seed=42
+    )
+
+    assert len(parallel) == 5
+    for s, p in zip(sequential, parallel):
+        assert p.shape == (20, 2)
+        np.testing.assert_array_equal(s, p)
+
+    assert not np.array_equal(parallel[0], parallel[1])
+
+
+def test_parallel_factory_dataframe():
+    series = ParallelFactory(format="dataframe", max_workers=2)(
+        spiking_recipe, length=10, n_series=3, seed=42
+    )
+    expected = ParallelFactory(format="dataframe", max_workers=1)(
+        spiking_recipe, length=10, n_series=3, seed=42
+    )
+
+    for s, e in zip(series, expected):
+        assert list(s.columns) == ["event"]
+        pd.testing.assert_frame_equal(s, e)
+
+
+def test_parallel_factory_unknown_format():
+    with pytest.raises(ValueError):
+        ParallelFactory(format=None)
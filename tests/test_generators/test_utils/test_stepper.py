@@ -1,6 +1,10 @@
+import numpy as np
+import pandas as pd
 import pytest
 
-from eerily.generators.utils.stepper import BaseStepper, StepperParams
+from eerily.generators.utils.noises import GaussianNoise
+from eerily.generators.utils.stepper import BaseStepper, MergedStepper, StepperParams
+from eerily.generators.var import AR1Stepper, ARModelParams
 
 
 class DummyStepperParams(StepperParams):
@@ -14,6 +18,14 @@ class DummyStepper(BaseStepper):
         )
 
 
+class ArrayStepper(BaseStepper):
+    _supports_n_paths = True
+
+    def compute_step(self):
+        self.current_state = self.current_state + 1
+        return self._output(self.current_state)
+
+
 def test_base_stepper():
     stepper_params = DummyStepperParams(initial_state=[1], variable_names=["y"])
     stepper = DummyStepper(model_params=stepper_params)
@@ -103,3 +115,139 @@ def test_base_stepper_and_add():
     generator = (stepper_1 & stepper_2) + stepper_3
 
     assert list(generator) == [{"y1": 1, "y2": 2}] * 4 + [{"y3": 3, "y4": 4}] * 2
+
+
+def test_base_stepper_take():
+    stepper_params = DummyStepperParams(initial_state=[1, 2], variable_names=["y", "z"])
+    stepper = DummyStepper(model_params=stepper_params, length=5)
+
+    steps = stepper.take(3)
+
+    assert list(steps) == ["y", "z"]
+    np.testing.assert_array_equal(steps["y"], [1, 1, 1])
+    np.testing.assert_array_equal(steps["z"], [2, 2, 2])
+
+    assert next(stepper) == {"y": 1, "z": 2}
+    np.testing.assert_array_equal(stepper.take(10)["y"], [1])
+    assert list(stepper) == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 100])
+def test_merged_stepper_to_columns(chunk_size):
+    stepper_params_1 = DummyStepperParams(initial_state=[1], variable_names=["y1"])
+    stepper_1 = DummyStepper(model_params=stepper_params_1, length=5)
+
+    stepper_params_2 = DummyStepperParams(
+        initial_state=[2, "a"], variable_names=["y2", "y3"]
+    )
+    stepper_2 = DummyStepper(model_params=stepper_params_2, length=4)
+
+    stepper_params_3 = DummyStepperParams(initial_state=[3], variable_names=["y4"])
+    stepper_3 = DummyStepper(model_params=stepper_params_3, length=2)
+    stepper_4 = DummyStepper(model_params=stepper_params_3, length=3)
+
+    generator = stepper_1 & stepper_2 & (stepper_3 + stepper_4)
+
+    columns = generator.to_columns(chunk_size=chunk_size)
+
+    assert list(columns) == ["y1", "y2", "y3", "y4"]
+    np.testing.assert_array_equal(columns["y1"], [1] * 4)
+    np.testing.assert_array_equal(columns["y2"], [2] * 4)
+    np.testing.assert_array_equal(columns["y3"], ["a"] * 4)
+    np.testing.assert_array_equal(columns["y4"], [3] * 4)
+
+
+def test_merged_stepper_iter_columns():
+    stepper_params_1 = DummyStepperParams(initial_state=[1], variable_names=["y1"])
+    stepper_1 = DummyStepper(model_params=stepper_params_1, length=5)
+
+    stepper_params_2 = DummyStepperParams(initial_state=[2], variable_names=["y2"])
+    stepper_2 = DummyStepper(model_params=stepper_params_2, length=4)
+
+    chunks = list((stepper_1 & stepper_2).iter_columns(chunk_size=3))
+
+    assert [len(chunk["y1"]) for chunk in chunks] == [3, 1]
+    assert all(list(chunk) == ["y1", "y2"] for chunk in chunks)
+    np.testing.assert_array_equal(
+        np.concatenate([chunk["y2"] for chunk in chunks]), [2] * 4
+    )
+
+
+def test_merged_stepper_to_frame():
+    stepper_params_1 = DummyStepperParams(initial_state=[1], variable_names=["y1"])
+    stepper_1 = DummyStepper(model_params=stepper_params_1, length=5)
+
+    stepper_params_2 = DummyStepperParams(initial_state=[2], variable_names=["y2"])
+    stepper_2 = DummyStepper(model_params=stepper_params_2, length=4)
+
+    expected = pd.DataFrame(list(stepper_1 & stepper_2))
+
+    stepper_1 = DummyStepper(model_params=stepper_params_1, length=5)
+    stepper_2 = DummyStepper(model_params=stepper_params_2, length=4)
+
+    merged = stepper_1 & stepper_2
+
+    pd.testing.assert_frame_equal(merged.to_frame(n=2), expected.iloc[:2])
+    pd.testing.assert_frame_equal(
+        merged.to_frame(n=2), expected.iloc[2:].reset_index(drop=True)
+    )
+    assert merged.to_frame().empty
+
+
+def test_merged_stepper_to_columns_n_paths():
+    stepper = ArrayStepper(
+        model_params=DummyStepperParams(
+            initial_state=np.array([0.0, 10.0]), variable_names=["a", "b"]
+        ),
+        length=5,
+        n_paths=3,
+    )
+
+    columns = MergedStepper([stepper]).to_columns(chunk_size=2)
+
+    assert list(columns) == ["a", "b"]
+    assert columns["a"].shape == (5, 3)
+    np.testing.assert_array_equal(
+        columns["a"], np.repeat(np.arange(1, 6.0)[:, None], 3, axis=1)
+    )
+    np.testing.assert_array_equal(columns["b"], columns["a"] + 10)
+
+
+def test_merged_stepper_to_columns_n_paths_mismatch():
+    # two paths of a scalar state are not the two variables
+    stepper = ArrayStepper(
+        model_params=DummyStepperParams(
+            initial_state=np.array(0.0), variable_names=["a", "b"]
+        ),
+        length=5,
+        n_paths=2,
+    )
+
+    with pytest.raises(ValueError, match="2 paths"):
+        MergedStepper([stepper]).to_columns()
+
+
+def test_sequential_stepper_to_columns_arrays(seed):
+    def ar_stepper(seed, length):
+        return AR1Stepper(
+            model_params=ARModelParams(
+                delta_t=0.1,
+                phi0=0.1,
+                phi1=0.5,
+                epsilon=GaussianNoise(mu=0, std=1, seed=seed),
+                initial_state=np.array([0.0]),
+                variable_names=["v"],
+            ),
+            length=length,
+        )
+
+    expected = np.concatenate(
+        [ar_stepper(seed, 4).take(4)[:, 0], ar_stepper(seed + 1, 3).take(3)[:, 0]]
+    )
+
+    columns = MergedStepper([ar_stepper(seed, 4) + ar_stepper(seed + 1, 3)]).to_columns(
+        chunk_size=3
+    )
+
+    assert list(columns) == ["v"]
+    np.testing.assert_array_equal(columns["v"], expected)
@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eerily.generators.naive import SequenceStepper, SequenceStepperParams
+from eerily.generators.utils.noises import GaussianNoise, MultiGaussianNoise
+from eerily.generators.utils.writers import (
+    CSVWriter,
+    NPZWriter,
+    ParquetWriter,
+    read_npz_chunks,
+)
+from eerily.generators.var import (
+    AR1Stepper,
+    ARModelParams,
+    VAR1ModelParams,
+    VAR1Stepper,
+)
+
+
+def make_stepper(length=10):
+    sequence = SequenceStepper(
+        model_params=SequenceStepperParams(
+            initial_state=[0, 1.0], variable_names=["y", "z"], step_sizes=[1, 0.5]
+        ),
+        length=length,
+    )
+    var = VAR1Stepper(
+        model_params=VAR1ModelParams(
+            delta_t=0.1,
+            phi0=np.array([0.1, 0.1]),
+            phi1=np.array([[0.5, -0.25], [-0.35, 0.65]]),
+            epsilon=MultiGaussianNoise(mu=np.zeros(2), cov=np.eye(2), seed=42),
+            initial_state=np.array([1.0, 0.0]),
+            variable_names=["s1", "s2"],
+        ),
+        length=length,
+    )
+    return sequence & var
+
+
+@pytest.fixture
+def expected():
+    return make_stepper().to_frame()
+
+
+def test_parquet_writer(tmp_path, expected):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "history.parquet"
+
+    rows = ParquetWriter(path, chunk_size=4)(make_stepper())
+
+    assert rows == 10
+    assert pq.ParquetFile(path).metadata.num_row_groups == 3
+    pd.testing.assert_frame_equal(pd.read_parquet(path), expected)
+
+
+def test_csv_writer(tmp_path, expected):
+    path = tmp_path / "history.csv"
+
+    rows = CSVWriter(path, chunk_size=3)(make_stepper(), length=7)
+
+    assert rows == 7
+    pd.testing.assert_frame_equal(pd.read_csv(path), expected.iloc[:7])
+
+
+def test_npz_writer(tmp_path, expected):
+    directory = tmp_path / "history"
+    directory.mkdir()
+    (directory / "part-00009.npz").touch()
+
+    rows = NPZWriter(directory, chunk_size=4, compressed=True)(make_stepper())
+
+    assert rows == 10
+    assert sorted(p.name for p in directory.iterdir()) == [
+        "part-00000.npz",
+        "part-00001.npz",
+        "part-00002.npz",
+    ]
+    chunks = list(read_npz_chunks(directory))
+    assert [len(chunk["y"]) for chunk in chunks] == [4, 4, 2]
+    pd.testing.assert_frame_equal(
+        pd.concat(map(pd.DataFrame, chunks), ignore_index=True), expected
+    )
+
+
+def test_writer_rejects_multidimensional_columns(tmp_path):
+    chunks = [{"x": np.zeros((3, 2))}]
+
+    with pytest.raises(ValueError, match="NPZWriter"):
+        CSVWriter(tmp_path / "history.csv").write_chunks(chunks)
+
+    assert NPZWriter(tmp_path / "history").write_chunks(chunks) == 3
+    np.testing.assert_array_equal(
+        next(read_npz_chunks(tmp_path / "history"))["x"], np.zeros((3, 2))
+    )
+
+
+def ar_stepper(seed, length):
+    return AR1Stepper(
+        model_params=ARModelParams(
+            delta_t=0.1,
+            phi0=0.1,
+            phi1=0.5,
+            epsilon=GaussianNoise(mu=0, std=1, seed=seed),
+            initial_state=np.array([0.0]),
+            variable_names=["v"],
+        ),
+        length=length,
+    )
+
+
+@pytest.mark.parametrize("writer", ["parquet", "csv", "npz"])
+def test_writer_sequential_stepper(tmp_path, seed, writer):
+    expected = pd.DataFrame(
+        {
+            "v": np.concatenate(
+                [
+                    ar_stepper(seed, 5).take(5)[:, 0],
+                    ar_stepper(seed + 1, 4).take(4)[:, 0],
+                ]
+            )
+        }
+    )
+    stepper = ar_stepper(seed, 5) + ar_stepper(seed + 1, 4)
+
+    if writer == "parquet":
+        pytest.importorskip("pyarrow")
+        rows = ParquetWriter(tmp_path / "history.parquet", chunk_size=3)(stepper)
+        history = pd.read_parquet(tmp_path / "history.parquet")
+    elif writer == "csv":
+        rows = CSVWriter(tmp_path / "history.csv", chunk_size=3)(stepper)
+        history = pd.read_csv(tmp_path / "history.csv")
+    else:
+        rows = NPZWriter(tmp_path / "history", chunk_size=3)(stepper)
+        history = pd.concat(
+            map(pd.DataFrame, read_npz_chunks(tmp_path / "history")),
+            ignore_index=True,
+        )
+
+    assert rows == 9
+    pd.testing.assert_frame_equal(history, expected, atol=1e-12)
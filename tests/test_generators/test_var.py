@@ -1,11 +1,19 @@
 import numpy as np
 import pytest
 
+from eerily.generators import var
+from eerily.generators.utils import filters
+from eerily.generators.utils.noises import GaussianNoise, MultiGaussianNoise
 from eerily.generators.var import (
     AR1Stepper,
     ARModelParams,
+    ARpModelParams,
+    ARpStepper,
     VAR1ModelParams,
     VAR1Stepper,
+    VARpModelParams,
+    VARpStepper,
+    stationary_distribution,
 )
 
 
@@ -127,3 +135,360 @@ def test_ar_stepper(ar_stepper, length):
     )
 
     np.testing.assert_allclose(container, container_truth)
+
+
+@pytest.fixture
+def gaussian_ar_params(seed):
+    def model_params(**kwargs):
+        params = dict(
+            delta_t=0.1,
+            phi0=0.2,
+            phi1=0.9,
+            epsilon=GaussianNoise(mu=0, std=1, seed=seed),
+            initial_state=np.array([-1]),
+            variable_names=["v"],
+        )
+        params.update(kwargs)
+        return ARModelParams(**params)
+
+    return model_params
+
+
+@pytest.fixture
+def gaussian_var_params(seed):
+    def model_params(cov=np.eye(2), **kwargs):
+        params = dict(
+            delta_t=0.01,
+            phi0=np.array([0.1, 0.1]),
+            phi1=np.array([[0.5, -0.25], [-0.35, 0.65]]),
+            epsilon=MultiGaussianNoise(mu=np.zeros(2), cov=cov, seed=seed),
+            initial_state=np.array([1, 0]),
+            variable_names=["s1", "s2"],
+        )
+        params.update(kwargs)
+        return VAR1ModelParams(**params)
+
+    return model_params
+
+
+@pytest.fixture
+def gaussian_arp_params(seed):
+    def model_params(**kwargs):
+        params = dict(
+            phi0=0.1,
+            phi=[0.5, -0.2, 0.1],
+            epsilon=GaussianNoise(mu=0, std=1, seed=seed),
+            initial_state=np.array([1.0, 2.0, 3.0]),
+            variable_names=["s"],
+        )
+        params.update(kwargs)
+        return ARpModelParams(**params)
+
+    return model_params
+
+
+@pytest.fixture
+def gaussian_varp_params(seed):
+    def model_params(cov=np.array([[1.0, 0.5], [0.5, 2.0]]), **kwargs):
+        params = dict(
+            phi0=np.array([0.1, -0.1]),
+            phi=[
+                np.array([[0.5, -0.1], [0.2, 0.3]]),
+                np.array([[0.1, 0.0], [-0.2, 0.1]]),
+            ],
+            epsilon=MultiGaussianNoise(mu=np.zeros(2), cov=cov, seed=seed),
+            initial_state=np.array([[1.0, 2.0], [3.0, 4.0]]),
+            variable_names=["s1", "s2"],
+        )
+        params.update(kwargs)
+        return VARpModelParams(**params)
+
+    return model_params
+
+
+def test_var_stepper_take(var_params, length):
+    expected = np.array(
+        [step for step, _ in zip(VAR1Stepper(model_params=var_params), range(length))]
+    )
+
+    stepper = VAR1Stepper(model_params=var_params, length=length)
+    values = np.concatenate([stepper.take(4), [next(stepper)], stepper.take(length)])
+
+    assert values.shape == (length, 2)
+    np.testing.assert_allclose(values, expected)
+
+
+def test_var_stepper_take_gaussian_noise(gaussian_var_params, length):
+    cov = np.array([[1, 0.5], [0.5, 1]])
+    scalar_stepper = VAR1Stepper(model_params=gaussian_var_params(cov=cov))
+    expected = np.array([next(scalar_stepper) for _ in range(length)])
+
+    values = VAR1Stepper(model_params=gaussian_var_params(cov=cov)).take(length)
+
+    np.testing.assert_array_equal(values, expected)
+
+
+def test_ar_stepper_take_without_scipy(monkeypatch, gaussian_ar_params):
+    monkeypatch.setattr(filters, "lfilter", None)
+    # longer than one block of the NumPy kernel
+    n = 300
+
+    scalar_stepper = AR1Stepper(model_params=gaussian_ar_params(), n_paths=3)
+    expected = np.array([next(scalar_stepper) for _ in range(n)])
+
+    values = AR1Stepper(model_params=gaussian_ar_params(), n_paths=3).take(n)
+
+    np.testing.assert_allclose(values, expected, atol=1e-10)
+
+
+@pytest.mark.parametrize("n_paths", [None, 3])
+def test_stepper_take_zero(gaussian_ar_params, gaussian_var_params, n_paths):
+    ar = AR1Stepper(model_params=gaussian_ar_params(), n_paths=n_paths)
+    var1 = VAR1Stepper(model_params=gaussian_var_params(), n_paths=n_paths)
+
+    paths = () if n_paths is None else (n_paths,)
+    assert ar.take(0).shape == (0,) + paths + (1,)
+    assert var1.take(0).shape == (0,) + paths + (2,)
+
+
+def test_ar_stepper_take(gaussian_ar_params, length):
+    scalar_stepper = AR1Stepper(model_params=gaussian_ar_params())
+    expected = np.array([next(scalar_stepper) for _ in range(length)])
+
+    stepper = AR1Stepper(model_params=gaussian_ar_params(), length=length)
+    values = np.concatenate([[next(stepper)], stepper.take(5), stepper.take(5)])
+
+    assert values.shape == (length, 1)
+    np.testing.assert_array_equal(values, expected)
+
+
+def test_var_stepper_no_copy(var_params, length):
+    expected = [step for step, _ in zip(VAR1Stepper(model_params=var_params), range(2))]
+
+    stepper = VAR1Stepper(model_params=var_params, copy_output=False)
+    first = next(stepper)
+
+    with pytest.raises(ValueError):
+        first[0] = 100
+    with pytest.raises(ValueError):
+        first.flags.writeable = True
+
+    np.testing.assert_allclose(stepper.current_state, expected[0])
+    np.testing.assert_allclose(first, expected[0])
+    np.testing.assert_allclose(next(stepper), expected[1])
+    np.testing.assert_allclose(first, expected[0])
+
+
+def test_merged_var_ar_stepper_to_frame(var_params, ar_params, length):
+    expected_var = VAR1Stepper(model_params=var_params, length=length).take(length)
+    expected_ar = AR1Stepper(model_params=ar_params, length=length).take(length)
+
+    merged = VAR1Stepper(model_params=var_params, length=length) & AR1Stepper(
+        model_params=ar_params, length=length
+    )
+    frame = merged.to_frame(chunk_size=3)
+
+    assert list(frame.columns) == ["s1", "s2", "v"]
+    np.testing.assert_allclose(frame[["s1", "s2"]].values, expected_var)
+    np.testing.assert_allclose(frame["v"].values, expected_ar[:, 0])
+
+
+def test_ar_stepper_n_paths(gaussian_ar_params, length):
+    n_paths = 20000
+    model_params = dict(phi0=0.5, phi1=0.8, initial_state=np.array([2.5]))
+
+    scalar_stepper = AR1Stepper(
+        model_params=gaussian_ar_params(**model_params), n_paths=n_paths
+    )
+    expected = np.array([next(scalar_stepper) for _ in range(length)])
+
+    values = AR1Stepper(
+        model_params=gaussian_ar_params(**model_params), n_paths=n_paths
+    ).take(length)
+
+    assert values.shape == (length, n_paths, 1)
+    np.testing.assert_array_equal(values, expected)
+    # stationary distribution: mean 0.5 / (1 - 0.8), variance 1 / (1 - 0.8^2)
+    assert values[-1].mean() == pytest.approx(2.5, abs=0.05)
+    assert values[-1].var() == pytest.approx(1 / (1 - 0.64), rel=0.05)
+
+
+def test_var_stepper_n_paths(var_params, length):
+    single_path = VAR1Stepper(model_params=var_params).take(length)
+
+    stepper = VAR1Stepper(model_params=var_params, n_paths=3)
+    values = np.concatenate([[next(stepper)], stepper.take(length - 1)])
+
+    assert values.shape == (length, 3, 2)
+    for path in range(3):
+        np.testing.assert_allclose(values[:, path], single_path)
+
+
+def test_var_stepper_n_paths_independent_noise(gaussian_var_params, length):
+    stepper = VAR1Stepper(
+        model_params=gaussian_var_params(
+            phi0=np.zeros(2), phi1=np.eye(2) * 0.5, initial_state=np.zeros(2)
+        ),
+        n_paths=5,
+    )
+
+    values = stepper.take(length)
+
+    assert values.shape == (length, 5, 2)
+    assert len(np.unique(values[-1, :, 0])) == 5
+
+
+def test_arp_stepper_ar1(gaussian_ar_params, gaussian_arp_params, length):
+    ar1 = AR1Stepper(model_params=gaussian_ar_params())
+    arp = ARpStepper(
+        model_params=gaussian_arp_params(
+            phi0=0.2, phi=[0.9], initial_state=np.array([-1]), variable_names=["v"]
+        )
+    )
+
+    np.testing.assert_allclose(arp.take(length), ar1.take(length)[:, 0])
+
+
+@pytest.mark.parametrize("n_paths", [None, 3])
+def test_arp_stepper_take(gaussian_arp_params, length, n_paths):
+    scalar_stepper = ARpStepper(model_params=gaussian_arp_params(), n_paths=n_paths)
+    expected = np.array([next(scalar_stepper) for _ in range(length)])
+
+    batch_stepper = ARpStepper(model_params=gaussian_arp_params(), n_paths=n_paths)
+    values = np.concatenate(
+        [batch_stepper.take(4), [next(batch_stepper)], batch_stepper.take(length - 5)]
+    )
+
+    np.testing.assert_allclose(values, expected, atol=1e-12)
+    np.testing.assert_allclose(
+        batch_stepper.current_state, scalar_stepper.current_state, atol=1e-12
+    )
+    assert values.shape == ((length,) if n_paths is None else (length, n_paths))
+
+
+def test_varp_stepper_var1(gaussian_var_params, gaussian_varp_params, length):
+    var1_params = gaussian_var_params(initial_state=np.array([1.0, 0.0]))
+    var1 = VAR1Stepper(model_params=var1_params)
+    varp = VARpStepper(
+        model_params=gaussian_varp_params(
+            cov=np.eye(2),
+            phi0=var1_params.phi0,
+            phi=[var1_params.phi1],
+            initial_state=np.array([[1.0, 0.0]]),
+        )
+    )
+
+    np.testing.assert_allclose(varp.take(length), var1.take(length))
+
+
+def test_varp_stepper_companion(gaussian_varp_params):
+    phi = [np.eye(2) * 0.5, np.eye(2) * 0.2, np.eye(2) * 0.1]
+    stepper = VARpStepper(
+        model_params=gaussian_varp_params(
+            phi0=np.zeros(2), phi=phi, initial_state=np.zeros((3, 2))
+        )
+    )
+
+    companion = stepper.companion
+
+    assert companion.shape == (6, 6)
+    np.testing.assert_array_equal(companion[:2], np.concatenate(phi, axis=1))
+    np.testing.assert_array_equal(companion[2:, :4], np.eye(4))
+    np.testing.assert_array_equal(companion[2:, 4:], np.zeros((4, 2)))
+
+
+@pytest.mark.parametrize("n_paths", [None, 3])
+def test_varp_stepper_take(gaussian_varp_params, length, n_paths):
+    scalar_stepper = VARpStepper(model_params=gaussian_varp_params(), n_paths=n_paths)
+    expected = np.array([next(scalar_stepper) for _ in range(length)])
+
+    batch_stepper = VARpStepper(model_params=gaussian_varp_params(), n_paths=n_paths)
+    values = np.concatenate(
+        [batch_stepper.take(4), [next(batch_stepper)], batch_stepper.take(length - 5)]
+    )
+
+    np.testing.assert_allclose(values, expected, atol=1e-12)
+    np.testing.assert_allclose(
+        batch_stepper.current_state, scalar_stepper.current_state, atol=1e-12
+    )
+    assert values.shape == ((length, 2) if n_paths is None else (length, n_paths, 2))
+
+    # the first step follows the VAR(2) recursion
+    model_params = gaussian_varp_params()
+    first = (
+        model_params.phi0
+        + model_params.phi[0] @ model_params.initial_state[-1]
+        + model_params.phi[1] @ model_params.initial_state[-2]
+        + next(model_params.epsilon)
+    )
+    np.testing.assert_allclose(values[0] if n_paths is None else values[0, 0], first)
+
+
+@pytest.mark.parametrize("use_scipy", [True, False])
+def test_stationary_distribution(monkeypatch, use_scipy):
+    if not use_scipy:
+        monkeypatch.setattr(var, "solve_discrete_lyapunov", None)
+    var._stationary_distribution.cache_clear()
+
+    phi0 = np.array([0.1, -0.2])
+    phi1 = np.array([[0.5, -0.25], [-0.35, 0.65]])
+    noise_cov = np.array([[1.0, 0.3], [0.3, 0.5]])
+
+    mean, cov = stationary_distribution(phi0, phi1, np.zeros(2), noise_cov)
+
+    np.testing.assert_allclose(mean, phi0 + phi1 @ mean)
+    np.testing.assert_allclose(cov, phi1 @ cov @ phi1.T + noise_cov)
+    assert not mean.flags.writeable
+
+
+def test_stationary_distribution_ar1():
+    mean, cov = stationary_distribution(1.0, 0.5, 0.0, 4.0)
+
+    np.testing.assert_allclose(mean, [2.0])
+    np.testing.assert_allclose(cov, [[4.0 / 0.75]])
+
+
+def test_stationary_distribution_not_stationary(gaussian_ar_params):
+    with pytest.raises(ValueError, match="not stationary"):
+        stationary_distribution(np.zeros(2), np.array([[1.0, 0], [0, 0.5]]), 0, 1)
+
+    with pytest.raises(ValueError):
+        AR1Stepper(
+            model_params=gaussian_ar_params(phi0=0, phi1=1.1),
+            stationary=True,
+        )
+
+
+def test_ar_stepper_stationary(gaussian_ar_params, seed):
+    stepper = AR1Stepper(
+        model_params=gaussian_ar_params(
+            phi0=1.0, phi1=0.5, initial_state=np.array([100.0])
+        ),
+        n_paths=20000,
+        stationary=True,
+        seed=seed,
+    )
+
+    assert stepper.current_state.shape == (20000, 1)
+    for values in [stepper.current_state, stepper.take(10)[-1]]:
+        assert values.mean() == pytest.approx(2.0, abs=0.05)
+        assert values.var() == pytest.approx(1 / 0.75, rel=0.05)
+
+
+def test_var_stepper_stationary(gaussian_var_params, seed):
+    phi0 = np.array([0.1, -0.2])
+    phi1 = np.array([[0.5, -0.25], [-0.35, 0.65]])
+    model_params = gaussian_var_params(
+        phi0=phi0, phi1=phi1, initial_state=np.array([10.0, 10.0])
+    )
+    mean, cov = stationary_distribution(phi0, phi1, np.zeros(2), np.eye(2))
+
+    single = VAR1Stepper(model_params=model_params, stationary=True, seed=seed)
+    assert single.current_state.shape == (2,)
+
+    stepper = VAR1Stepper(
+        model_params=model_params, n_paths=20000, stationary=True, seed=seed
+    )
+    np.testing.assert_allclose(stepper.current_state.mean(axis=0), mean, atol=0.05)
+    np.testing.assert_allclose(np.cov(stepper.current_state.T), cov, atol=0.1)
+    np.testing.assert_array_equal(stepper.current_state[0], single.current_state)
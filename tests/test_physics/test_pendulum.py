@@ -1,6 +1,9 @@
 import math
 
-from eerily.physics.pendulum import Pendulum
+import numpy as np
+import pytest
+
+from eerily.physics.pendulum import Pendulum, pendulum_angles
 
 
 def test_pendulum_generate_data():  # type: ignore
@@ -17,3 +20,93 @@ def test_pendulum_generate_data():  # type: ignore
     data = pendulum(num_periods, num_samples_per_period)
 
     assert len(data["t"]) == num_periods * num_samples_per_period
+
+
+def test_pendulum_generate_small_angle():
+    pendulum = Pendulum(length=1.0, gravity=9.81)
+
+    data = pendulum.generate(num_periods=2, num_samples_per_period=10)
+    listed = pendulum(2, 10)
+
+    time_step = pendulum.period / 10
+    expected = [
+        0.1 * math.cos(2 * math.pi * i * time_step / pendulum.period) for i in range(20)
+    ]
+    np.testing.assert_allclose(data["theta"], expected, atol=1e-15)
+    np.testing.assert_allclose(data["t"], [i * time_step for i in range(20)])
+    assert listed["theta"] == data["theta"].tolist()
+    assert isinstance(listed["t"], list)
+
+
+@pytest.mark.parametrize("method", ["rk4", "symplectic"])
+def test_pendulum_integrators_small_angle(method):
+    pendulum = Pendulum(length=2.0)
+
+    data = pendulum.generate(
+        num_periods=3,
+        num_samples_per_period=100,
+        initial_angle=0.01,
+        method=method,
+        substeps=10,
+    )
+    expected = pendulum.generate(
+        num_periods=3, num_samples_per_period=100, initial_angle=0.01
+    )
+
+    # the nonlinear period is longer by a factor of about 1 + theta_0^2 / 16
+    np.testing.assert_allclose(data["theta"], expected["theta"], atol=2e-4 * 0.01)
+
+
+@pytest.mark.parametrize("method", ["rk4", "symplectic"])
+def test_pendulum_integrators_large_angle(method):
+    initial_angle = 2.0
+    pendulum = Pendulum(length=1.0)
+    # the period of the nonlinear pendulum, 4 K(sin(theta_0 / 2)) sqrt(l / g)
+    k = math.sin(initial_angle / 2)
+    a, b = 1.0, math.sqrt(1 - k**2)
+    for _ in range(10):
+        a, b = (a + b) / 2, math.sqrt(a * b)
+    period = 2 * math.pi / a * math.sqrt(pendulum.length / pendulum.gravity)
+
+    theta = pendulum_angles(
+        lengths=pendulum.length,
+        initial_angles=initial_angle,
+        time_step=period / 1000,
+        num_steps=3001,
+        method=method,
+        substeps=4,
+    )
+
+    assert theta[0] == initial_angle
+    assert theta[1000] == pytest.approx(initial_angle, abs=1e-4)
+    assert theta[3000] == pytest.approx(initial_angle, abs=1e-4)
+    assert theta[500] == pytest.approx(-initial_angle, abs=1e-4)
+
+
+def test_pendulum_angles_batch():
+    lengths = np.array([0.5, 1.0, 2.0])
+    initial_angles = np.array([0.1, 1.0, 3.0])
+    time_step = np.array([0.01, 0.02, 0.03])
+
+    for method in ["small_angle", "rk4", "symplectic"]:
+        theta = pendulum_angles(
+            lengths, initial_angles, time_step, num_steps=200, method=method
+        )
+
+        assert theta.shape == (200, 3)
+        for i in range(3):
+            np.testing.assert_allclose(
+                theta[:, i],
+                pendulum_angles(
+                    lengths[i],
+                    initial_angles[i],
+                    time_step[i],
+                    num_steps=200,
+                    method=method,
+                ),
+            )
+
+
+def test_pendulum_angles_invalid_method():
+    with pytest.raises(ValueError):
+        pendulum_angles(1.0, 0.1, 0.01, num_steps=10, method="euler")